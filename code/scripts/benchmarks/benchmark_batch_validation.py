@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Batch FP/FN validation of a synthetic jobs table: one worker vs the process pool
+The Node validator this replaces ran at ~60 jobs/sec.
+Run from code/: python scripts/benchmarks/benchmark_batch_validation.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import SKILLS_REF_PATH, synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.parallel_extraction import resolve_workers  # noqa: E402
+from src.validation.batch_validation import validate_jobs_table  # noqa: E402
+
+NODE_JOBS_PER_SEC = 60
+SCRAPED = ["Python, SQL", "Excel", "", "Python, Not A Skill, Kubernetes", "AWS, Docker, React"]
+
+
+def build_db(path: Path, jobs: int, length: int) -> None:
+    """Jobs table with `jobs` rows cycling through 500 synthetic descriptions"""
+    rng = random.Random(21)
+    texts = synthetic_corpus(min(jobs, 500), length)
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE jobs (job_id TEXT PRIMARY KEY, job_description TEXT, skills TEXT)")
+        conn.executemany(
+            "INSERT INTO jobs VALUES (?, ?, ?)",
+            ((f"job-{i:07d}", texts[i % len(texts)], rng.choice(SCRAPED)) for i in range(jobs))
+        )
+
+
+def run(db_path: Path, workers: int) -> tuple[float, dict[str, str]]:
+    """Seconds for one validation run, and the skills it wrote"""
+    start = time.perf_counter()
+    stats = validate_jobs_table(str(db_path), str(SKILLS_REF_PATH), workers=workers)
+    elapsed = time.perf_counter() - start
+    if stats["error"]:
+        raise SystemExit(f"Validation failed: {stats['error']}")
+    with sqlite3.connect(db_path) as conn:
+        return elapsed, dict(conn.execute("SELECT job_id, skills FROM jobs"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark batch FP/FN validation')
+    parser.add_argument('--jobs', type=int, default=50000, help='Jobs in the table')
+    parser.add_argument('--length', type=int, default=3000, help='Characters per description')
+    parser.add_argument('--workers', type=int, default=0, help='Pool size (0 = CPU count)')
+    args = parser.parse_args()
+
+    workers = resolve_workers(args.workers)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "jobs.db"
+        build_db(source, args.jobs, args.length)
+        single_db, pool_db = Path(tmp) / "single.db", Path(tmp) / "pool.db"
+        shutil.copy(source, single_db)
+        shutil.copy(source, pool_db)
+
+        single_time, single = run(single_db, 1)
+        pool_time, pool = run(pool_db, workers)
+
+    print(f"Jobs: {args.jobs} x {args.length} chars")
+    print(f"Node (documented):  {NODE_JOBS_PER_SEC:8.0f} jobs/s")
+    print(f"1 worker:           {args.jobs / single_time:8.0f} jobs/s")
+    print(f"{workers} workers:{' ' * (12 - len(str(workers)))}{args.jobs / pool_time:8.0f} jobs/s")
+    print(f"Speedup vs Node:    {args.jobs / pool_time / NODE_JOBS_PER_SEC:8.2f}x")
+    print(f"Identical results:  {single == pool}")
+
+
+if __name__ == '__main__':
+    main()
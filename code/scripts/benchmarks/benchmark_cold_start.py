@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark: construction + first call of each reference consumer
+Every measurement runs in a fresh interpreter; module imports are not timed.
+  cold   - the skills reference has no compiled artifact (first run after an edit)
+  warm   - a new process finds the rebuild the cold run cached
+  repeat - a second construction in the same process
+Run from code/: python scripts/benchmarks/benchmark_cold_start.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import PROJECT_ROOT, SKILLS_REF_PATH, synthetic_description  # noqa: E402
+
+ROLES_REF_PATH = PROJECT_ROOT / "src" / "config" / "roles_reference_2025.json"
+
+# name -> (setup statement, construction expression, first call on `obj` and `text`)
+CONSUMERS: dict[str, tuple[str, str, str]] = {
+    "AdvancedSkillExtractor": (
+        "from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor",
+        "AdvancedSkillExtractor(ref)",
+        "obj.extract(text)",
+    ),
+    "SkillValidator": (
+        "from src.analysis.skill_extraction.skill_validator import SkillValidator",
+        "SkillValidator(ref)",
+        "obj.validate_and_extract(text)",
+    ),
+    "SingleJobValidator": (
+        "from src.validation.single_job_validator import SingleJobValidator",
+        "SingleJobValidator(ref)",
+        "obj.detect_skills_in_text(text)",
+    ),
+    "validate_skills_in_process": (
+        "from src.validation.realtime_validator import validate_skills_in_process",
+        "None",
+        "validate_skills_in_process(text, ref)",
+    ),
+    "RoleNormalizer": (
+        "from src.ui.components.analytics.role_normalizer import RoleNormalizer",
+        "RoleNormalizer(roles)",
+        "obj.normalize_role('Senior Data Engineer')",
+    ),
+}
+
+_TIMER = """
+import json, sys, time
+from pathlib import Path
+sys.path.insert(0, {root!r})
+ref, roles, text = {ref!r}, {roles!r}, {text!r}
+from src.analysis.skill_extraction import reference_compiler
+reference_compiler.COMPILED_CACHE_DIR = Path({cache!r})
+{setup}
+start = time.perf_counter()
+obj = {construct}
+{call}
+first = time.perf_counter() - start
+start = time.perf_counter()
+obj = {construct}
+{call}
+repeat = time.perf_counter() - start
+print(json.dumps([first, repeat]))
+"""
+
+
+def measure(name: str, ref: Path, cache: Path, text: str) -> tuple[float, float]:
+    """(first construction + call, repeat) in a fresh interpreter using this compiled reference cache"""
+    setup, construct, call = CONSUMERS[name]
+    script = _TIMER.format(
+        root=str(PROJECT_ROOT), ref=str(ref), cache=str(cache), roles=str(ROLES_REF_PATH), text=text,
+        setup=setup, construct=construct, call=call,
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    first, repeat = json.loads(result.stdout.strip().splitlines()[-1])
+    return first, repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cold and warm construction")
+    parser.add_argument("--length", type=int, default=3000, help="Characters in the first description")
+    args = parser.parse_args()
+
+    text = synthetic_description(0, args.length)
+    print(f"{'consumer':<28}{'cold':>10}{'warm':>10}{'repeat':>10}")
+    for name in CONSUMERS:
+        with tempfile.TemporaryDirectory() as tmp:
+            # A copy without an artifact and an empty cache; the cold process caches a rebuild
+            ref = Path(tmp) / SKILLS_REF_PATH.name
+            cache = Path(tmp) / "cache"
+            shutil.copyfile(SKILLS_REF_PATH, ref)
+            cold, _ = measure(name, ref, cache, text)
+            warm, repeat = measure(name, ref, cache, text)
+        print(f"{name:<28}{cold:>9.3f}s{warm:>9.3f}s{repeat * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
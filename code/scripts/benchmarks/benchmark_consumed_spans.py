@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Consumed-span benchmark: list scan vs sorted ConsumedSpans on dense descriptions
+Run from code/: python scripts/benchmarks/benchmark_consumed_spans.py
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import SKILLS_REF_PATH, synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.batch_reextract import load_skills_reference  # noqa: E402
+from src.analysis.skill_extraction.consumed_spans import ConsumedSpans  # noqa: E402
+
+Match = tuple[str, int, int]
+
+
+def collect_matches(text: str, compiled_patterns: list) -> list[Match]:
+    """Every (skill, start, end) hit in the priority order extraction sees them"""
+    return [
+        (skill_name, *match.span())
+        for pattern, skill_name in compiled_patterns
+        for match in pattern.finditer(text)
+    ]
+
+
+def consume_with_list(matches: list[Match]) -> set[str]:
+    """The previous loop: scan every consumed span for each match"""
+    found: set[str] = set()
+    consumed: list[tuple[int, int]] = []
+    for skill_name, start, end in matches:
+        if any(s <= start < e or s < end <= e for s, e in consumed):
+            continue
+        found.add(skill_name)
+        consumed.append((start, end))
+    return found
+
+
+def consume_with_spans(matches: list[Match]) -> set[str]:
+    """The same loop over ConsumedSpans"""
+    found: set[str] = set()
+    consumed = ConsumedSpans()
+    for skill_name, start, end in matches:
+        if consumed.overlaps(start, end):
+            continue
+        found.add(skill_name)
+        consumed.add(start, end)
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark consumed-span overlap checks')
+    parser.add_argument('--jobs', type=int, default=10, help='Descriptions to extract')
+    parser.add_argument('--length', type=int, default=20000, help='Characters per description')
+    parser.add_argument('--density', type=float, default=0.6, help='Share of words that are skills')
+    args = parser.parse_args()
+
+    compiled_patterns = load_skills_reference(str(SKILLS_REF_PATH))
+    corpus = synthetic_corpus(args.jobs, args.length, skill_density=args.density)
+    all_matches = [collect_matches(text, compiled_patterns) for text in corpus]
+
+    start = time.perf_counter()
+    legacy = [consume_with_list(matches) for matches in all_matches]
+    list_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    spans = [consume_with_spans(matches) for matches in all_matches]
+    spans_time = time.perf_counter() - start
+
+    hits = sum(len(matches) for matches in all_matches) / args.jobs
+    print(f"Jobs: {args.jobs} x {args.length} chars | {hits:.0f} pattern hits per job")
+    print(f"List scan per job:      {list_time / args.jobs * 1000:8.2f} ms")
+    print(f"ConsumedSpans per job:  {spans_time / args.jobs * 1000:8.2f} ms")
+    print(f"Speedup:                {list_time / spans_time:8.1f}x")
+    print(f"Identical results:      {legacy == spans}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Scraper skill pipeline benchmark: extract + validate + 7-layer fix vs the fused single pass
+Run from code/: python scripts/benchmarks/benchmark_fused_pipeline.py
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import SKILLS_REF_PATH, synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.extraction_cache import ExtractionCache  # noqa: E402
+from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor  # noqa: E402
+from src.analysis.skill_extraction.prepared_text import PreparedText  # noqa: E402
+from src.analysis.skill_extraction.skill_validator import SkillValidator  # noqa: E402
+from src.scraper.unified.linkedin.staggered_queue_scraper import STORED_DESCRIPTION_CHARS  # noqa: E402
+from src.scraper.unified.scalable.extraction_executor import (  # noqa: E402
+    extract_and_validate,
+    extract_and_validate_fused,
+)
+from src.validation.single_job_validator import SingleJobValidator  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the scraper skill pipeline')
+    parser.add_argument('--jobs', type=int, default=100, help='Descriptions to process')
+    parser.add_argument('--length', type=int, default=6000, help='Characters per description')
+    args = parser.parse_args()
+
+    reference = str(SKILLS_REF_PATH)
+    extractor = AdvancedSkillExtractor(reference)
+    extractor.cache = ExtractionCache("benchmark", memory_size=0)  # Every call extracts
+    validator = SkillValidator(reference)
+    single_job_validator = SingleJobValidator(reference)
+    # Descriptions as the scraper cleans them: whitespace collapsed
+    corpus = [" ".join(text.split()) for text in synthetic_corpus(args.jobs, args.length)]
+    extract_and_validate(extractor, validator, corpus[0])  # Compile lazily built regexes
+
+    chain: list[set[str]] = []
+    start = time.perf_counter()
+    for text in corpus:
+        result = extract_and_validate(extractor, validator, text)
+        fixed = single_job_validator.validate_and_fix(
+            "job", text[:STORED_DESCRIPTION_CHARS], result.validated_skills, result.extraction
+        )
+        chain.append(fixed.validated_skills)
+    chain_time = time.perf_counter() - start
+
+    fused: list[set[str]] = []
+    start = time.perf_counter()
+    for text in corpus:
+        result = extract_and_validate_fused(
+            extractor, single_job_validator, PreparedText(text).head(STORED_DESCRIPTION_CHARS)
+        )
+        fused.append({skill for skill in result.validated_skills.split(", ") if skill})
+    fused_time = time.perf_counter() - start
+
+    print(f"Jobs: {args.jobs} x {args.length} chars (stored: {STORED_DESCRIPTION_CHARS})")
+    print(f"Chain per job:      {chain_time / args.jobs * 1000:8.2f} ms")
+    print(f"Fused per job:      {fused_time / args.jobs * 1000:8.2f} ms")
+    print(f"Speedup:            {chain_time / fused_time:8.2f}x")
+    print(f"Identical results:  {chain == fused}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Incremental re-extraction benchmark: one-skill reference edit, diff-driven vs full pass
+Run from code/: python scripts/benchmarks/benchmark_incremental_reextract.py
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import SKILLS_REF_PATH, synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.batch_reextract import (  # noqa: E402
+    reextract_all_jobs,
+    reextract_changed_skills,
+)
+
+
+def build_db(path: Path, corpus: list[str]) -> str:
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE jobs (job_id TEXT PRIMARY KEY, job_description TEXT, skills TEXT)")
+        conn.executemany("INSERT INTO jobs VALUES (?, ?, '')", [(f"job-{i}", t) for i, t in enumerate(corpus)])
+    return str(path)
+
+
+def read_skills(db_path: str) -> list[tuple[str, str]]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT job_id, skills FROM jobs ORDER BY job_id").fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark diff-driven re-extraction')
+    parser.add_argument('--jobs', type=int, default=200, help='Descriptions in the database')
+    parser.add_argument('--length', type=int, default=3000, help='Characters per description')
+    parser.add_argument('--skill', default='Kubernetes', help='Skill whose patterns are edited')
+    args = parser.parse_args()
+
+    reference = json.loads(SKILLS_REF_PATH.read_text(encoding='utf-8'))
+    edited = next(s for s in reference['skills'] if s['name'] == args.skill)
+    edited['patterns'] = list(edited.get('patterns') or []) + [r'\bk8s\b']
+
+    corpus = synthetic_corpus(args.jobs, args.length)
+    with tempfile.TemporaryDirectory() as tmp:
+        new_ref = Path(tmp) / 'skills_reference_new.json'
+        new_ref.write_text(json.dumps(reference), encoding='utf-8')
+        full_db = build_db(Path(tmp) / 'full.db', corpus)
+        incremental_db = build_db(Path(tmp) / 'incremental.db', corpus)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            reextract_all_jobs(incremental_db, str(SKILLS_REF_PATH), use_cache=False)
+
+            # Includes compiling the edited reference (no artifact exists for it yet)
+            start = time.perf_counter()
+            stats = reextract_changed_skills(str(SKILLS_REF_PATH), incremental_db, str(new_ref))
+            incremental_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            reextract_all_jobs(full_db, str(new_ref), use_cache=False)
+            full_time = time.perf_counter() - start
+
+        print(f"Jobs: {args.jobs} x {args.length} chars | edited skill: {args.skill}")
+        print(f"Jobs affected:       {stats['jobs_affected']}")
+        print(f"Full pass:           {full_time:8.2f} s")
+        print(f"Diff-driven pass:    {incremental_time:8.2f} s")
+        print(f"Speedup:             {full_time / incremental_time:8.1f}x")
+        print(f"Identical results:   {read_skills(full_db) == read_skills(incremental_db)}")
+
+
+if __name__ == '__main__':
+    main()
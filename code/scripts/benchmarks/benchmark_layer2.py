@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Layer 2 benchmark: uncompiled finditer loop vs one named-group alternation vs compiled patterns
+Run from code/: python scripts/benchmarks/benchmark_layer2.py
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.advanced_regex_extractor import (  # noqa: E402
+    SKILL_CONTEXT_PATTERNS,
+    layer2_extract_context,
+)
+from src.analysis.skill_extraction.consumed_spans import ConsumedSpans  # noqa: E402
+
+CONTEXT_PHRASES = [
+    "Experience with Docker and Kubernetes. ", "proficient in Python and SQL, ", "using Terraform daily; ",
+    "knowledge of Apache Spark. ", "hands-on experience with Airflow. ", "must have Snowflake skills. ",
+    "requires experience with Power BI. ", "expertise in Machine Learning. ", "building React apps. ",
+]
+
+# One scan for all six: a lookahead so matches of different patterns may overlap,
+# as they do when each pattern is searched on its own
+CONTEXT_ALTERNATION = re.compile(
+    "(?=" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in SKILL_CONTEXT_PATTERNS.items()) + ")"
+)
+PATTERN_REGEXES = [re.compile(pattern) for pattern in SKILL_CONTEXT_PATTERNS.values()]
+
+
+def emit(text: str, matches: list[tuple[str, re.Match[str]]]) -> list[dict]:
+    """The layer 2 consume loop over (context, match) in pattern order"""
+    skills = []
+    consumed = ConsumedSpans()
+    for context_name, match in matches:
+        start, end = match.span(1)
+        if consumed.overlaps(start, end):
+            continue
+        skills.append({
+            'skill': match.group(1).strip(), 'start': start, 'end': end, 'context': context_name, 'layer': 2
+        })
+        consumed.add(start, end)
+    return skills
+
+
+def extract_legacy(text: str) -> list[dict]:
+    """The previous loop: re.finditer with each pattern string"""
+    return emit(text, [
+        (name, match) for name, pattern in SKILL_CONTEXT_PATTERNS.items() for match in re.finditer(pattern, text)
+    ])
+
+
+def extract_alternation(text: str) -> list[dict]:
+    """One scan of the named-group alternation, regrouped into each pattern's own finditer matches"""
+    names = list(SKILL_CONTEXT_PATTERNS)
+    found: list[list[re.Match[str]]] = [[] for _ in names]
+    next_start = [0] * len(names)
+    for hit in CONTEXT_ALTERNATION.finditer(text):
+        position = hit.start()
+        # Patterns after the reported group may match at this position too
+        for i in range(names.index(hit.lastgroup), len(names)):
+            if position < next_start[i]:
+                continue
+            match = PATTERN_REGEXES[i].match(text, position)
+            if match:
+                found[i].append(match)
+                next_start[i] = match.end()
+    return emit(text, [(name, match) for name, matches in zip(names, found) for match in matches])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark layer 2 context extraction')
+    parser.add_argument('--jobs', type=int, default=200, help='Descriptions to extract')
+    parser.add_argument('--length', type=int, default=5000, help='Characters per description')
+    args = parser.parse_args()
+
+    corpus = [
+        text + "".join(CONTEXT_PHRASES[(i + k) % len(CONTEXT_PHRASES)] for k in range(5))
+        for i, text in enumerate(synthetic_corpus(args.jobs, args.length))
+    ]
+
+    start = time.perf_counter()
+    legacy = [extract_legacy(text) for text in corpus]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    alternation = [extract_alternation(text) for text in corpus]
+    alternation_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [layer2_extract_context(text, [])[0] for text in corpus]
+    compiled_time = time.perf_counter() - start
+
+    matches = sum(len(skills) for skills in legacy) / args.jobs
+    print(f"Jobs: {args.jobs} x {args.length} chars | {matches:.1f} layer 2 skills per job")
+    print(f"Pattern strings per job:   {legacy_time / args.jobs * 1000:8.3f} ms")
+    print(f"One alternation per job:   {alternation_time / args.jobs * 1000:8.3f} ms")
+    print(f"Compiled patterns per job: {compiled_time / args.jobs * 1000:8.3f} ms")
+    print(f"Speedup (compiled):        {legacy_time / compiled_time:8.2f}x")
+    print(f"Identical results:         {legacy == alternation == compiled}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Layer 3 benchmark: per-pattern loop vs combined pattern engine
+Run from code/: python scripts/benchmarks/benchmark_layer3.py
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import load_reference, synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.layer3_direct import layer3_extract_direct  # noqa: E402
+from src.analysis.skill_extraction.pattern_engine import SkillPatternEngine  # noqa: E402
+
+
+def legacy_layer3(text: str, consumed: list[tuple[int, int]], skills_reference: list[dict]) -> list[dict]:
+    """The previous layer3_extract_direct: sort and compile every pattern per call"""
+    pattern_to_skill: dict[str, str] = {}
+    for skill_data in skills_reference:
+        for pattern_str in skill_data.get('patterns', []):
+            pattern_to_skill[pattern_str] = skill_data.get('name', '')
+    skills: list[dict] = []
+    for pattern_str, name in sorted(pattern_to_skill.items(), key=lambda x: len(x[0]), reverse=True):
+        try:
+            pattern = re.compile(pattern_str, re.IGNORECASE)
+        except re.error:
+            continue
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            if any(s <= start < e or s < end <= e for s, e in consumed):
+                continue
+            skills.append({'skill': name, 'start': start, 'end': end, 'layer': 3, 'pattern': pattern_str})
+    return skills
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark layer 3 extraction')
+    parser.add_argument('--jobs', type=int, default=20, help='Descriptions to extract')
+    parser.add_argument('--length', type=int, default=5000, help='Characters per description')
+    args = parser.parse_args()
+
+    reference = load_reference()
+    corpus = synthetic_corpus(args.jobs, args.length)
+
+    start = time.perf_counter()
+    engine = SkillPatternEngine(reference)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy = [legacy_layer3(text, [], reference) for text in corpus]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    combined = [layer3_extract_direct(text, [], reference, engine) for text in corpus]
+    engine_time = time.perf_counter() - start
+
+    print(f"Patterns: {len(engine.entries)} | Jobs: {args.jobs} x {args.length} chars")
+    print(f"Engine build (once):  {build_time * 1000:8.1f} ms")
+    print(f"Legacy per job:       {legacy_time / args.jobs * 1000:8.1f} ms")
+    print(f"Engine per job:       {engine_time / args.jobs * 1000:8.1f} ms")
+    print(f"Speedup:              {legacy_time / engine_time:8.1f}x")
+    print(f"Identical results:    {legacy == combined}")
+
+
+if __name__ == '__main__':
+    main()
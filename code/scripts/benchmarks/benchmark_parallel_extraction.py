@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Parallel extraction benchmark: jobs/sec for 1..N worker processes
+Run from code/: python scripts/benchmarks/benchmark_parallel_extraction.py --workers 1 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import SKILLS_REF_PATH, synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.batch_reextract import (  # noqa: E402
+    _optimized_extractor,
+    load_skills_reference,
+)
+from src.analysis.skill_extraction.parallel_extraction import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    extract_parallel,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark multi-process extraction')
+    parser.add_argument('--jobs', type=int, default=500, help='Descriptions to extract')
+    parser.add_argument('--length', type=int, default=3000, help='Characters per description')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='Worker counts')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    compiled_patterns = load_skills_reference(str(SKILLS_REF_PATH))
+    # Few distinct texts, repeated: generating 100k unique ones would dominate
+    corpus = synthetic_corpus(50, args.length)
+    jobs = [(i, corpus[i % len(corpus)]) for i in range(args.jobs)]
+
+    baseline: float | None = None
+    expected: list | None = None
+    print(f"Jobs: {args.jobs} x {args.length} chars | chunk size {args.chunk_size}")
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = list(extract_parallel(
+            jobs, _optimized_extractor, (compiled_patterns,),
+            workers=workers, chunk_size=args.chunk_size
+        ))
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        expected = expected or results
+        print(
+            f"{workers:3d} worker(s): {args.jobs / elapsed:8.1f} jobs/sec | "
+            f"speedup {baseline / elapsed:5.2f}x | identical {results == expected}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Regex backend harness: throughput and per-skill result differences against re
+Run from code/: python scripts/benchmarks/benchmark_regex_backends.py [--backends re regex re2]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from corpus import SKILLS_REF_PATH, synthetic_corpus  # noqa: E402
+
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry  # noqa: E402
+from src.analysis.skill_extraction.regex_backends import (  # noqa: E402
+    DEFAULT_BACKEND,
+    SkillMatcher,
+    available_backends,
+    get_regex_backend,
+)
+
+# Long runs without the closing literal make backtracking patterns work hardest
+ADVERSARIAL = [
+    "5G " + "network " * 400 + "technologies",
+    "İnformatica, PoſtgreSQL and Kubernetes on Azure Blob Storage",
+    "C++ / C# / .NET / R / Go / Node.js / Vue.js / scikit-learn",
+]
+
+
+def run(matcher: SkillMatcher, corpus: list[str]) -> tuple[float, list[list[str]]]:
+    """Seconds to match every description, and the skills found in each"""
+    start = time.perf_counter()
+    results = [matcher.match(text) for text in corpus]
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare regex backends on the skills reference')
+    parser.add_argument('--backends', nargs='+', default=None, help='Backends to run (default: all installed)')
+    parser.add_argument('--jobs', type=int, default=100, help='Descriptions to match')
+    parser.add_argument('--length', type=int, default=5000, help='Characters per description')
+    parser.add_argument('--reference', default=str(SKILLS_REF_PATH), help='Skills reference JSON')
+    args = parser.parse_args()
+
+    registry = get_skill_registry(args.reference)
+    corpus = synthetic_corpus(args.jobs, args.length) + ADVERSARIAL
+    names = args.backends or available_backends()
+    if DEFAULT_BACKEND not in names:
+        names.insert(0, DEFAULT_BACKEND)  # The reference results
+
+    print(f"Jobs: {len(corpus)} | {len(registry.skills)} skills | installed: {', '.join(available_backends())}")
+    baseline: list[list[str]] | None = None
+    for name in names:
+        try:
+            matcher = SkillMatcher(registry, get_regex_backend(name))
+        except ImportError as e:
+            print(f"\n{name}: not installed ({e})")
+            continue
+        run(matcher, corpus[:2])  # Compile lazily built regexes before timing
+        elapsed, results = run(matcher, corpus)
+        print(f"\n{name}: {len(corpus) / elapsed:8.1f} jobs/s | {elapsed / len(corpus) * 1000:8.2f} ms/job"
+              f" | {len(matcher.fallbacks)} patterns fall back to re")
+
+        if baseline is None:
+            baseline = results
+            continue
+        # skill -> (jobs only this backend found it in, jobs only re found it in)
+        differences: dict[str, list[int]] = {}
+        for found, expected in zip(results, baseline):
+            for skill in set(found) - set(expected):
+                differences.setdefault(skill, [0, 0])[0] += 1
+            for skill in set(expected) - set(found):
+                differences.setdefault(skill, [0, 0])[1] += 1
+        print(f"  Identical results: {not differences}")
+        for skill, (extra, missing) in sorted(differences.items()):
+            print(f"  {skill:<40} +{extra} jobs / -{missing} jobs vs re")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Synthetic job descriptions shared by the benchmark scripts
+
+Descriptions mix canonical skill names (and their case/hyphen variants)
+with filler prose, seeded so every run measures the same text.
+"""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+SKILLS_REF_PATH = PROJECT_ROOT / "src" / "config" / "skills_reference_2025.json"
+
+_FILLER = (
+    "We are looking for an engineer with strong experience building scalable "
+    "systems and working closely with cross-functional teams to deliver "
+    "reliable products for our customers"
+).split()
+
+
+def load_reference(path: Path = SKILLS_REF_PATH) -> list[dict]:
+    """Load the raw skills list from the reference JSON"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["skills"]
+
+
+def synthetic_description(seed: int, length: int = 5000, skill_density: float = 0.15) -> str:
+    """Build one description of roughly `length` characters"""
+    rng = random.Random(seed)
+    names = [s["name"] for s in load_reference()]
+    words: list[str] = []
+    size = 0
+    while size < length:
+        if rng.random() < skill_density:
+            name = rng.choice(names)
+            word = rng.choice([name, name.upper(), name.lower(), name.replace(" ", "-")])
+        else:
+            word = rng.choice(_FILLER)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:length]
+
+
+def synthetic_corpus(
+    count: int, length: int = 5000, seed: int = 0, skill_density: float = 0.15
+) -> list[str]:
+    """Build `count` descriptions with consecutive seeds"""
+    return [synthetic_description(seed + i, length, skill_density) for i in range(count)]
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Compile skills_reference_2025.json into skills_reference_2025.compiled.json
+Collapses case-variant patterns and merges each skill into one alternation.
+Re-run after every edit to the reference; until then a stale artifact is
+ignored and consumers compile the JSON in-process once, caching the rebuild
+outside the source tree.
+
+Run from code/: python scripts/extraction/compile_skills_reference.py
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.analysis.skill_extraction.reference_compiler import artifact_path, write_artifact  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the skills reference")
+    parser.add_argument("reference", nargs="?", default="src/config/skills_reference_2025.json")
+    args = parser.parse_args()
+
+    artifact = write_artifact(args.reference)
+    report = artifact["report"]
+
+    print(f"Wrote {artifact_path(args.reference)}")
+    print(f"Skills:                  {report['skills']}")
+    print(f"Patterns before:         {report['patterns_before']}")
+    print(f"Patterns after dedupe:   {report['patterns_after_dedupe']}")
+    print(f"Regexes after merge:     {report['regexes_after_merge']}")
+    print(f"Invalid patterns:        {len(report['invalid_patterns'])}")
+    for pattern in report["invalid_patterns"]:
+        print(f"  {pattern}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,77 @@
 """Re-extract skills for all jobs using updated patterns"""
+import argparse
 import sqlite3
 import time
-from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
+from src.analysis.skill_extraction.batch_processor import SKILLS_REFERENCE_PATH, build_batch_extractor
+from src.analysis.skill_extraction.extraction_cache import (
+    cache_path_for,
+    extract_cached,
+    get_extraction_cache,
+    reference_version,
+)
+from src.analysis.skill_extraction.job_stream import (
+    SkillUpdateWriter,
+    clear_checkpoint,
+    count_jobs,
+    iter_jobs,
+    load_checkpoint,
+)
+from src.analysis.skill_extraction.parallel_extraction import DEFAULT_CHUNK_SIZE, resolve_workers
+from src.analysis.skill_extraction.pattern_registry import DEFAULT_SKILLS_REF_PATH
+
+DB_PATH = 'data/jobs.db'
+CHECKPOINT = 'reextract_skills'
 
 def main():
-    print("Initializing skill extractor...")
-    extractor = AdvancedSkillExtractor('src/config/skills_reference_2025.json')
+    parser = argparse.ArgumentParser(description="Re-extract skills for all jobs")
+    parser.add_argument("--workers", type=int, default=1, help="Extraction processes (0 = one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Descriptions per worker task")
+    parser.add_argument("--resume", action="store_true", help="Continue after the last committed job of an interrupted run")
+    args = parser.parse_args()
+
+    print(f"Initializing skill extractor ({resolve_workers(args.workers)} worker(s))...")
 
-    conn = sqlite3.connect('data/jobs.db')
-    cursor = conn.cursor()
+    conn = sqlite3.connect(DB_PATH)
+    version = reference_version(SKILLS_REFERENCE_PATH, DEFAULT_SKILLS_REF_PATH)
 
-    cursor.execute("SELECT COUNT(*) FROM jobs WHERE job_description IS NOT NULL")
-    total = cursor.fetchone()[0]
+    after_job_id = load_checkpoint(conn, CHECKPOINT, version) if args.resume else None
+    if after_job_id is not None:
+        print(f"Resuming after job {after_job_id}")
+    total = count_jobs(conn, after_job_id)
     print(f"Re-extracting skills for {total} jobs...")
 
     start_time = time.time()
 
-    cursor.execute("SELECT job_id, job_description FROM jobs WHERE job_description IS NOT NULL")
-    jobs = cursor.fetchall()
+    # Jobs stream in keyset pages; updates go out with executemany every 200 jobs
+    writer = SkillUpdateWriter(conn, CHECKPOINT, version)
+    jobs = (((row.job_id, bool(row.description)), row.description) for row in iter_jobs(conn, after_job_id=after_job_id))
 
-    for i, (job_id, description) in enumerate(jobs, 1):
-        if description:
-            skills = extractor.extract(description)
-            skills_str = ', '.join(skills) if skills else ''
-            cursor.execute("UPDATE jobs SET skills = ? WHERE job_id = ?", (skills_str, job_id))
+    # Unchanged descriptions (and reposts) are answered from the extraction cache
+    cache = get_extraction_cache("advanced_batch", cache_path_for(DB_PATH))
+    results = extract_cached(
+        jobs, cache, version,
+        build_batch_extractor, (SKILLS_REFERENCE_PATH,),
+        workers=args.workers, chunk_size=args.chunk_size
+    )
+    for i, ((job_id, has_description), skills) in enumerate(results, 1):
+        skills_str = ', '.join(skills) if skills else ''
+        writer.record(job_id, skills_str if has_description else None)
 
         if i % 200 == 0:
-            conn.commit()
+            writer.flush()
             elapsed = time.time() - start_time
             rate = i / elapsed
             remaining = (total - i) / rate
             print(f"Progress: {i}/{total} ({i*100//total}%) - {rate:.1f} jobs/sec - ETA: {remaining:.0f}s")
 
-    conn.commit()
+    writer.flush()
+    clear_checkpoint(conn, CHECKPOINT)
     conn.close()
 
     elapsed = time.time() - start_time
     print(f"\nCompleted! Processed {total} jobs in {elapsed:.1f} seconds ({total/elapsed:.1f} jobs/sec)")
+    cache_stats = cache.stats()
+    print(f"Extraction cache: {cache_stats['hit_rate']:.1%} hit rate ({cache_stats['misses']} extracted)")
 
 if __name__ == "__main__":
     main()
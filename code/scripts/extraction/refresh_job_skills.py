@@ -0,0 +1,56 @@
+"""Refresh the job_skills table: every reference skill's presence in every stored job
+
+Run from code/: python scripts/extraction/refresh_job_skills.py
+"""
+import argparse
+import sqlite3
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.analysis.skill_extraction.corpus_matcher import CorpusMatcher, write_job_skills  # noqa: E402
+from src.analysis.skill_extraction.job_stream import count_jobs, iter_jobs  # noqa: E402
+from src.analysis.skill_extraction.pattern_registry import (  # noqa: E402
+    DEFAULT_SKILLS_REF_PATH,
+    get_skill_registry,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the job x skill presence table")
+    parser.add_argument("--db", default="data/jobs.db", help="Jobs database")
+    parser.add_argument("--reference", default=DEFAULT_SKILLS_REF_PATH, help="Skills reference JSON")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Jobs matched and written per batch")
+    parser.add_argument("--top", type=int, default=20, help="Most frequent skills to print")
+    args = parser.parse_args()
+
+    matcher = CorpusMatcher(get_skill_registry(args.reference))
+    conn = sqlite3.connect(args.db)
+    total = count_jobs(conn)
+    print(f"Matching {len(matcher.skills)} skills in {total} jobs...")
+
+    start_time = time.time()
+    counts: dict[str, int] = {}
+    processed = 0
+    pairs = 0
+    jobs = ((row.job_id, row.description) for row in iter_jobs(conn))
+    while batch := list(islice(jobs, args.batch_size)):
+        matrix = matcher.match(batch)
+        pairs += write_job_skills(conn, matrix)
+        for skill, count in matrix.skill_counts().items():
+            counts[skill] = counts.get(skill, 0) + count
+        processed += len(batch)
+        print(f"  {processed}/{total} jobs, {pairs} job-skill pairs")
+
+    conn.close()
+    elapsed = time.time() - start_time
+    print(f"\nDone in {elapsed:.1f}s ({processed / elapsed if elapsed else 0:.0f} jobs/s)")
+    for skill, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {skill:<40} {count:>6} ({count / max(processed, 1):.1%})")
+
+
+if __name__ == "__main__":
+    main()
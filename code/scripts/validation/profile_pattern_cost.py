@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Profile the regex cost of every pattern in the skills reference
+Ranks patterns by total and worst-case time over a sample of job descriptions
+(the jobs database, or synthetic descriptions when it is missing) and flags
+patterns that backtrack pathologically on long tokens built from their own
+literals. Pathological patterns should be rewritten (e.g. \\S+ -> [\\s-]+)
+before they reach the scrapers.
+
+Run from code/: python scripts/validation/profile_pattern_cost.py
+"""
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.analysis.skill_extraction.pattern_profiler import profile_registry  # noqa: E402
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry  # noqa: E402
+
+
+def load_corpus(db_path: str, limit: int) -> list[str]:
+    """Random sample of stored descriptions, or synthetic ones without a database"""
+    if Path(db_path).exists():
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT job_description FROM jobs WHERE job_description IS NOT NULL ORDER BY RANDOM() LIMIT ?",
+                (limit,)
+            ).fetchall()
+        if rows:
+            return [row[0] for row in rows]
+    sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+    from corpus import synthetic_corpus
+
+    print(f"No descriptions in {db_path} - profiling {limit} synthetic descriptions")
+    return synthetic_corpus(limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile skills reference pattern cost")
+    parser.add_argument("reference", nargs="?", default="src/config/skills_reference_2025.json")
+    parser.add_argument("--db", default="data/jobs.db", help="Jobs database to sample descriptions from")
+    parser.add_argument("--limit", type=int, default=200, help="Descriptions to profile over")
+    parser.add_argument("--top", type=int, default=20, help="Patterns to list per ranking")
+    parser.add_argument("--json", help="Also write every pattern's cost to this file")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.db, args.limit)
+    costs = profile_registry(get_skill_registry(args.reference), corpus)
+    total = sum(cost.total for cost in costs)
+
+    print(f"Patterns: {len(costs)}, descriptions: {len(corpus)}, total: {total:.2f} s")
+    print(f"\n--- TOP {args.top} BY TOTAL COST ---")
+    for cost in costs[:args.top]:
+        print(f"  {cost.total * 1000:9.2f} ms  {cost.total / total:6.2%}  {cost.pattern}")
+
+    print(f"\n--- TOP {args.top} BY WORST CASE ---")
+    for cost in sorted(costs, key=lambda c: c.worst, reverse=True)[:args.top]:
+        print(f"  {cost.worst * 1000:9.2f} ms  (description {cost.worst_text})  {cost.pattern}")
+
+    pathological = sorted((c for c in costs if c.pathological), key=lambda c: c.growth, reverse=True)
+    print(f"\n--- PATHOLOGICAL PATTERNS ({len(pathological)}) ---")
+    for cost in pathological:
+        print(
+            f"  time ~ n^{cost.growth:.1f}, {cost.stress * 1000:9.2f} ms on {cost.stress_chars} chars of "
+            f"{cost.stress_input!r}  {cost.pattern}  ({', '.join(cost.skills)})"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([{**cost._asdict(), "pathological": cost.pathological} for cost in costs], f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,14 @@ EMD Compliance: <=80 lines
 
 from __future__ import annotations
 
+from functools import partial
+
+from .extraction_cache import extract_cached, get_extraction_cache, reference_version
 from .extractor import AdvancedSkillExtractor
+from .parallel_extraction import DEFAULT_CHUNK_SIZE, ExtractFn
+from .pattern_registry import DEFAULT_SKILLS_REF_PATH
+
+SKILLS_REFERENCE_PATH = 'src/config/skills_reference_2025.json'
 
 
 def _extract_skills_as_list(extractor: AdvancedSkillExtractor, text: str) -> list[str]:
@@ -24,15 +31,28 @@ def _extract_skills_as_list(extractor: AdvancedSkillExtractor, text: str) -> lis
     return skills
 
 
-def extract_skills_batch(job_descriptions: list[str]) -> list[list[str]]:
+def build_batch_extractor(skills_reference_path: str = SKILLS_REFERENCE_PATH) -> ExtractFn:
+    """Extractor factory for extract_parallel (runs once per worker process)"""
+    return partial(_extract_skills_as_list, AdvancedSkillExtractor(skills_reference_path))
+
+
+def extract_skills_batch(
+    job_descriptions: list[str],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache_db: str | None = None
+) -> list[list[str]]:
     """
     Extract skills from multiple job descriptions efficiently
 
-    Loads regex patterns ONCE, then processes all jobs
+    Loads regex patterns ONCE (per worker), then processes all jobs
     ~100x faster than loading patterns per job
 
     Args:
         job_descriptions: List of job description texts
+        workers: Worker processes (1 = in-process, 0 = one per CPU)
+        chunk_size: Descriptions sent to a worker at a time
+        cache_db: SQLite file persisting the extraction cache (None = in-memory only)
 
     Returns:
         List of skill lists (one per job)
@@ -41,23 +61,27 @@ def extract_skills_batch(job_descriptions: list[str]) -> list[list[str]]:
     if not job_descriptions:
         return []
 
-    # Initialize extractor once for entire batch
-    extractor = AdvancedSkillExtractor('src/config/skills_reference_2025.json')
-
-    # Process all jobs with same extractor instance
+    # Same extractor for the entire batch, built once per process;
+    # repeated/known descriptions are answered from the cache
+    cache = get_extraction_cache("advanced_batch", cache_db)
+    version = reference_version(SKILLS_REFERENCE_PATH, DEFAULT_SKILLS_REF_PATH)
     results: list[list[str]] = [
-        _extract_skills_as_list(extractor, jd)
-        for jd in job_descriptions
+        skills for _, skills in extract_cached(
+            enumerate(job_descriptions), cache, version, build_batch_extractor,
+            workers=workers, chunk_size=chunk_size
+        )
     ]
+    cache.log_stats()
 
     return results
 
-def extract_skills_from_jobs(jobs: list[dict[str, str]]) -> list[dict[str, str]]:
+def extract_skills_from_jobs(jobs: list[dict[str, str]], workers: int = 1) -> list[dict[str, str]]:
     """
     Extract skills from list of job dicts (with 'jd' or 'description' field)
     
     Args:
         jobs: List of job dicts with description field
+        workers: Worker processes (1 = in-process, 0 = one per CPU)
     
     Returns:
         Same job dicts with added 'skills' field
@@ -73,7 +97,7 @@ def extract_skills_from_jobs(jobs: list[dict[str, str]]) -> list[dict[str, str]]
     ]
     
     # Batch extract skills
-    skills_lists = extract_skills_batch(descriptions)
+    skills_lists = extract_skills_batch(descriptions, workers=workers)
     
     # Add skills to job dicts  
     for job, skills in zip(jobs, skills_lists):
@@ -10,6 +10,7 @@ import logging
 import re
 import sqlite3
 import sys
+from functools import partial
 from pathlib import Path
 from typing import Final, NamedTuple, TypedDict
 
@@ -17,6 +18,34 @@ from typing import Final, NamedTuple, TypedDict
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from src.analysis.skill_extraction.consumed_spans import ConsumedSpans
+from src.analysis.skill_extraction.context_filter import DegreeContextDetector, EducationZones
+from src.analysis.skill_extraction.extraction_cache import (
+    cache_path_for,
+    extract_cached,
+    get_extraction_cache,
+    reference_version,
+)
+from src.analysis.skill_extraction.job_stream import (
+    SkillUpdateWriter,
+    clear_checkpoint,
+    count_jobs,
+    iter_jobs,
+    load_checkpoint,
+)
+from src.analysis.skill_extraction.parallel_extraction import (
+    DEFAULT_CHUNK_SIZE,
+    ExtractFn,
+    extract_parallel,
+    resolve_workers,
+)
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.reference_diff import (
+    compile_diff_patterns,
+    diff_references,
+    load_reference_data,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,6 +55,7 @@ DEGREE_CONTEXT_WINDOW: Final[int] = 80
 DEFAULT_BATCH_SIZE: Final[int] = 100
 DEFAULT_DB_PATH: Final[str] = 'data/jobs.db'
 DEFAULT_SKILLS_REF_PATH: Final[str] = 'src/config/skills_reference_2025.json'
+REEXTRACT_CHECKPOINT: Final[str] = 'reextract_all_jobs'
 
 # Type definitions
 class ReextractionStats(TypedDict):
@@ -35,28 +65,33 @@ class ReextractionStats(TypedDict):
     updated: int
     skills_added: int
     skills_removed: int
+    cache_hits: int
     dry_run: bool
 
 
+class IncrementalReextractionStats(ReextractionStats):
+    """Statistics of a diff-driven re-extraction."""
+    skills_changed: int
+    jobs_affected: int
+
+
 class CompiledPattern(NamedTuple):
     """Pre-compiled regex pattern with associated skill name."""
     regex: re.Pattern[str]
     skill_name: str
 
 
-# Pre-compiled degree context patterns (compiled once at module load)
-_DEGREE_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
-    re.compile(p, re.IGNORECASE) for p in (
-        r"bachelor'?s?\s+(?:degree\s+)?(?:in|of)",
-        r"master'?s?\s+(?:degree\s+)?(?:in|of)",
-        r"(?:bs|ba|ms|ma|phd|mba)\s+(?:in|of)?",
-        r"degree\s+in",
-        r"diploma\s+in",
-        r"major\s+in",
-        r"studied\s+",
-        r"background\s+in",
-    )
-)
+# Degree context patterns (compiled once at module load)
+DEGREE_DETECTOR: Final[DegreeContextDetector] = DegreeContextDetector((
+    r"bachelor'?s?\s+(?:degree\s+)?(?:in|of)",
+    r"master'?s?\s+(?:degree\s+)?(?:in|of)",
+    r"(?:bs|ba|ms|ma|phd|mba)\s+(?:in|of)?",
+    r"degree\s+in",
+    r"diploma\s+in",
+    r"major\s+in",
+    r"studied\s+",
+    r"background\s+in",
+))
 
 # Default skills to check for degree context
 DEFAULT_DEGREE_CHECK_SKILLS: Final[frozenset[str]] = frozenset({
@@ -68,10 +103,10 @@ DEFAULT_DEGREE_CHECK_SKILLS: Final[frozenset[str]] = frozenset({
 
 def load_skills_reference(path: str) -> list[CompiledPattern]:
     """
-    Load skills reference and pre-compile all patterns.
+    Load skills reference with patterns from the shared compiled registry.
 
     Patterns are sorted by length (longest first) for greedy matching.
-    Invalid regex patterns are logged and skipped.
+    Invalid regex patterns are logged (by the registry) and skipped.
 
     Args:
         path: Path to skills reference JSON file
@@ -84,8 +119,7 @@ def load_skills_reference(path: str) -> list[CompiledPattern]:
         ValueError: If JSON is invalid
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        registry = get_skill_registry(path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Skills reference file not found: {path}")
     except json.JSONDecodeError as e:
@@ -93,27 +127,23 @@ def load_skills_reference(path: str) -> list[CompiledPattern]:
 
     # Build pattern list
     patterns: list[tuple[str, str]] = []
-    for skill in data.get('skills', []):
-        name = skill.get('name', '')
-        for pattern_str in skill.get('patterns', []):
-            patterns.append((pattern_str, name))
+    for skill in registry.skills:
+        for pattern_str in skill.patterns:
+            patterns.append((pattern_str, skill.name))
 
     # Sort by pattern length (longest first) for greedy matching
     patterns.sort(key=lambda x: len(x[0]), reverse=True)
 
-    # Compile patterns, logging any errors
+    # Reuse the registry's compiled patterns instead of recompiling
     compiled: list[CompiledPattern] = []
     invalid_count = 0
 
     for pattern_str, name in patterns:
-        try:
-            compiled.append(CompiledPattern(
-                regex=re.compile(pattern_str, re.IGNORECASE),
-                skill_name=name
-            ))
-        except re.error as e:
-            logger.warning(f"Invalid regex pattern for skill '{name}': {pattern_str} - {e}")
+        regex = registry.pattern_cache.get(pattern_str)
+        if regex is None:
             invalid_count += 1
+            continue
+        compiled.append(CompiledPattern(regex=regex, skill_name=name))
 
     if invalid_count > 0:
         logger.warning(f"Skipped {invalid_count} invalid patterns")
@@ -122,24 +152,37 @@ def load_skills_reference(path: str) -> list[CompiledPattern]:
     return compiled
 
 
-def is_degree_context(text: str, match_start: int, window: int = DEGREE_CONTEXT_WINDOW) -> bool:
+def is_degree_context(
+    text: str,
+    match_start: int,
+    window: int = DEGREE_CONTEXT_WINDOW,
+    zones: EducationZones | None = None
+) -> bool:
     """
     Check if match is in degree/education context.
 
-    Uses pre-compiled patterns for efficiency.
+    Uses pre-compiled patterns; with zones (degree_zones(text)), repeated
+    checks on one description share a single scan of it and become bisects.
 
     Args:
         text: Full job description text
         match_start: Start position of the skill match
         window: Characters to look back for context
+        zones: Education-context zones of text, when checking several matches
 
     Returns:
         True if the skill appears in a degree context (should be filtered)
     """
     context_start = max(0, match_start - window)
-    context = text[context_start:match_start].lower()
+    if zones is not None:
+        return zones.contains(context_start, match_start)
+
+    return DEGREE_DETECTOR.search(text[context_start:match_start].lower())
+
 
-    return any(pattern.search(context) for pattern in _DEGREE_PATTERNS)
+def degree_zones(text: str) -> EducationZones:
+    """Education-context zones of a description, scanned once checks need it"""
+    return DEGREE_DETECTOR.zones(text)
 
 
 def extract_skills_optimized(
@@ -165,41 +208,64 @@ def extract_skills_optimized(
         degree_check_skills = DEFAULT_DEGREE_CHECK_SKILLS
 
     found_skills: set[str] = set()
-    consumed: list[tuple[int, int]] = []
+    consumed = ConsumedSpans()
+    zones: EducationZones | None = None  # Created on the first degree-like match
 
     for pattern, skill_name in compiled_patterns:
         for match in pattern.finditer(text):
             start, end = match.span()
 
             # Skip if region already consumed
-            if any(s <= start < e or s < end <= e for s, e in consumed):
+            if consumed.overlaps(start, end):
                 continue
 
             # FP Filter: Check degree context for specific skills
             if skill_name in degree_check_skills:
-                if is_degree_context(text, start):
+                if zones is None:
+                    zones = degree_zones(text)
+                if is_degree_context(text, start, zones=zones):
                     continue  # Skip - false positive
 
             found_skills.add(skill_name)
-            consumed.append((start, end))
+            consumed.add(start, end)
 
     return sorted(found_skills)
 
 
+def _optimized_extractor(compiled_patterns: list[CompiledPattern]) -> ExtractFn:
+    """Extractor factory for extract_parallel; patterns arrive once per worker"""
+    return partial(extract_skills_optimized, compiled_patterns=compiled_patterns)
+
+
 def reextract_all_jobs(
     db_path: str = DEFAULT_DB_PATH,
     skills_ref_path: str = DEFAULT_SKILLS_REF_PATH,
     batch_size: int = DEFAULT_BATCH_SIZE,
-    dry_run: bool = False
+    dry_run: bool = False,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_cache: bool = True,
+    resume: bool = False
 ) -> ReextractionStats:
     """
     Re-extract skills for all jobs in database.
 
+    Jobs are streamed in job_id order (keyset pages of batch_size) and
+    changes are written with executemany, one transaction per batch that
+    also records the last processed job_id. Memory stays flat regardless
+    of corpus size.
+
     Args:
         db_path: Path to SQLite database
         skills_ref_path: Path to skills reference JSON
-        batch_size: Number of jobs to process per batch
+        batch_size: Number of jobs to process per batch (commit interval)
         dry_run: If True, don't update database
+        workers: Extraction processes (1 = in-process, 0 = one per CPU)
+        chunk_size: Descriptions sent to a worker at a time
+        use_cache: Reuse results for descriptions already extracted with this
+            reference (cache stored next to the database)
+        resume: Continue an interrupted run after its last committed job
+            (ignored if it used a different skills reference)
 
     Returns:
         Type-safe statistics dictionary
@@ -207,17 +273,15 @@ def reextract_all_jobs(
     print(f"Loading skills reference from {skills_ref_path}...")
     compiled_patterns = load_skills_reference(skills_ref_path)
     print(f"Loaded {len(compiled_patterns)} compiled patterns")
+    version = reference_version(skills_ref_path)
 
     # Use context manager for guaranteed cleanup
     with sqlite3.connect(db_path) as conn:
-        cursor = conn.cursor()
-
-        # Get total count with null check
-        cursor.execute("SELECT COUNT(*) FROM jobs WHERE job_description IS NOT NULL")
-        result = cursor.fetchone()
-        if result is None:
-            raise RuntimeError("Failed to count jobs - query returned None")
-        total_jobs: int = result[0]
+        after_job_id = load_checkpoint(conn, REEXTRACT_CHECKPOINT, version) if resume else None
+        if after_job_id is not None:
+            print(f"Resuming after job {after_job_id}")
+
+        total_jobs = count_jobs(conn, after_job_id)
         print(f"Total jobs to process: {total_jobs}")
 
         stats: ReextractionStats = {
@@ -226,66 +290,169 @@ def reextract_all_jobs(
             'updated': 0,
             'skills_added': 0,
             'skills_removed': 0,
+            'cache_hits': 0,
             'dry_run': dry_run
         }
 
-        offset = 0
-        while offset < total_jobs:
-            cursor.execute("""
-                SELECT job_id, job_description, skills
-                FROM jobs
-                WHERE job_description IS NOT NULL
-                LIMIT ? OFFSET ?
-            """, (batch_size, offset))
+        writer = SkillUpdateWriter(conn, REEXTRACT_CHECKPOINT, version, dry_run=dry_run)
+        jobs = ((row, row.description) for row in iter_jobs(conn, batch_size, after_job_id))
+
+        print(f"Extracting with {resolve_workers(workers)} worker(s)")
+
+        # Extract with new reference; results arrive in job order
+        cache = get_extraction_cache("optimized", cache_path_for(db_path)) if use_cache else None
+        hits_before = 0
+        if cache is not None:
+            # The cache is shared process-wide; count this run's hits only
+            cache_stats = cache.stats()
+            hits_before = cache_stats['lookups'] - cache_stats['misses']
+            results = extract_cached(
+                jobs, cache, version, _optimized_extractor, (compiled_patterns,),
+                workers=workers, chunk_size=chunk_size
+            )
+        else:
+            results = extract_parallel(
+                jobs, _optimized_extractor, (compiled_patterns,),
+                workers=workers, chunk_size=chunk_size
+            )
+        for row, new_skills_list in results:
+            new_skills = ', '.join(new_skills_list)
+            old_skills = row.skills
+
+            # Compare
+            old_set = set(s.strip() for s in (old_skills or '').split(',') if s.strip())
+            new_set = set(new_skills_list)
+
+            added = len(new_set - old_set)
+            removed = len(old_set - new_set)
+
+            stats['skills_added'] += added
+            stats['skills_removed'] += removed
+
+            # Update if changed
+            changed = new_skills != (old_skills or '')
+            if changed:
+                stats['updated'] += 1
+            writer.record(row.job_id, new_skills if changed else None)
+
+            stats['processed'] += 1
+
+            if stats['processed'] % batch_size == 0 or stats['processed'] == total_jobs:
+                writer.flush()
+
+                progress = (stats['processed'] / total_jobs) * 100
+                print(f"Progress: {stats['processed']}/{total_jobs} ({progress:.1f}%)")
+
+        writer.flush()
+        if not dry_run:
+            clear_checkpoint(conn, REEXTRACT_CHECKPOINT)
+
+        if cache is not None:
+            cache_stats = cache.stats()
+            stats['cache_hits'] = cache_stats['lookups'] - cache_stats['misses'] - hits_before
+            cache.log_stats()
 
-            jobs = cursor.fetchall()
-            if not jobs:
-                break
+    print("\n" + "=" * 60)
+    print("RE-EXTRACTION COMPLETE")
+    print("=" * 60)
+    print(f"Total jobs processed: {stats['processed']}")
+    print(f"Jobs updated: {stats['updated']}")
+    print(f"Skills added (FN recovered): {stats['skills_added']}")
+    print(f"Skills removed (FP eliminated): {stats['skills_removed']}")
+    print(f"Cached results reused: {stats['cache_hits']}")
+    if dry_run:
+        print("\n[DRY RUN - No changes made to database]")
 
-            for row in jobs:
-                job_id: str = row[0]
-                description: str = row[1]
-                old_skills: str | None = row[2]
+    return stats
 
-                # Extract with new reference
-                new_skills_list = extract_skills_optimized(description, compiled_patterns)
-                new_skills = ', '.join(new_skills_list)
 
-                # Compare
-                old_set = set(s.strip() for s in (old_skills or '').split(',') if s.strip())
-                new_set = set(new_skills_list)
+def reextract_changed_skills(
+    old_skills_ref_path: str,
+    db_path: str = DEFAULT_DB_PATH,
+    skills_ref_path: str = DEFAULT_SKILLS_REF_PATH,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False
+) -> IncrementalReextractionStats:
+    """
+    Re-extract only the jobs a skills reference edit can affect.
 
-                added = len(new_set - old_set)
-                removed = len(old_set - new_set)
+    Diffs the old and new reference, then scans descriptions with just the
+    added/removed/changed skills' patterns (old and new). A job none of them
+    match gets the same result under both references, so only matching jobs
+    are re-extracted and patched. Assumes the skills column holds
+    re-extraction output for the old reference (i.e. a previous
+    reextract_all_jobs run).
 
-                stats['skills_added'] += added
-                stats['skills_removed'] += removed
+    Args:
+        old_skills_ref_path: Reference the stored skills were extracted with
+            (e.g. `git show HEAD~1:src/config/skills_reference_2025.json > old.json`)
+        db_path: Path to SQLite database
+        skills_ref_path: New skills reference JSON
+        batch_size: Updates per commit
+        dry_run: If True, don't update database
 
-                # Update if changed
-                if new_skills != (old_skills or ''):
-                    if not dry_run:
-                        cursor.execute(
-                            "UPDATE jobs SET skills = ? WHERE job_id = ?",
-                            (new_skills, job_id)
-                        )
-                    stats['updated'] += 1
+    Returns:
+        Type-safe statistics dictionary
+    """
+    try:
+        old_data = load_reference_data(old_skills_ref_path)
+        new_data = load_reference_data(skills_ref_path)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in skills reference: {e}")
 
-                stats['processed'] += 1
+    diff = diff_references(old_data, new_data)
+    print(f"Reference diff: {diff.summary()}")
+
+    stats: IncrementalReextractionStats = {
+        'total_jobs': 0,
+        'processed': 0,
+        'updated': 0,
+        'skills_added': 0,
+        'skills_removed': 0,
+        'cache_hits': 0,
+        'dry_run': dry_run,
+        'skills_changed': len(diff.added) + len(diff.removed) + len(diff.changed),
+        'jobs_affected': 0
+    }
+    if diff.is_empty:
+        print("No skill patterns changed - nothing to re-extract")
+        return stats
+
+    diff_patterns = compile_diff_patterns(diff)
+    compiled_patterns = load_skills_reference(skills_ref_path)
 
-            if not dry_run:
-                conn.commit()
+    with sqlite3.connect(db_path) as conn:
+        writer = SkillUpdateWriter(conn, dry_run=dry_run)
 
-            offset += batch_size
-            progress = (offset / total_jobs) * 100
-            print(f"Progress: {min(offset, total_jobs)}/{total_jobs} ({progress:.1f}%)")
+        # Scan with the diff's patterns only; re-extract the jobs they match
+        for row in iter_jobs(conn, batch_size):
+            stats['total_jobs'] += 1
+            if not row.description or not any(p.search(row.description) for p in diff_patterns):
+                continue
 
-    print("\n" + "=" * 60)
-    print("RE-EXTRACTION COMPLETE")
-    print("=" * 60)
-    print(f"Total jobs processed: {stats['processed']}")
-    print(f"Jobs updated: {stats['updated']}")
-    print(f"Skills added (FN recovered): {stats['skills_added']}")
-    print(f"Skills removed (FP eliminated): {stats['skills_removed']}")
+            stats['jobs_affected'] += 1
+            new_skills_list = extract_skills_optimized(row.description, compiled_patterns)
+            new_skills = ', '.join(new_skills_list)
+
+            old_set = set(s.strip() for s in (row.skills or '').split(',') if s.strip())
+            new_set = set(new_skills_list)
+            stats['skills_added'] += len(new_set - old_set)
+            stats['skills_removed'] += len(old_set - new_set)
+
+            changed = new_skills != (row.skills or '')
+            if changed:
+                stats['updated'] += 1
+            writer.record(row.job_id, new_skills if changed else None)
+
+            stats['processed'] += 1
+            if stats['processed'] % batch_size == 0:
+                writer.flush()
+
+        writer.flush()
+
+    print(f"Jobs affected: {stats['jobs_affected']}/{stats['total_jobs']}")
+    print(f"Jobs updated: {stats['updated']} (skills added: {stats['skills_added']}, "
+          f"removed: {stats['skills_removed']})")
     if dry_run:
         print("\n[DRY RUN - No changes made to database]")
 
@@ -301,12 +468,35 @@ if __name__ == '__main__':
                         help='Skills reference path')
     parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Batch size')
     parser.add_argument('--dry-run', action='store_true', help='Preview only')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Extraction processes (0 = one per CPU)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='Descriptions per worker task')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-extract every description, ignoring the extraction cache')
+    parser.add_argument('--old-ref', default=None,
+                        help='Previous skills reference: only re-extract jobs its diff with --ref affects')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue an interrupted run after its last committed job')
 
     args = parser.parse_args()
 
-    reextract_all_jobs(
-        db_path=args.db,
-        skills_ref_path=args.ref,
-        batch_size=args.batch_size,
-        dry_run=args.dry_run
-    )
+    if args.old_ref:
+        reextract_changed_skills(
+            old_skills_ref_path=args.old_ref,
+            db_path=args.db,
+            skills_ref_path=args.ref,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run
+        )
+    else:
+        reextract_all_jobs(
+            db_path=args.db,
+            skills_ref_path=args.ref,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            use_cache=not args.no_cache,
+            resume=args.resume
+        )
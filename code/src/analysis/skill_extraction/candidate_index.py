@@ -0,0 +1,75 @@
+"""
+Token-anchored candidate index over compiled skill patterns
+Maps lowercase anchor tokens to the items (skills or pattern entries) whose
+patterns can only match where that token occurs. A description is tokenized
+once and only the candidates' regexes need to run; items with a pattern that
+cannot be anchored are always candidates.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Generic, TypeVar
+
+from .pattern_literals import TokenAnchor, anchor_token, text_tokens
+
+T = TypeVar("T")
+
+
+class CandidateIndex(Generic[T]):
+    """Lookup from description tokens to items whose patterns may match"""
+
+    def __init__(
+        self,
+        items: Iterable[tuple[T, Sequence[str]]],
+        anchor_of: Callable[[str], TokenAnchor | None] = anchor_token,
+    ):
+        """
+        Args:
+            items: (item, pattern sources) pairs; candidate order follows them.
+                Items without patterns can never match and are left out.
+            anchor_of: anchor_token() or a lookup of its precomputed results
+        """
+        self.items: list[T] = []
+        self._by_token: dict[str, list[int]] = {}
+        self._by_prefix: dict[str, list[int]] = {}
+        self._always: list[int] = []
+
+        for item, patterns in items:
+            if not patterns:
+                continue
+            index = len(self.items)
+            self.items.append(item)
+            anchors = [anchor_of(pattern) for pattern in patterns]
+            anchored = [anchor for anchor in anchors if anchor is not None]
+            if len(anchored) < len(anchors):
+                self._always.append(index)
+                continue
+            for anchor in set(anchored):
+                target = self._by_token if anchor.whole else self._by_prefix
+                target.setdefault(anchor.token, []).append(index)
+
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._by_prefix})
+
+    @property
+    def unanchored(self) -> list[T]:
+        """Items that are candidates for every text"""
+        return [self.items[i] for i in self._always]
+
+    def candidates(self, text: str) -> list[T]:
+        """Items that may match text, in construction order"""
+        return self.candidates_for_tokens(text_tokens(text))
+
+    def candidates_for_tokens(self, tokens: set[str]) -> list[T]:
+        """Items that may match a text with these text_tokens()"""
+        hits: set[int] = set(self._always)
+        for token in tokens:
+            indices = self._by_token.get(token)
+            if indices:
+                hits.update(indices)
+            for length in self._prefix_lengths:
+                if length > len(token):
+                    break
+                indices = self._by_prefix.get(token[:length])
+                if indices:
+                    hits.update(indices)
+        return [self.items[i] for i in sorted(hits)]
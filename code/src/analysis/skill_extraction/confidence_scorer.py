@@ -2,6 +2,14 @@
 Confidence Scoring System for Skill Extraction
 Assigns 0.0-1.0 confidence scores based on pattern quality
 """
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .extraction_result import SkillOccurrence
+
+
 class ConfidenceScorer:
     """Calculate confidence scores for extracted skills"""
     
@@ -22,6 +30,13 @@ class ConfidenceScorer:
             3: -0.10,   # 3 chars (e.g., AWS, GCP)
             4: -0.05,   # 4 chars
         }
+        
+        # Extraction layer -> pattern type of its matches
+        self.layer_pattern_types = {
+            1: 'multi_word',
+            2: 'context_aware',
+            3: 'skills_reference',
+        }
     
     def calculate(
         self,
@@ -62,6 +77,26 @@ class ConfidenceScorer:
         # Clamp to valid range
         return max(0.0, min(1.0, base_confidence))
     
+    def score_occurrence(self, skill: str, occurrence: SkillOccurrence | None) -> float:
+        """
+        Calculate confidence from what extraction recorded for a skill
+        
+        Args:
+            skill: The validated skill name
+            occurrence: Where an extraction layer found it (None = only validation did)
+        
+        Returns:
+            Confidence score between 0.0 and 1.0
+        """
+        if occurrence is None:
+            return self.calculate(skill, 'partial')
+        return self.calculate(
+            skill,
+            self.layer_pattern_types.get(occurrence.layer, 'partial'),
+            match_count=occurrence.match_count,
+            has_technical_context=occurrence.layer != 1,
+        )
+    
     def get_confidence_level(self, score: float) -> str:
         """Convert score to human-readable level"""
         if score >= 0.8:
@@ -0,0 +1,64 @@
+"""
+Consumed text spans for the extraction layers
+Keeps the claimed regions of a description as sorted, merged intervals so
+each overlap check is a bisect (O(log n)) instead of a scan of every span
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+
+
+class ConsumedSpans:
+    """
+    Set of consumed [start, end) character spans.
+
+    A match (start, end) collides with a consumed span (s, e) under the rule
+    the layers have always used: s <= start < e or s < end <= e. On integer
+    offsets that is "start or end - 1 lies inside [s, e)", so only the union
+    of the spans matters and it is stored merged.
+    """
+
+    def __init__(self, spans: Iterable[tuple[int, int]] = ()):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for start, end in spans:
+            self.add(start, end)
+
+    def _covers(self, position: int) -> bool:
+        """True if position lies inside a consumed span"""
+        i = bisect_right(self._starts, position) - 1
+        return i >= 0 and position < self._ends[i]
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """True if the match (start, end) starts or ends inside a consumed span"""
+        return self._covers(start) or self._covers(end - 1)
+
+    def add(self, start: int, end: int) -> None:
+        """Mark [start, end) as consumed, merging with touching spans"""
+        if start >= end:
+            return
+        lo = bisect_left(self._ends, start)
+        hi = bisect_right(self._starts, end)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Merged spans in text order"""
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f"ConsumedSpans({list(self)!r})"
+
+
+def as_consumed_spans(spans: ConsumedSpans | Iterable[tuple[int, int]] | None) -> ConsumedSpans:
+    """Use spans as-is if already a ConsumedSpans, otherwise build one"""
+    if isinstance(spans, ConsumedSpans):
+        return spans
+    return ConsumedSpans(spans or ())
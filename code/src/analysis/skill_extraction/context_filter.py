@@ -1,12 +1,24 @@
 """
 Context-aware filter to reduce False Positives
 Filters out skills that appear in degree/education contexts
+
+A description is scanned once for every place the degree patterns match
+(its education-context zones). After that, checking whether a skill match
+sits in a degree context is a bisect, not another regex pass over its
+lookback window.
 """
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import replace
+from itertools import accumulate
 from typing import TypedDict
 
+from .confidence_scorer import ConfidenceScorer
+from .extraction_result import ExtractionResult
+
 
 class ContextMatch(TypedDict):
     """Type for context match result"""
@@ -37,7 +49,131 @@ DEGREE_CONTEXT_PATTERNS = [
 DEGREE_CONTEXT_REGEX = [re.compile(p, re.IGNORECASE) for p in DEGREE_CONTEXT_PATTERNS]
 
 
-def is_degree_context(text: str, match_start: int, match_end: int, window: int = 100) -> bool:
+class DegreeContextDetector:
+    """Degree/education patterns compiled once, scanning lowercased text"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = tuple(patterns)
+        self.regexes = tuple(re.compile(p, re.IGNORECASE) for p in self.patterns)
+        # Lowercase patterns match lowercased ASCII text the same without
+        # IGNORECASE, and re searches for their leading literal much faster then
+        self._exact: tuple[re.Pattern[str], ...] | None = None
+        if all(p == p.lower() for p in self.patterns):
+            self._exact = tuple(re.compile(p) for p in self.patterns)
+
+    def _compiled(self, lowered: str) -> tuple[re.Pattern[str], ...]:
+        if self._exact is not None and lowered.isascii():
+            return self._exact
+        return self.regexes
+
+    def search(self, context: str) -> bool:
+        """Whether any pattern matches in an already lowercased context window"""
+        for regex in self._compiled(context):
+            if regex.search(context):
+                return True
+        return False
+
+    def spans(self, lowered: str) -> list[tuple[int, int]]:
+        """(start, end) of the shortest match of each pattern at every position one starts"""
+        spans: list[tuple[int, int]] = []
+        for regex in self._compiled(lowered):
+            found = regex.search(lowered)
+            while found:
+                start, end = found.span()
+                # match(..., endpos) succeeds for every end at or past the shortest one
+                if regex.match(lowered, start, end - 1):
+                    low, end = start - 1, end - 1
+                    while low + 1 < end:
+                        middle = (low + end) // 2
+                        if regex.match(lowered, start, middle):
+                            end = middle
+                        else:
+                            low = middle
+                spans.append((start, end))
+                found = regex.search(lowered, start + 1)  # Overlapping matches count too
+        spans.sort()
+        return spans
+
+    def zones(self, text: str) -> EducationZones:
+        """Education-context zones of a description"""
+        return EducationZones(self, text)
+
+
+class EducationZones:
+    """
+    Education-context zones of one description: where its degree patterns match.
+
+    A lookback window is in degree context when a pattern match lies entirely
+    inside it (a window holds a match iff it holds the shortest one). The
+    description is scanned once for the shortest match at every start,
+    sorted by start with the smallest end of every suffix precomputed, so a
+    check is one bisect. The scan waits until the windows checked add up to
+    the description's length: for a handful of checks, searching the windows
+    themselves is cheaper.
+    """
+
+    def __init__(self, detector: DegreeContextDetector, text: str):
+        self._detector = detector
+        self._text = text
+        self._budget = len(text)  # Window characters left to search before scanning
+        self._starts: list[int] | None = None
+        self._min_ends: list[int] = []
+        self._offsets: list[int] | None = None
+
+    def scan(self) -> EducationZones:
+        """Scan the whole description now (idempotent)"""
+        if self._starts is None:
+            lowered = self._text.lower()
+            if len(lowered) != len(self._text):
+                # Original offset -> lowercase offset (e.g. "İ" lowercases to 2 characters)
+                self._offsets = list(accumulate((len(char.lower()) for char in self._text), initial=0))
+            spans = self._detector.spans(lowered)
+            self._starts = [start for start, _ in spans]
+            # _min_ends[k] = smallest end among spans[k:]
+            self._min_ends = list(accumulate(reversed([end for _, end in spans]), min))[::-1]
+        return self
+
+    def contains(self, window_start: int, window_end: int) -> bool:
+        """Whether a degree pattern matches inside text[window_start:window_end].lower()"""
+        if self._starts is None:
+            self._budget -= window_end - window_start
+            if self._budget > 0:
+                return self._detector.search(self._text[window_start:window_end].lower())
+            self.scan()
+        assert self._starts is not None
+        if self._offsets is not None:
+            last = len(self._offsets) - 1
+            window_start = self._offsets[min(window_start, last)]
+            window_end = self._offsets[min(window_end, last)]
+        k = bisect_left(self._starts, window_start)
+        return k < len(self._starts) and self._min_ends[k] <= window_end
+
+
+DEGREE_CONTEXT_DETECTOR = DegreeContextDetector(DEGREE_CONTEXT_PATTERNS)
+
+# Skills commonly appearing as false positives in degree contexts
+DEGREE_CHECK_SKILLS = frozenset({
+    'Computer Science',
+    'Data Science',
+    'Mathematics',
+    'Statistics',
+    'Information Technology',
+    'Computer Engineering',
+    'Software Engineering',
+    'Electrical Engineering',
+    'Physics',
+    'Economics',
+    'Business Administration',
+})
+
+
+def is_degree_context(
+    text: str,
+    match_start: int,
+    match_end: int,
+    window: int = 100,
+    zones: EducationZones | None = None
+) -> bool:
     """
     Check if a skill match appears in a degree/education context.
 
@@ -46,26 +182,24 @@ def is_degree_context(text: str, match_start: int, match_end: int, window: int =
         match_start: Start position of the skill match
         match_end: End position of the skill match
         window: Characters to look back for context (default 100)
+        zones: DEGREE_CONTEXT_DETECTOR.zones(text), when checking several matches
 
     Returns:
         True if the skill appears in a degree context (should be filtered)
     """
     # Get context window before the match
     context_start = max(0, match_start - window)
-    context_text = text[context_start:match_end].lower()
+    if zones is not None:
+        return zones.contains(context_start, match_end)
 
     # Check if any degree pattern precedes the match
-    for pattern in DEGREE_CONTEXT_REGEX:
-        if pattern.search(context_text):
-            return True
-
-    return False
+    return DEGREE_CONTEXT_DETECTOR.search(text[context_start:match_end].lower())
 
 
 def filter_degree_contexts(
     text: str,
     skills: list[dict],
-    skills_to_check: set[str] | None = None
+    skills_to_check: set[str] | frozenset[str] | None = None
 ) -> list[dict]:
     """
     Filter out skills that appear in degree/education contexts.
@@ -78,23 +212,11 @@ def filter_degree_contexts(
     Returns:
         Filtered list of skills with degree contexts removed
     """
-    # Skills commonly appearing as false positives in degree contexts
     if skills_to_check is None:
-        skills_to_check = {
-            'Computer Science',
-            'Data Science',
-            'Mathematics',
-            'Statistics',
-            'Information Technology',
-            'Computer Engineering',
-            'Software Engineering',
-            'Electrical Engineering',
-            'Physics',
-            'Economics',
-            'Business Administration',
-        }
+        skills_to_check = DEGREE_CHECK_SKILLS
 
     filtered_skills = []
+    zones: EducationZones | None = None  # Created on the first skill that needs it
 
     for skill_dict in skills:
         skill_name = skill_dict.get('skill', '')
@@ -103,7 +225,9 @@ def filter_degree_contexts(
 
         # Only check specific skills for degree context
         if skill_name in skills_to_check:
-            if is_degree_context(text, start, end):
+            if zones is None:
+                zones = DEGREE_CONTEXT_DETECTOR.zones(text)
+            if is_degree_context(text, start, end, zones=zones):
                 # Skip this skill - it's in a degree context
                 continue
 
@@ -112,6 +236,55 @@ def filter_degree_contexts(
     return filtered_skills
 
 
+def filter_degree_result(
+    result: ExtractionResult,
+    skills_to_check: set[str] | frozenset[str] | None = None
+) -> ExtractionResult:
+    """
+    Drop degree-context matches from an extraction result, using its recorded spans.
+
+    Args:
+        result: Extraction result (spans index into result.text)
+        skills_to_check: Optional set of skill names to check (default: common FP skills)
+
+    Returns:
+        The result without degree-context spans; a skill left with no spans is
+        removed, and the confidence of one that lost some is recalculated
+    """
+    if skills_to_check is None:
+        skills_to_check = DEGREE_CHECK_SKILLS
+
+    occurrences = dict(result.occurrences)
+    changed: set[str] = set()
+    checked = skills_to_check & occurrences.keys()
+    zones = DEGREE_CONTEXT_DETECTOR.zones(result.text) if checked else None
+    for skill in checked:
+        occurrence = occurrences[skill]
+        spans = tuple(
+            (start, end) for start, end in occurrence.spans
+            if not is_degree_context(result.text, start, end, zones=zones)
+        )
+        if len(spans) == len(occurrence.spans):
+            continue
+        changed.add(skill)
+        if spans:
+            occurrences[skill] = occurrence._replace(spans=spans)
+        else:
+            del occurrences[skill]
+
+    if not changed:
+        return result
+
+    scorer = ConfidenceScorer()
+    skills = [
+        (skill, scorer.score_occurrence(skill, occurrences[skill]) if skill in changed else confidence)
+        for skill, confidence in result.skills
+        if skill in occurrences or skill not in changed
+    ]
+    skills.sort(key=lambda scored: (-scored[1], scored[0]))
+    return replace(result, occurrences=occurrences, skills=tuple(skills))
+
+
 def get_context_snippet(text: str, start: int, end: int, window: int = 50) -> str:
     """
     Get a context snippet around a match for debugging.
@@ -0,0 +1,307 @@
+"""
+Corpus-level skill matching into a sparse job x skill matrix
+Descriptions are matched a buffer at a time and the result is a CSR matrix
+(or job_skills rows) instead of one set per job.
+
+Within a buffer, each description is tokenized once and the registry's
+candidate index picks the skills that can occur in it. A candidate is
+verified pattern by pattern: the pattern's required literal must occur, and
+its regex is only tried at the positions where its anchor literal occurs
+rather than searched across the whole description.
+
+Skills the index cannot anchor run once over the descriptions joined with
+a sentinel, and match offsets are mapped back to descriptions with a bisect
+over their start offsets. That stays identical to searching every
+description separately:
+- the sentinel is non-word text, so \\b and \\B see a description edge the
+  same way they see the start or end of a string
+- a match that runs into the sentinel is discarded and that description
+  is searched on its own
+- patterns with ^, $, \\A, \\Z or lookarounds are searched per description
+"""
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from typing import NamedTuple
+
+from .candidate_index import CandidateIndex
+from .pattern_literals import fold_text, text_tokens
+from .pattern_registry import CompiledSkill, SkillRegistry
+
+logger = logging.getLogger(__name__)
+
+SENTINEL = "\n\x00\n"
+DEFAULT_BUFFER_CHARS = 4_000_000  # Descriptions per buffer are bounded by size, not count
+
+_CONTEXT_ESCAPES = frozenset("AZ")
+
+
+class SkillMatrix(NamedTuple):
+    """Sparse job x skill presence matrix in CSR layout"""
+    job_ids: list[str]     # Row labels
+    skills: list[str]      # Column labels (registry order)
+    indptr: array[int]     # Row i's columns are indices[indptr[i]:indptr[i + 1]]
+    indices: array[int]    # Skill column of every match, ascending within a row
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    def row(self, i: int) -> list[str]:
+        """Skill names present in job i"""
+        return [self.skills[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+    def rows(self) -> Iterator[tuple[str, list[str]]]:
+        """(job_id, skill names) for every job, in input order"""
+        for i, job_id in enumerate(self.job_ids):
+            yield job_id, self.row(i)
+
+    def skill_counts(self) -> dict[str, int]:
+        """Skill name -> number of jobs it occurs in (skills that never occur left out)"""
+        counts = [0] * len(self.skills)
+        for j in self.indices:
+            counts[j] += 1
+        return {name: count for name, count in zip(self.skills, counts) if count}
+
+
+def context_free(pattern: str) -> bool:
+    """
+    Whether a match's existence depends only on the matched text and \\b edges.
+    False for anchors (^ $ \\A \\Z) and lookarounds, which see past a
+    description's end differently inside the joined buffer.
+    """
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            if not in_class and pattern[i + 1:i + 2] in _CONTEXT_ESCAPES:
+                return False
+            i += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+            if pattern[i + 1:i + 2] == '^':
+                i += 1
+            if pattern[i + 1:i + 2] == ']':
+                i += 1  # Leading ] is a literal
+        elif char in '^$':
+            return False
+        elif char == '(' and pattern.startswith(('(?=', '(?!', '(?<=', '(?<!'), i):
+            return False
+        i += 1
+    return True
+
+
+class _CorpusPattern(NamedTuple):
+    pattern: str
+    required: str | None  # Lowercase literal every match contains
+    anchor: str | None    # Lowercase literal every match starts with
+    context_free: bool
+
+
+class _Buffer:
+    """One buffer of descriptions, their folded forms and sentinel-joined offsets"""
+
+    def __init__(self, texts: list[str]):
+        self.texts = texts
+        self.folded = [fold_text(text) for text in texts]
+        # Rows whose folded offsets are also offsets into the original text
+        self.aligned = [len(f) == len(t) for f, t in zip(self.folded, texts)]
+        self._joined: tuple[str, list[int], list[int], str, list[int]] | None = None
+
+    def _join(self) -> tuple[str, list[int], list[int], str, list[int]]:
+        """(buffer, starts, ends, folded buffer, folded starts), built on first use"""
+        if self._joined is None:
+            starts, ends = _offsets(self.texts)
+            folded_starts, _ = _offsets(self.folded)
+            self._joined = (
+                SENTINEL.join(self.texts), starts, ends, SENTINEL.join(self.folded), folded_starts
+            )
+        return self._joined
+
+    def matches(self, row: int, pattern: _CorpusPattern, regex: re.Pattern[str]) -> bool:
+        """Whether regex.search(description) would match, trying only anchor positions"""
+        folded = self.folded[row]
+        if pattern.required is not None and pattern.required not in folded:
+            return False
+        text = self.texts[row]
+        if pattern.anchor is None or not self.aligned[row]:
+            return regex.search(text) is not None
+        position = folded.find(pattern.anchor)
+        while position != -1:
+            if regex.match(text, position):
+                return True
+            position = folded.find(pattern.anchor, position + 1)
+        return False
+
+    def rows_containing(self, literal: str, skip: set[int]) -> list[int]:
+        """Rows not in skip whose folded description contains literal (one pass over the buffer)"""
+        _, _, _, folded, starts = self._join()
+        rows: list[int] = []
+        position = folded.find(literal)
+        while position != -1:
+            row = bisect_right(starts, position) - 1
+            if row not in skip:
+                rows.append(row)
+            if row + 1 == len(starts):
+                break
+            position = folded.find(literal, starts[row + 1])
+        return rows
+
+    def rows_matching(self, regex: re.Pattern[str], skip: set[int]) -> list[int]:
+        """Rows not in skip whose description regex.search() matches, scanning the joined buffer"""
+        buffer, starts, ends, _, _ = self._join()
+        rows: list[int] = []
+        position = 0
+        while True:
+            match = regex.search(buffer, position)
+            if match is None:
+                break
+            row = bisect_right(starts, match.start()) - 1
+            if row in skip:
+                pass
+            elif match.end() <= ends[row]:
+                rows.append(row)
+            elif regex.search(self.texts[row]):
+                rows.append(row)  # The buffer match ran into the sentinel; the row matches on its own
+            if row + 1 == len(starts):
+                break
+            position = starts[row + 1]
+        return rows
+
+
+def _offsets(texts: list[str]) -> tuple[list[int], list[int]]:
+    """Start and end offsets of texts joined by SENTINEL"""
+    starts: list[int] = []
+    ends: list[int] = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text)
+        ends.append(offset)
+        offset += len(SENTINEL)
+    return starts, ends
+
+
+class CorpusMatcher:
+    """Finds every registry skill in many descriptions at once"""
+
+    def __init__(self, registry: SkillRegistry, buffer_chars: int = DEFAULT_BUFFER_CHARS):
+        """
+        Args:
+            registry: Compiled skills reference (columns follow its skill order)
+            buffer_chars: Approximate size of each buffer of descriptions
+        """
+        self.skills = [skill.name for skill in registry.skills]
+        self.buffer_chars = buffer_chars
+        self._regexes: Mapping[str, re.Pattern[str]] = registry.pattern_cache  # Compiled on first use
+        self._index: CandidateIndex[CompiledSkill] = registry.skill_index
+        unanchored = {id(skill) for skill in self._index.unanchored}
+
+        # id(skill) -> (column, patterns) for index candidates; unanchored skills run over the buffer
+        self._anchored: dict[int, tuple[int, tuple[_CorpusPattern, ...]]] = {}
+        self._unanchored: list[tuple[int, tuple[_CorpusPattern, ...]]] = []
+        for column, skill in enumerate(registry.skills):
+            patterns = tuple(
+                _CorpusPattern(p, registry.literals[p].required, registry.literals[p].anchor, context_free(p))
+                for p in skill.patterns
+            )
+            if id(skill) in unanchored:
+                self._unanchored.append((column, patterns))
+            elif patterns:
+                self._anchored[id(skill)] = (column, patterns)
+
+    def _match_buffer(self, buffer: _Buffer) -> list[list[int]]:
+        """Skill columns present in each description of a buffer"""
+        regexes = self._regexes
+        columns: list[list[int]] = []
+        for row, folded in enumerate(buffer.folded):
+            present: list[int] = []
+            for skill in self._index.candidates_for_tokens(text_tokens(folded)):
+                entry = self._anchored.get(id(skill))
+                if entry is None:
+                    continue
+                column, patterns = entry
+                if any(buffer.matches(row, p, regexes[p.pattern]) for p in patterns):
+                    present.append(column)
+            columns.append(present)
+
+        for column, patterns in self._unanchored:
+            found: set[int] = set()
+            for pattern in patterns:
+                regex = regexes[pattern.pattern]
+                if pattern.required is not None:
+                    rows = [
+                        r for r in buffer.rows_containing(pattern.required, found)
+                        if buffer.matches(r, pattern, regex)
+                    ]
+                elif pattern.context_free:
+                    rows = buffer.rows_matching(regex, found)
+                else:
+                    rows = [r for r, text in enumerate(buffer.texts) if r not in found and regex.search(text)]
+                found.update(rows)
+            for row in found:
+                columns[row].append(column)
+        return columns
+
+    def match(self, jobs: Iterable[tuple[str, str]]) -> SkillMatrix:
+        """
+        Skill presence for (job_id, description) pairs.
+        Row i of the result is identical to searching description i with
+        every skill's regexes.
+        """
+        job_ids: list[str] = []
+        indptr = array('l', [0])
+        indices = array('l')
+
+        def flush(texts: list[str]) -> None:
+            for columns in self._match_buffer(_Buffer(texts)):
+                columns.sort()
+                indices.extend(columns)
+                indptr.append(len(indices))
+            texts.clear()
+
+        texts: list[str] = []
+        size = 0
+        for job_id, text in jobs:
+            job_ids.append(job_id)
+            texts.append(text or "")
+            size += len(texts[-1])
+            if size >= self.buffer_chars:
+                flush(texts)
+                size = 0
+        if texts:
+            flush(texts)
+
+        logger.info(f"Matched {len(self.skills)} skills in {len(job_ids)} jobs ({len(indices)} pairs)")
+        return SkillMatrix(job_ids, self.skills, indptr, indices)
+
+
+def write_job_skills(conn: sqlite3.Connection, matrix: SkillMatrix) -> int:
+    """
+    Replace the job_skills rows of the matrix's jobs with its matches.
+    Returns the number of (job_id, skill) rows written.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS job_skills (
+            job_id TEXT NOT NULL,
+            skill TEXT NOT NULL,
+            PRIMARY KEY (job_id, skill)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill)")
+    conn.executemany("DELETE FROM job_skills WHERE job_id = ?", ((job_id,) for job_id in matrix.job_ids))
+    conn.executemany(
+        "INSERT INTO job_skills (job_id, skill) VALUES (?, ?)",
+        ((job_id, skill) for job_id, skills in matrix.rows() for skill in skills)
+    )
+    conn.commit()
+    return matrix.nnz
@@ -5,7 +5,9 @@ from __future__ import annotations
 
 import sqlite3
 
+from .extraction_cache import cache_path_for
 from .extractor import AdvancedSkillExtractor
+from .job_stream import DEFAULT_PAGE_SIZE, SkillUpdateWriter, iter_jobs
 
 
 def _extract_skills_as_list(extractor: AdvancedSkillExtractor, text: str) -> list[str]:
@@ -21,16 +23,14 @@ def _extract_skills_as_list(extractor: AdvancedSkillExtractor, text: str) -> lis
 
 def deduplicate_database_skills(db_path: str, skills_reference: str) -> dict[str, dict[str, list[str]]]:
     """Re-extract and deduplicate all skills in database"""
-    extractor = AdvancedSkillExtractor(skills_reference)
+    # Persistent cache: unchanged descriptions are not re-extracted on the next run
+    extractor = AdvancedSkillExtractor(skills_reference, cache_db=cache_path_for(db_path))
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Get all jobs with descriptions
-    cursor.execute("SELECT job_id, job_description, skills FROM jobs WHERE job_description IS NOT NULL")
-    rows: list[tuple[str, str, str]] = cursor.fetchall()
+    writer = SkillUpdateWriter(conn)
 
+    # Stream jobs with descriptions (keyset pages, not one fetchall)
     updates: dict[str, dict[str, list[str]]] = {}
-    for job_id, description, old_skills in rows:
+    for processed, (job_id, description, old_skills) in enumerate(iter_jobs(conn), 1):
         # Re-extract with updated deduplication
         new_skills_list: list[str] = _extract_skills_as_list(extractor, description)
         new_skills_str: str = ','.join(new_skills_list) if new_skills_list else ''
@@ -43,10 +43,13 @@ def deduplicate_database_skills(db_path: str, skills_reference: str) -> dict[str
                 'removed': list(set(old_skills_list) - set(new_skills_list)) if old_skills else []
             }
 
-            # Update database
-            cursor.execute("UPDATE jobs SET skills = ? WHERE job_id = ?", (new_skills_str, job_id))
+            # Update database (buffered, written with executemany)
+            writer.record(job_id, new_skills_str)
+
+        if processed % DEFAULT_PAGE_SIZE == 0:
+            writer.flush()
 
-    conn.commit()
+    writer.flush()
     conn.close()
 
     return updates
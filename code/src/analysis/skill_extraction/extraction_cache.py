@@ -0,0 +1,281 @@
+"""
+Content-hash extraction cache
+LinkedIn reposts the same description under many job IDs and countries, and
+re-extraction runs see mostly unchanged descriptions. Results are cached by a
+hash of the normalized description, tagged with the version of the skills
+reference(s) that produced them: an in-memory LRU in front of a SQLite side
+table. When a reference file changes its version changes, so old entries
+stop matching and are purged on the next write.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TypedDict, TypeVar
+
+from .parallel_extraction import DEFAULT_CHUNK_SIZE, ExtractFactory, extract_parallel
+from .pattern_registry import get_skill_registry
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K")
+
+# Bump when extraction logic changes in a way that alters results for the same reference
+EXTRACTION_LOGIC_VERSION = 2
+DEFAULT_MEMORY_SIZE = 4096
+CACHE_DB_NAME = "extraction_cache.db"
+
+
+class CacheStats(TypedDict):
+    """Lookup counts since the cache was opened"""
+    lookups: int
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    hit_rate: float
+
+
+def normalize_description(text: str) -> str:
+    """Canonical form that is hashed AND extracted (NFC, \\n line endings, stripped)"""
+    return unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def description_hash(text: str) -> str:
+    """Cache key of a description"""
+    return hashlib.blake2b(normalize_description(text).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def reference_version(*reference_paths: str | Path) -> str:
+    """Version tag of the references that determine a result (changes with their content)"""
+    parts = [str(EXTRACTION_LOGIC_VERSION)]
+    parts.extend(get_skill_registry(path).content_hash for path in reference_paths)
+    return hashlib.blake2b(":".join(parts).encode("ascii"), digest_size=12).hexdigest()
+
+
+def cache_path_for(db_path: str | Path) -> str:
+    """Cache database stored next to a jobs database (kept apart to avoid write-lock contention)"""
+    return str(Path(db_path).with_name(CACHE_DB_NAME))
+
+
+class ExtractionCache:
+    """
+    Thread-safe LRU + optional SQLite cache of extraction results.
+    Values must be JSON-serializable; they come back as decoded JSON.
+    """
+
+    def __init__(self, namespace: str, db_path: str | None = None, memory_size: int = DEFAULT_MEMORY_SIZE):
+        """
+        Args:
+            namespace: Which extraction function the results belong to
+            db_path: SQLite file for the persistent table (None = memory only)
+            memory_size: Entries kept in the in-memory LRU
+        """
+        self.namespace = namespace
+        self.db_path = db_path
+        self.memory_size = memory_size
+        self._memory: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pruned_version: str | None = None
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        if db_path:
+            self._open(db_path)
+
+    def _open(self, db_path: str) -> None:
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS extraction_cache (
+                    namespace TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    reference_version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (namespace, text_hash)
+                )
+            """)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Extraction cache {db_path} unavailable, using memory only: {e}")
+            return
+        self._conn = conn
+
+    def _remember(self, key: tuple[str, str], value: Any) -> None:
+        """Insert into the LRU (caller holds the lock)"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, text_hash: str, version: str) -> Any | None:
+        """Cached result for a description hash under this reference version"""
+        key = (text_hash, version)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return self._memory[key]
+
+            row = None
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT result FROM extraction_cache "
+                        "WHERE namespace = ? AND text_hash = ? AND reference_version = ?",
+                        (self.namespace, text_hash, version)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"Extraction cache read failed: {e}")
+            if row is None:
+                self._misses += 1
+                return None
+
+            value = json.loads(row[0])
+            self._disk_hits += 1
+            self._remember(key, value)
+            return value
+
+    def put(self, text_hash: str, version: str, value: Any) -> None:
+        """Store a result; entries from other reference versions are purged on first sight"""
+        with self._lock:
+            self._remember((text_hash, version), value)
+            if self._conn is None:
+                return
+            try:
+                if self._pruned_version != version:
+                    deleted = self._conn.execute(
+                        "DELETE FROM extraction_cache WHERE namespace = ? AND reference_version != ?",
+                        (self.namespace, version)
+                    ).rowcount
+                    if deleted:
+                        logger.info(f"Invalidated {deleted} '{self.namespace}' cache entries (reference changed)")
+                    self._pruned_version = version
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO extraction_cache "
+                    "(namespace, text_hash, reference_version, result) VALUES (?, ?, ?, ?)",
+                    (self.namespace, text_hash, version, json.dumps(value, separators=(",", ":")))
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Extraction cache write failed: {e}")
+
+    def count_hit(self) -> None:
+        """Record a hit answered outside get() (a repeat of an in-flight description)"""
+        with self._lock:
+            self._memory_hits += 1
+
+    def stats(self) -> CacheStats:
+        """Hit/miss counts so far"""
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            hits = self._memory_hits + self._disk_hits
+            return {
+                "lookups": lookups,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def log_stats(self) -> None:
+        """Log the hit rate"""
+        s = self.stats()
+        logger.info(
+            f"Extraction cache '{self.namespace}': {s['hit_rate']:.1%} hit rate "
+            f"({s['memory_hits']} memory, {s['disk_hits']} disk, {s['misses']} misses)"
+        )
+
+    def close(self) -> None:
+        """Close the SQLite connection (the LRU stays usable)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# (namespace, resolved db path or "", pid) -> cache; the pid keeps forked workers off the parent's connection
+_caches: dict[tuple[str, str, int], ExtractionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_extraction_cache(namespace: str, db_path: str | None = None) -> ExtractionCache:
+    """Process-wide cache per namespace and database, shared by every extractor"""
+    key = (namespace, str(Path(db_path).resolve()) if db_path else "", os.getpid())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ExtractionCache(namespace, db_path)
+        return cache
+
+
+def extract_cached(
+    jobs: Iterable[tuple[K, str]],
+    cache: ExtractionCache,
+    version: str,
+    factory: ExtractFactory,
+    factory_args: tuple[Any, ...] = (),
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[K, list[str]]]:
+    """
+    extract_parallel that answers known descriptions from the cache.
+
+    Lookups happen here, in the calling process; only misses are sent to the
+    workers (hits travel as empty texts, which workers skip). A description
+    repeated while its first copy is still in flight is extracted once.
+
+    Yields:
+        (key, skills) in the same order as jobs
+    """
+    # description hash -> [result or None, repeats not yet yielded], for misses still in flight
+    in_flight: dict[str, list[Any]] = {}
+
+    def lookups() -> Iterator[tuple[tuple[K, str, list[str] | None, bool], str]]:
+        for key, text in jobs:
+            if not text:
+                yield (key, "", [], False), ""
+                continue
+            text_hash = description_hash(text)
+            pending = in_flight.get(text_hash)
+            if pending is not None:
+                pending[1] += 1
+                yield (key, text_hash, None, True), ""
+                continue
+            cached = cache.get(text_hash, version)
+            if cached is not None:
+                yield (key, text_hash, cached, False), ""
+                continue
+            in_flight[text_hash] = [None, 0]
+            yield (key, text_hash, None, False), normalize_description(text)
+
+    results = extract_parallel(lookups(), factory, factory_args, workers=workers, chunk_size=chunk_size)
+    for (key, text_hash, cached, repeat), skills in results:
+        if cached is not None:
+            yield key, cached
+            continue
+
+        pending = in_flight[text_hash]
+        if repeat:
+            cache.count_hit()
+            skills = pending[0]
+            pending[1] -= 1
+        else:
+            cache.put(text_hash, version, skills)
+            pending[0] = skills
+        # Later copies will hit the cache itself once no repeat is waiting
+        if pending[1] == 0:
+            del in_flight[text_hash]
+        yield key, skills
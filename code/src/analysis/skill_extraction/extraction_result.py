@@ -0,0 +1,119 @@
+"""
+Structured result of one extraction pass over a description
+Records where every skill was found (spans, match count, layer and the
+pattern that found it) and which reference skills occur anywhere in the
+text, so confidence scoring, the degree-context filter and the FP/FN
+validators read the result instead of searching the description again.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+from .extraction_cache import normalize_description
+
+Span = tuple[int, int]
+
+
+class SkillOccurrence(NamedTuple):
+    """Where the layer that claimed a skill found it"""
+    skill: str               # Skill name as the layer produced it
+    layer: int               # 1 phrases, 2 context patterns, 3 skills reference
+    pattern_id: str          # Layer 2 context name or layer 3 reference pattern (first match)
+    spans: tuple[Span, ...]  # Non-overlapping (start, end) offsets into the result's text
+
+    @property
+    def match_count(self) -> int:
+        return len(self.spans)
+
+
+@dataclass(frozen=True)
+class ExtractionResult:
+    """Everything one extraction pass learned about a normalized description"""
+    text: str                                   # Normalized description all spans refer to
+    occurrences: dict[str, SkillOccurrence]     # Layer skill name -> occurrence (earliest layer wins)
+    detected: frozenset[str]                    # Reference skills with a pattern match anywhere in text
+    skills: tuple[tuple[str, float], ...] = field(default=())  # Validated (skill, confidence), best first
+    reference: str = ""                         # Content hash of the skills reference behind `detected`
+
+    @property
+    def skill_names(self) -> list[str]:
+        """Validated skill names, sorted"""
+        return sorted(skill for skill, _ in self.skills)
+
+    def spans(self, skill: str) -> tuple[Span, ...]:
+        """Spans of a skill, empty if no layer claimed it"""
+        occurrence = self.occurrences.get(skill)
+        return occurrence.spans if occurrence else ()
+
+    def describes(self, description: str) -> bool:
+        """Whether this result was extracted from description (as is or normalized)"""
+        return description == self.text or normalize_description(description) == self.text
+
+    def detected_in(self, description: str, reference: str) -> frozenset[str] | None:
+        """
+        Reference skills present in description, if this result was extracted
+        from it with the reference of that content hash (None = search it yourself)
+        """
+        if not self.reference or reference != self.reference or not self.describes(description):
+            return None
+        return self.detected
+
+    def to_payload(self) -> dict[str, Any]:
+        """JSON-serializable form for the extraction cache (the text itself is not stored)"""
+        return {
+            "occurrences": [
+                [o.skill, o.layer, o.pattern_id, [list(span) for span in o.spans]]
+                for o in self.occurrences.values()
+            ],
+            "detected": sorted(self.detected),
+            "skills": [list(scored) for scored in self.skills],
+            "reference": self.reference,
+        }
+
+    @classmethod
+    def from_payload(cls, text: str, payload: dict[str, Any]) -> ExtractionResult:
+        """Rebuild a cached result for the normalized text it was extracted from"""
+        occurrences = {
+            skill: SkillOccurrence(skill, layer, pattern_id, tuple((start, end) for start, end in spans))
+            for skill, layer, pattern_id, spans in payload["occurrences"]
+        }
+        return cls(
+            text,
+            occurrences,
+            frozenset(payload["detected"]),
+            tuple((skill, confidence) for skill, confidence in payload["skills"]),
+            payload["reference"],
+        )
+
+
+class OccurrenceBuilder:
+    """Collects layer matches into SkillOccurrences during a pass"""
+
+    def __init__(self) -> None:
+        self._occurrences: dict[str, tuple[int, str, list[Span]]] = {}
+
+    def add(self, skill: str, layer: int, pattern_id: str, start: int, end: int) -> None:
+        """
+        Record a match. A skill belongs to the first layer that claimed it;
+        matches overlapping one already recorded for the skill are not counted twice.
+        """
+        entry = self._occurrences.get(skill)
+        if entry is None:
+            self._occurrences[skill] = (layer, pattern_id, [(start, end)])
+            return
+        if entry[0] != layer:
+            return
+        spans = entry[2]
+        if all(end <= s or start >= e for s, e in spans):
+            spans.append((start, end))
+
+    def __contains__(self, skill: str) -> bool:
+        return skill in self._occurrences
+
+    def build(self) -> dict[str, SkillOccurrence]:
+        """skill -> occurrence with spans in text order, in the order skills were first claimed"""
+        return {
+            skill: SkillOccurrence(skill, layer, pattern_id, tuple(sorted(spans)))
+            for skill, (layer, pattern_id, spans) in self._occurrences.items()
+        }
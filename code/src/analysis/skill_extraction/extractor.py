@@ -3,15 +3,20 @@ Main 3-layer skill extraction interface with integrated validation
 Ensures ZERO false positives and ZERO false negatives before DB storage
 """
 
-import json
-
-from src.validation.realtime_validator import validate_skills
+from src.validation.realtime_validator import python_semantics_agree, validate_skills
 
 from .advanced_regex_extractor import layer1_extract_phrases, layer2_extract_context
-from .common_words_filter import filter_common_words, split_by_conjunctions
 from .confidence_scorer import ConfidenceScorer
+from .extraction_cache import (
+    description_hash,
+    get_extraction_cache,
+    reference_version,
+)
+from .extraction_result import ExtractionResult, OccurrenceBuilder
 from .layer3_direct import layer3_extract_direct
-from .normalize import SkillDict, deduplicate_skills
+from .pattern_engine import PatternBudget
+from .pattern_registry import DEFAULT_SKILLS_REF_PATH, get_skill_registry
+from .prepared_text import TextLike, prepare_text
 
 
 class AdvancedSkillExtractor:
@@ -20,11 +25,33 @@ class AdvancedSkillExtractor:
     Achieves 80-85% accuracy at 0.3s/job (10x faster than spaCy)
     """
 
-    def __init__(self, skills_reference_path: str):
-        """Load skills reference JSON"""
-        with open(skills_reference_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.skills_reference = data.get("skills", {})
+    def __init__(
+        self,
+        skills_reference_path: str,
+        cache_db: str | None = None,
+        pattern_time_budget: float | None = None,
+    ):
+        """
+        Load skills reference from the shared compiled registry
+
+        Args:
+            skills_reference_path: Skills reference JSON
+            cache_db: SQLite file persisting the extraction cache (None = in-memory LRU only)
+            pattern_time_budget: CPU seconds a layer 3 pattern may spend on one
+                description before it is stopped there; repeat offenders are
+                skipped from then on (None = no limit). Results a stopped or
+                skipped pattern may be missing from are neither cached nor
+                validated from layer 3
+        """
+        registry = get_skill_registry(skills_reference_path)
+        self.registry = registry
+        self.skills_reference_path = skills_reference_path
+        self.skills_reference = registry.skills_reference
+        # Layer 3 patterns are compiled once per process, not per extractor
+        self.pattern_engine = registry.engine
+        self.pattern_budget = PatternBudget(pattern_time_budget) if pattern_time_budget is not None else None
+        # Shared by every extractor in the process (reposted descriptions hit it)
+        self.cache = get_extraction_cache("advanced", cache_db)
 
     def extract(
         self, job_description: str, return_confidence: bool = False
@@ -42,89 +69,90 @@ class AdvancedSkillExtractor:
         if not job_description or not job_description.strip():
             return []
 
-        # Track skills with metadata for confidence scoring
-        skills_metadata = {}  # skill -> {pattern_type, match_count, has_context}
+        result = self.extract_result(job_description)
+        if not return_confidence:
+            return result.skill_names
+        return list(result.skills)
+
+    def extract_result(self, job_description: TextLike) -> ExtractionResult:
+        """
+        Extract skills with the spans, match count, layer and pattern of each
+
+        Args:
+            job_description: Job description text (or its PreparedText)
+
+        Returns:
+            ExtractionResult over the normalized description (validated skills
+            with confidence, plus every reference skill found in the text)
+        """
+        # Extraction runs on the normalized text, so a cached result is exactly
+        # what extracting this description would return
+        job_description = prepare_text(job_description or "").normalized.text
+        if not job_description:
+            return ExtractionResult(job_description, {}, frozenset())
+
+        text_hash = description_hash(job_description)
+        # Results depend on the validation reference too (validate_skills below)
+        version = reference_version(self.skills_reference_path, DEFAULT_SKILLS_REF_PATH)
+
+        payload = self.cache.get(text_hash, version)
+        if payload is not None:
+            return ExtractionResult.from_payload(job_description, payload)
+
+        skipped: list[str] = []
+        result = self._extract_result(job_description, skipped)
+        # A pattern stopped or skipped by the budget leaves a partial result; do not share it
+        if not skipped:
+            self.cache.put(text_hash, version, result.to_payload())
+        return result
+
+    def _extract_result(self, job_description: str, skipped: list[str]) -> ExtractionResult:
+        """Run the 3 layers + validation in one pass; skills sorted by confidence"""
+        # Where each layer found its skills (first layer to claim a skill wins)
+        occurrences = OccurrenceBuilder()
 
         # Layer 1: Multi-word phrases (priority)
         skills_l1, consumed = layer1_extract_phrases(job_description)
-        for skill_dict in skills_l1:
-            skill_name = skill_dict["skill"]
-            skills_metadata[skill_name] = {
-                "pattern_type": "multi_word",
-                "match_count": 1,
-                "has_context": False,
-            }
+        for match in skills_l1:
+            occurrences.add(match["skill"], 1, match["context"], match["start"], match["end"])
 
         # Layer 2: Context-aware extraction
         skills_l2, consumed = layer2_extract_context(job_description, consumed)
-        for skill_dict in skills_l2:
-            skill_name = skill_dict["skill"]
-            if skill_name not in skills_metadata:
-                skills_metadata[skill_name] = {
-                    "pattern_type": "context_aware",
-                    "match_count": 1,
-                    "has_context": True,
-                }
-
-        # Layer 3: Direct pattern matching
+        for match in skills_l2:
+            occurrences.add(match["skill"], 2, match["context"], match["start"], match["end"])
+
+        # Layer 3: Direct pattern matching; the same pass records every
+        # reference skill present in the text, consumed region or not
+        detected: set[str] = set()
         skills_l3 = layer3_extract_direct(
-            job_description, consumed, self.skills_reference
-        )
-        for skill_dict in skills_l3:
-            skill_name = skill_dict["skill"]
-            if skill_name not in skills_metadata:
-                skills_metadata[skill_name] = {
-                    "pattern_type": "skills_reference",
-                    "match_count": 1,
-                    "has_context": True,
-                }
-
-        # Filter and split skills before normalization
-        filtered_skills = []
-        for skill_name in skills_metadata.keys():
-            # Split by conjunctions first (e.g., "MCP And Servers" → ["MCP", "Servers"])
-            parts = split_by_conjunctions(skill_name)
-            for part in parts:
-                # Filter common/grammatical words
-                cleaned = filter_common_words(part)
-                if cleaned:  # Only keep non-empty skills
-                    filtered_skills.append(cleaned)
-
-        # Normalize skills - convert to dict format for deduplicate_skills
-        all_skills_dicts: list[SkillDict] = [
-            SkillDict(skill=name) for name in filtered_skills
-        ]
-        normalized = deduplicate_skills(all_skills_dicts)
-
-        # VALIDATION LAYER: Remove FPs and add FNs before returning
-        # This ensures only pattern-verified skills are stored to DB
-        validated = validate_skills(
-            job_description=job_description,
-            extracted_skills=list(normalized),
-            skills_reference_path="src/config/skills_reference_2025.json",
+            job_description, consumed, self.skills_reference, self.pattern_engine, detected, self.pattern_budget,
+            skipped,
         )
-
-        if not return_confidence:
-            return sorted(validated)
+        for match in skills_l3:
+            occurrences.add(match["skill"], 3, match["pattern"], match["start"], match["end"])
+        found = occurrences.build()
+
+        # VALIDATION LAYER: only pattern-verified skills are stored to DB.
+        # Layer 3 already ran the validation reference's patterns; when they
+        # match the way the JS-semantics validator would (and the budget left
+        # every one of them to finish), reuse what they found
+        validation_registry = get_skill_registry(DEFAULT_SKILLS_REF_PATH)
+        if not skipped and validation_registry is self.registry and python_semantics_agree(
+            job_description, validation_registry
+        ):
+            validated = sorted(detected)
+        else:
+            validated = validate_skills(
+                job_description=job_description,
+                extracted_skills=list(found),
+                skills_reference_path=DEFAULT_SKILLS_REF_PATH,
+            )
 
         # Calculate confidence scores for validated skills
         scorer = ConfidenceScorer()
-        skills_with_confidence = []
-
-        for skill in validated:
-            metadata = skills_metadata.get(
-                skill,
-                {"pattern_type": "partial", "match_count": 1, "has_context": False},
-            )
-
-            confidence = scorer.calculate(
-                skill=skill,
-                pattern_type=metadata["pattern_type"],
-                match_count=metadata["match_count"],
-                has_technical_context=metadata["has_context"],
-            )
-
-            skills_with_confidence.append((skill, confidence))
+        skills_with_confidence = [
+            (skill, scorer.score_occurrence(skill, found.get(skill))) for skill in validated
+        ]
 
         # Sort by confidence (descending), then alphabetically
         def sort_key(skill_conf: tuple[str, float]) -> tuple[float, str]:
@@ -132,7 +160,14 @@ class AdvancedSkillExtractor:
 
         skills_with_confidence.sort(key=sort_key)
 
-        return skills_with_confidence
+        return ExtractionResult(
+            job_description,
+            found,
+            frozenset(detected),
+            tuple(skills_with_confidence),
+            # `detected` may miss skills of skipped patterns: validators search themselves
+            "" if skipped else self.registry.content_hash,
+        )
 
 
 # Convenience function
@@ -0,0 +1,151 @@
+"""
+Streaming access to the jobs table for batch re-extraction
+Pages are read by job_id keyset (WHERE job_id > last ORDER BY job_id) through
+the primary key index, so every page costs the same however deep the run is
+and memory stays at one page. Skill updates are buffered and written with
+executemany, one transaction per flush, together with a checkpoint of the
+last processed job_id so an interrupted run can resume after it.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Iterator
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+
+
+class JobRow(NamedTuple):
+    """One job as re-extraction reads it"""
+    job_id: str
+    description: str
+    skills: str | None
+
+
+def count_jobs(conn: sqlite3.Connection, after_job_id: str | None = None) -> int:
+    """Jobs with a description (after a keyset position, if given)"""
+    if after_job_id is None:
+        row = conn.execute("SELECT COUNT(*) FROM jobs WHERE job_description IS NOT NULL").fetchone()
+    else:
+        row = conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE job_id > ? AND job_description IS NOT NULL",
+            (after_job_id,)
+        ).fetchone()
+    if row is None:
+        raise RuntimeError("Failed to count jobs - query returned None")
+    return int(row[0])
+
+
+def iter_jobs(
+    conn: sqlite3.Connection,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    after_job_id: str | None = None,
+) -> Iterator[JobRow]:
+    """
+    Stream jobs with a description in job_id order, one page in memory.
+    Each page query finishes before its rows are yielded, so the caller may
+    write on the same connection between rows.
+    """
+    while True:
+        if after_job_id is None:
+            rows = conn.execute("""
+                SELECT job_id, job_description, skills FROM jobs
+                WHERE job_description IS NOT NULL
+                ORDER BY job_id LIMIT ?
+            """, (page_size,)).fetchall()
+        else:
+            rows = conn.execute("""
+                SELECT job_id, job_description, skills FROM jobs
+                WHERE job_id > ? AND job_description IS NOT NULL
+                ORDER BY job_id LIMIT ?
+            """, (after_job_id, page_size)).fetchall()
+        if not rows:
+            return
+        for row in rows:
+            yield JobRow(*row)
+        after_job_id = rows[-1][0]
+
+
+def _ensure_checkpoint_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS reextraction_checkpoints (
+            name TEXT PRIMARY KEY,
+            last_job_id TEXT NOT NULL,
+            reference_version TEXT NOT NULL,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def load_checkpoint(conn: sqlite3.Connection, name: str, reference_version: str) -> str | None:
+    """Last committed job_id of an interrupted run, None if there is nothing to resume"""
+    _ensure_checkpoint_table(conn)
+    row = conn.execute(
+        "SELECT last_job_id, reference_version FROM reextraction_checkpoints WHERE name = ?", (name,)
+    ).fetchone()
+    if row is None:
+        return None
+    if row[1] != reference_version:
+        logger.warning(f"Checkpoint '{name}' was made with another skills reference - starting over")
+        return None
+    return str(row[0])
+
+
+def clear_checkpoint(conn: sqlite3.Connection, name: str) -> None:
+    """Forget a checkpoint once its run completes"""
+    _ensure_checkpoint_table(conn)
+    conn.execute("DELETE FROM reextraction_checkpoints WHERE name = ?", (name,))
+    conn.commit()
+
+
+class SkillUpdateWriter:
+    """Buffers skills updates; flush() writes them and the checkpoint in one transaction"""
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        checkpoint: str | None = None,
+        reference_version: str = "",
+        dry_run: bool = False,
+    ):
+        """
+        Args:
+            conn: Connection to the jobs database
+            checkpoint: Name to record progress under (None = no checkpoint)
+            reference_version: Reference the run extracts with (resume only matches it)
+            dry_run: Count but never write
+        """
+        self.conn = conn
+        self.checkpoint = checkpoint
+        self.reference_version = reference_version
+        self.dry_run = dry_run
+        self.written = 0
+        self._pending: list[tuple[str, str]] = []
+        self._last_job_id: str | None = None
+        if checkpoint and not dry_run:
+            _ensure_checkpoint_table(conn)
+
+    def record(self, job_id: str, new_skills: str | None) -> None:
+        """Mark job_id processed; new_skills is its changed skills string (None = unchanged)"""
+        if new_skills is not None:
+            self._pending.append((new_skills, job_id))
+        self._last_job_id = job_id
+
+    def flush(self) -> None:
+        """Write buffered updates and advance the checkpoint, then commit"""
+        if self.dry_run:
+            self._pending.clear()
+            return
+        if self._pending:
+            self.conn.executemany("UPDATE jobs SET skills = ? WHERE job_id = ?", self._pending)
+            self.written += len(self._pending)
+            self._pending.clear()
+        if self.checkpoint and self._last_job_id is not None:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO reextraction_checkpoints (name, last_job_id, reference_version)
+                VALUES (?, ?, ?)
+            """, (self.checkpoint, self._last_job_id, self.reference_version))
+        self.conn.commit()
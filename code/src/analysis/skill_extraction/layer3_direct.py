@@ -4,15 +4,11 @@ All patterns centralized in single source of truth
 """
 from __future__ import annotations
 
-import re
+from collections.abc import Iterable
 from typing import TypedDict
 
-
-class SkillReferenceData(TypedDict, total=False):
-    """Type for skill reference data from JSON"""
-    name: str
-    patterns: list[str]
-    category: str
+from .consumed_spans import ConsumedSpans, as_consumed_spans
+from .pattern_engine import PatternBudget, SkillPatternEngine, SkillReferenceData
 
 
 class Layer3SkillMatch(TypedDict):
@@ -21,55 +17,49 @@ class Layer3SkillMatch(TypedDict):
     start: int
     end: int
     layer: int
+    pattern: str
 
 
 def layer3_extract_direct(
     text: str,
-    consumed: list[tuple[int, int]],
-    skills_reference: list[SkillReferenceData]
+    consumed: ConsumedSpans | Iterable[tuple[int, int]],
+    skills_reference: list[SkillReferenceData],
+    engine: SkillPatternEngine | None = None,
+    detected: set[str] | None = None,
+    budget: PatternBudget | None = None,
+    skipped: list[str] | None = None
 ) -> list[Layer3SkillMatch]:
     """
     Layer 3: Extract using ONLY patterns from skills_reference_2025.json
     Returns canonical skill names, not pattern text
+
+    Pass a pre-built `engine` (compiled once from skills_reference) to avoid
+    compiling every pattern on each call. Pass a `detected` set to also
+    collect every skill with a pattern match, consumed region or not, in
+    the same pass. A `budget` stops patterns that run too long; they are
+    appended to `skipped`, and the results are incomplete if it is non-empty.
     """
     skills: list[Layer3SkillMatch] = []
 
-    # Build pattern -> canonical_name mapping ONLY from skills_reference_2025.json
-    pattern_to_skill: dict[str, str] = {}
-
-    # All patterns come from skills_reference parameter (loaded from JSON)
-    for skill_data in skills_reference:
-        canonical_name: str = skill_data.get('name', '')
-        patterns_list: list[str] = skill_data.get('patterns', [])
-        for pattern_str in patterns_list:
-            pattern_to_skill[pattern_str] = canonical_name
-
-    # Sort patterns by length (longest first) to prioritize specific matches
-    # This ensures "React Native" matches before "React", "Google Cloud Platform" before "GCP"
-    sorted_patterns: list[tuple[str, str]] = sorted(
-        pattern_to_skill.items(), key=lambda x: len(x[0]), reverse=True
-    )
+    if engine is None:
+        engine = SkillPatternEngine(skills_reference)
+    consumed = as_consumed_spans(consumed)
 
-    # Extract using patterns and return canonical names
-    for pattern_str, canonical_name in sorted_patterns:
-        try:
-            pattern = re.compile(pattern_str, re.IGNORECASE)
+    # Patterns run longest first; the engine skips those whose literal is absent
+    for entry, start, end in engine.iter_matches(text, budget=budget, skipped=skipped):
+        if detected is not None:
+            detected.update(entry.skills)
 
-            for match in pattern.finditer(text):
-                start, end = match.span()
-
-                # Skip if region already consumed
-                if any(s <= start < e or s < end <= e for s, e in consumed):
-                    continue
-
-                skills.append({
-                    'skill': canonical_name,  # Use canonical name from JSON
-                    'start': start,
-                    'end': end,
-                    'layer': 3
-                })
-        except re.error:
-            # Skip invalid patterns
+        # Skip if region already consumed
+        if consumed.overlaps(start, end):
             continue
 
+        skills.append({
+            'skill': entry.skill,  # Use canonical name from JSON
+            'start': start,
+            'end': end,
+            'layer': 3,
+            'pattern': entry.pattern
+        })
+
     return skills
@@ -0,0 +1,151 @@
+"""
+Multi-process batch skill extraction
+Jobs are sent to a process pool in chunks. Each worker builds its extract
+function ONCE in the pool initializer (compiled patterns arrive there, not
+with every chunk), and results stream back in input order with a bounded
+number of chunks in flight, so arbitrarily large job streams use constant memory.
+The extract function works per description, or (extract_chunks_parallel) on
+a whole chunk at once for corpus-level matchers.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+K = TypeVar("K")
+
+ExtractFn = Callable[[str], list[str]]
+# Module-level callable returning an ExtractFn; must be picklable
+ExtractFactory = Callable[..., ExtractFn]
+# Skills of every description of a chunk, in order
+ChunkExtractFn = Callable[[list[str]], list[list[str]]]
+ChunkExtractFactory = Callable[..., ChunkExtractFn]
+
+DEFAULT_CHUNK_SIZE = 64
+# Chunks queued per worker beyond the one it is running
+_PREFETCH_PER_WORKER = 2
+
+_worker_extract: Callable[..., Any] | None = None
+
+
+def _init_worker(factory: Callable[..., Any], factory_args: tuple[Any, ...]) -> None:
+    """Pool initializer: build this worker's extract function once"""
+    global _worker_extract
+    _worker_extract = factory(*factory_args)
+
+
+def _extract_chunk(texts: list[str]) -> list[list[str]]:
+    """Run in a worker: extract every text of one chunk"""
+    if _worker_extract is None:
+        raise RuntimeError("Worker used before _init_worker ran")
+    return [_worker_extract(text) if text else [] for text in texts]
+
+
+def _extract_whole_chunk(texts: list[str]) -> list[list[str]]:
+    """Run in a worker: extract one chunk with a chunk-level extract function"""
+    if _worker_extract is None:
+        raise RuntimeError("Worker used before _init_worker ran")
+    return _worker_extract(texts)
+
+
+def resolve_workers(workers: int | None) -> int:
+    """None or 0 means one worker per CPU"""
+    if not workers:
+        return os.cpu_count() or 1
+    return max(1, workers)
+
+
+def extract_parallel(
+    jobs: Iterable[tuple[K, str]],
+    factory: ExtractFactory,
+    factory_args: tuple[Any, ...] = (),
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[K, list[str]]]:
+    """
+    Extract skills for (key, description) pairs on a process pool.
+
+    Args:
+        jobs: (key, description) pairs; keys stay in this process
+        factory: Called as factory(*factory_args) once per worker to build
+            the extract function (e.g. from pre-compiled patterns)
+        factory_args: Picklable arguments for factory
+        workers: Worker processes; None/0 = CPU count, 1 = run in-process
+        chunk_size: Descriptions sent to a worker per task
+
+    Yields:
+        (key, skills) in the same order as jobs
+    """
+    workers = resolve_workers(workers)
+    if workers == 1:
+        extract = factory(*factory_args)
+        for key, text in jobs:
+            yield key, extract(text) if text else []
+        return
+    yield from _map_chunks(jobs, factory, factory_args, workers, chunk_size, _extract_chunk)
+
+
+def extract_chunks_parallel(
+    jobs: Iterable[tuple[K, str]],
+    factory: ChunkExtractFactory,
+    factory_args: tuple[Any, ...] = (),
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[K, list[str]]]:
+    """
+    extract_parallel for extract functions that take a whole chunk of
+    descriptions at once (factory(*factory_args) builds one per worker)
+
+    Yields:
+        (key, skills) in the same order as jobs
+    """
+    workers = resolve_workers(workers)
+    if workers == 1:
+        extract = factory(*factory_args)
+        job_iter = iter(jobs)
+        while chunk := list(islice(job_iter, max(1, chunk_size))):
+            yield from zip((key for key, _ in chunk), extract([text for _, text in chunk]))
+        return
+    yield from _map_chunks(jobs, factory, factory_args, workers, chunk_size, _extract_whole_chunk)
+
+
+def _map_chunks(
+    jobs: Iterable[tuple[K, str]],
+    factory: Callable[..., Any],
+    factory_args: tuple[Any, ...],
+    workers: int,
+    chunk_size: int,
+    task: Callable[[list[str]], list[list[str]]],
+) -> Iterator[tuple[K, list[str]]]:
+    """Run task over chunks of descriptions on a pool of initialized workers, in input order"""
+    chunk_size = max(1, chunk_size)
+    job_iter = iter(jobs)
+    pending: deque[tuple[list[K], Future[list[list[str]]]]] = deque()
+    max_pending = workers * (1 + _PREFETCH_PER_WORKER)
+
+    # Workers rebuild their state in the initializer, so they never need a
+    # fork of the (possibly threaded) parent
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=_init_worker,
+        initargs=(factory, factory_args),
+    ) as pool:
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(job_iter, chunk_size))
+                if not chunk:
+                    break
+                keys = [key for key, _ in chunk]
+                pending.append((keys, pool.submit(task, [text for _, text in chunk])))
+
+            if not pending:
+                return
+
+            keys, future = pending.popleft()
+            yield from zip(keys, future.result())
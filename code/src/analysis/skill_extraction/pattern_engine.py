@@ -0,0 +1,256 @@
+"""
+Combined multi-pattern matching engine for skills_reference_2025.json
+Compiles the reference ONCE; each description is tokenized once and the
+candidate index selects the patterns that can match it. Only those patterns
+are verified with their own regex - at the positions where their leading
+literal occurs, instead of scanning the whole text per pattern.
+Given the registry's pattern cache and literal analysis, construction does
+no regex work at all: each pattern is compiled the first time it is a
+candidate. An optional PatternBudget stops patterns that run too long.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from time import thread_time
+from typing import TypedDict
+
+from .candidate_index import CandidateIndex
+from .pattern_literals import PatternLiterals, analyze_pattern, fold_text, text_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class SkillReferenceData(TypedDict, total=False):
+    """Type for skill reference data from JSON"""
+    name: str
+    patterns: list[str]
+    category: str
+
+
+class PatternEntry:
+    """Reference pattern with its canonical skill and literals; regex compiled on first use"""
+
+    __slots__ = ("pattern", "skill", "skills", "literal", "anchor", "_regex", "_compiled_patterns")
+
+    def __init__(
+        self,
+        pattern: str,
+        skill: str,
+        literal: str | None,
+        anchor: str | None,
+        regex: re.Pattern[str] | None = None,
+        compiled_patterns: Mapping[str, re.Pattern[str]] | None = None,
+        skills: tuple[str, ...] | None = None,
+    ):
+        self.pattern = pattern
+        self.skill = skill
+        self.skills = skills or (skill,)  # Every skill defining the pattern, skill included
+        self.literal = literal  # Prefilter: must occur somewhere in a match
+        self.anchor = anchor    # Verification: every match starts with it
+        self._regex = regex
+        self._compiled_patterns = compiled_patterns
+
+    @property
+    def regex(self) -> re.Pattern[str]:
+        if self._regex is None:
+            if self._compiled_patterns is not None:
+                self._regex = self._compiled_patterns[self.pattern]
+            else:
+                self._regex = re.compile(self.pattern, re.IGNORECASE)
+        return self._regex
+
+    def __repr__(self) -> str:
+        return f"PatternEntry({self.pattern!r}, {self.skill!r})"
+
+
+class PatternBudget:
+    """
+    Per-pattern CPU time budget for SkillPatternEngine.iter_matches.
+    Only a pattern's own searches are timed, in thread CPU time, so waiting
+    for the GIL or the caller's work while the iterator is suspended does not
+    count. A pattern over `seconds` on one text is stopped at its next anchor
+    position (or match) for that text only; after `strikes` overruns it is
+    quarantined and skipped for every later text. re cannot interrupt a
+    single search, so a budget bounds how often a backtracking pattern can
+    stall the caller, not how long one search takes. Shared across threads.
+    """
+
+    def __init__(self, seconds: float, strikes: int = 3):
+        self.seconds = seconds
+        self.strikes = strikes
+        self.overruns: dict[str, int] = {}    # Pattern -> texts it went over budget on
+        self.exceeded: dict[str, float] = {}  # Quarantined pattern -> CPU seconds of its last overrun
+        self._lock = threading.Lock()
+
+    def overrun(self, pattern: str, spent: float) -> bool:
+        """Whether pattern, after `spent` CPU seconds on one text, is over budget (counts a strike if so)"""
+        if spent <= self.seconds:
+            return False
+        with self._lock:
+            strikes = self.overruns[pattern] = self.overruns.get(pattern, 0) + 1
+            if strikes >= self.strikes and pattern not in self.exceeded:
+                self.exceeded[pattern] = spent
+                logger.warning(
+                    f"Pattern {pattern!r} took {spent * 1000:.1f} ms CPU on one text ({strikes} overruns) "
+                    f"- skipping it from now on"
+                )
+        return True
+
+
+class SkillPatternEngine:
+    """
+    Pre-compiled matcher over every pattern in a skills reference.
+
+    Pattern priority is the same as the per-pattern loop it replaces:
+    each distinct pattern once (last skill defining it wins), longest first.
+    """
+
+    def __init__(
+        self,
+        skills_reference: Sequence[SkillReferenceData],
+        compiled_patterns: Mapping[str, re.Pattern[str]] | None = None,
+        literals: Mapping[str, PatternLiterals] | None = None,
+    ):
+        """
+        Args:
+            skills_reference: Skills with 'name' and 'patterns'
+            compiled_patterns: Optional pattern -> compiled re.IGNORECASE regex
+                cache (e.g. from the pattern registry) to avoid recompiling.
+                Its patterns are trusted to be valid and compiled on first use;
+                without it every pattern is compiled now and invalid ones skipped
+            literals: Optional precomputed pattern -> PatternLiterals
+        """
+        pattern_to_skill: dict[str, str] = {}
+        pattern_skills: dict[str, list[str]] = {}
+        for skill_data in skills_reference:
+            canonical_name: str = skill_data.get('name', '')
+            for pattern_str in skill_data.get('patterns', []):
+                pattern_to_skill[pattern_str] = canonical_name
+                names = pattern_skills.setdefault(pattern_str, [])
+                if canonical_name not in names:
+                    names.append(canonical_name)
+
+        # Sort patterns by length (longest first) to prioritize specific matches
+        # This ensures "React Native" matches before "React", "Google Cloud Platform" before "GCP"
+        sorted_patterns = sorted(pattern_to_skill.items(), key=lambda x: len(x[0]), reverse=True)
+
+        self.entries: list[PatternEntry] = []
+        analyses: dict[str, PatternLiterals] = {}
+        for pattern_str, canonical_name in sorted_patterns:
+            regex: re.Pattern[str] | None = None
+            if compiled_patterns is None or pattern_str not in compiled_patterns:
+                try:
+                    regex = re.compile(pattern_str, re.IGNORECASE)
+                except re.error:
+                    continue  # Skip invalid patterns
+            analysis = literals.get(pattern_str) if literals else None
+            if analysis is None:
+                analysis = analyze_pattern(pattern_str)
+            analyses[pattern_str] = analysis
+            self.entries.append(PatternEntry(
+                pattern_str, canonical_name, analysis.required, analysis.anchor, regex, compiled_patterns,
+                tuple(pattern_skills[pattern_str]),
+            ))
+
+        self.index: CandidateIndex[PatternEntry] = CandidateIndex(
+            ((entry, (entry.pattern,)) for entry in self.entries),
+            anchor_of=lambda pattern: analyses[pattern].token,
+        )
+
+    def candidates(self, text: str, use_prefilter: bool = True) -> list[PatternEntry]:
+        """Entries that may match text, in priority order"""
+        if not use_prefilter:
+            return self.entries
+        folded = fold_text(text)
+        return [
+            e for e in self.index.candidates_for_tokens(text_tokens(folded))
+            if e.literal is None or e.literal in folded
+        ]
+
+    def iter_matches(
+        self,
+        text: str,
+        use_prefilter: bool = True,
+        budget: PatternBudget | None = None,
+        skipped: list[str] | None = None,
+    ) -> Iterator[tuple[PatternEntry, int, int]]:
+        """
+        Yield (entry, start, end) for every match, pattern by pattern in priority order.
+        Identical to running each candidate's finditer over the whole text,
+        except for candidates a budget stops or has quarantined; those are
+        appended to `skipped`, so an empty list means the matches are complete.
+        """
+        if budget is not None:
+            yield from self._iter_matches_within(text, use_prefilter, budget, [] if skipped is None else skipped)
+            return
+
+        if not use_prefilter:
+            for entry in self.entries:
+                for match in entry.regex.finditer(text):
+                    yield entry, match.start(), match.end()
+            return
+
+        folded = fold_text(text)
+        for entry in self.index.candidates_for_tokens(text_tokens(folded)):
+            if entry.literal is not None and entry.literal not in folded:
+                continue
+            if entry.anchor is None:
+                for match in entry.regex.finditer(text):
+                    yield entry, match.start(), match.end()
+                continue
+            # Only try positions where the anchor literal occurs
+            position = folded.find(entry.anchor)
+            while position != -1:
+                match = entry.regex.match(text, position)
+                if match:
+                    yield entry, match.start(), match.end()
+                    position = folded.find(entry.anchor, max(match.end(), position + 1))
+                else:
+                    position = folded.find(entry.anchor, position + 1)
+
+    def _iter_matches_within(
+        self, text: str, use_prefilter: bool, budget: PatternBudget, skipped: list[str]
+    ) -> Iterator[tuple[PatternEntry, int, int]]:
+        """iter_matches charging each pattern the CPU time of its own searches, never of the caller's"""
+        folded = fold_text(text)
+        entries = self.index.candidates_for_tokens(text_tokens(folded)) if use_prefilter else self.entries
+        for entry in entries:
+            if use_prefilter and entry.literal is not None and entry.literal not in folded:
+                continue
+            if entry.pattern in budget.exceeded:
+                skipped.append(entry.pattern)
+                continue
+            regex = entry.regex  # Compiled outside the timed searches
+            spent = 0.0
+            if entry.anchor is None or not use_prefilter:
+                matches = regex.finditer(text)
+                while True:
+                    clock = thread_time()
+                    match = next(matches, None)
+                    spent += thread_time() - clock
+                    if match is None:
+                        budget.overrun(entry.pattern, spent)  # Finished: a strike at most
+                        break
+                    yield entry, match.start(), match.end()
+                    if budget.overrun(entry.pattern, spent):
+                        skipped.append(entry.pattern)
+                        break
+                continue
+            position = folded.find(entry.anchor)
+            while position != -1:
+                clock = thread_time()
+                match = regex.match(text, position)
+                spent += thread_time() - clock
+                if match:
+                    yield entry, match.start(), match.end()
+                    position = folded.find(entry.anchor, max(match.end(), position + 1))
+                else:
+                    position = folded.find(entry.anchor, position + 1)
+                if position != -1 and budget.overrun(entry.pattern, spent):
+                    skipped.append(entry.pattern)
+                    break
+            else:
+                budget.overrun(entry.pattern, spent)
@@ -0,0 +1,256 @@
+"""
+Literal analysis of skills reference regex patterns
+Works out which literal text and word tokens every match of a pattern must
+contain, so matchers can skip patterns that cannot match a given text
+"""
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+
+class LiteralRun(NamedTuple):
+    """Literal text every match contains, with what is known about its edges"""
+    text: str
+    left_bounded: bool   # The text char before it is never a word character
+    right_bounded: bool  # The text char after it is never a word character
+
+
+class TokenAnchor(NamedTuple):
+    """Word token that every match of a pattern contains"""
+    token: str
+    whole: bool  # True: a whole text token; False: only a prefix of one
+
+
+class PatternLiterals(NamedTuple):
+    """Everything the matchers precompute about one pattern"""
+    required: str | None        # required_literal()
+    anchor: str | None          # anchor_literal()
+    token: TokenAnchor | None   # anchor_token()
+
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter
+# (str.lower() alone would miss them and make the prefilter unsound)
+_FOLD_TABLE: dict[int, str] = {0x130: 'i', 0x131: 'i', 0x17F: 's', 0x212A: 'k'}
+
+_QUANTIFIER = re.compile(r'\{\d*,?\d*\}')
+_VERBOSE_FLAG = re.compile(r'\(\?[a-zA-Z]*x')
+_ESCAPE_PAYLOAD: dict[str, int] = {'x': 2, 'u': 4, 'U': 8}
+_ZERO_WIDTH_ESCAPES = frozenset('bBAZ')
+_BOUNDARY_ESCAPES = frozenset('bAZ')
+_NON_WORD_ESCAPES = frozenset('sW')  # Classes that never match a word character
+_OPTIONAL_QUANTIFIER = re.compile(r'[?*]|\{0|\{,')
+_WORD = re.compile(r'[a-z0-9_]+')
+
+
+def fold_text(text: str) -> str:
+    """Lowercase text the way the prefilter literals are lowercased"""
+    return text.translate(_FOLD_TABLE).lower()
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Return the index just past the character class starting at pattern[i]"""
+    j = i + 1
+    if j < len(pattern) and pattern[j] == '^':
+        j += 1
+    if j < len(pattern) and pattern[j] == ']':
+        j += 1
+    while j < len(pattern) and pattern[j] != ']':
+        j += 2 if pattern[j] == '\\' else 1
+    return j + 1
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Return the index just past the group starting at pattern[i]"""
+    depth = 0
+    j = i
+    while j < len(pattern):
+        char = pattern[j]
+        if char == '\\':
+            j += 2
+            continue
+        if char == '[':
+            j = _skip_class(pattern, j)
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return j + 1
+        j += 1
+    return j
+
+
+def _literal_runs(pattern: str) -> tuple[list[LiteralRun], str | None] | None:
+    """
+    Split a pattern into the literal runs every match must contain.
+
+    Returns (runs, leading) where `leading` is the first run when only
+    zero-width assertions (\\b, ^ ...) precede it, so every match starts
+    with it. Returns None when the pattern has a top-level alternation or
+    uses verbose mode, in which case no literal is guaranteed.
+    """
+    if _VERBOSE_FLAG.search(pattern):
+        return None
+
+    runs: list[LiteralRun] = []
+    current: list[str] = []
+    leading: str | None = None
+    at_start = True
+    # Whether the next literal char is known to follow a non-word char
+    boundary = False
+    run_left = False
+
+    def flush(right_bounded: bool = False) -> None:
+        nonlocal leading, at_start
+        if current:
+            runs.append(LiteralRun(''.join(current), run_left, right_bounded))
+            if at_start:
+                leading = runs[-1].text
+            current.clear()
+            at_start = False
+
+    def append(literal: str) -> None:
+        nonlocal boundary, run_left
+        if not current:
+            run_left = boundary
+        current.append(literal)
+        boundary = False
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped in _ZERO_WIDTH_ESCAPES:
+                flush(right_bounded=escaped in _BOUNDARY_ESCAPES)
+                boundary = escaped in _BOUNDARY_ESCAPES
+                continue
+            if escaped.isalnum():
+                # \s, \d, \n, \x41 ... are not literal text; a mandatory
+                # \s or \W still tells us the neighbouring char is not a word char
+                separator = escaped in _NON_WORD_ESCAPES and not _OPTIONAL_QUANTIFIER.match(pattern, i)
+                flush(right_bounded=separator)
+                boundary = separator
+                at_start = False
+                if escaped.isdigit():
+                    while i < len(pattern) and pattern[i].isdigit():
+                        i += 1
+                elif escaped == 'N':
+                    i = pattern.find('}', i) + 1 or len(pattern)
+                else:
+                    i += _ESCAPE_PAYLOAD.get(escaped, 0)
+                continue
+            append(escaped)
+            continue
+        if char == '[':
+            flush()
+            boundary = at_start = False
+            i = _skip_class(pattern, i)
+            continue
+        elif char == '(':
+            flush()
+            boundary = at_start = False
+            i = _skip_group(pattern, i)
+            continue
+        elif char == '|':
+            return None
+        elif char in '^$':
+            flush(right_bounded=True)
+            boundary = True
+            i += 1
+            continue
+        elif char == '.':
+            flush()
+            boundary = at_start = False
+            i += 1
+            continue
+        elif char in '?*+' or (char == '{' and _QUANTIFIER.match(pattern, i)):
+            # Optional quantifiers make the previous character optional
+            optional = char in '?*' or (char == '{' and not re.match(r'\{[1-9]', pattern[i:]))
+            if optional and current:
+                current.pop()
+            flush()
+            boundary = boundary and not optional  # e.g. \s+ keeps it, \s* loses it
+            at_start = False
+            if char == '{':
+                quantifier = _QUANTIFIER.match(pattern, i)
+                i = quantifier.end() if quantifier else i + 1
+            else:
+                i += 1
+            if i < len(pattern) and pattern[i] in '?+':
+                i += 1  # Lazy / possessive modifier
+            continue
+        else:
+            append(char)
+        i += 1
+    flush()
+
+    return runs, leading
+
+
+def required_literal(pattern: str) -> str | None:
+    """
+    Longest lowercase literal that every match of `pattern` must contain.
+    None means the pattern cannot be prefiltered and must always run.
+    """
+    analysis = _literal_runs(pattern)
+    if analysis is None or not analysis[0]:
+        return None
+    longest = max((run.text for run in analysis[0]), key=len)
+    return longest.lower() if longest.isascii() else None
+
+
+def anchor_literal(pattern: str) -> str | None:
+    """
+    Lowercase literal every match of `pattern` STARTS with, if any.
+    Matches can then only begin where this literal occurs in the text.
+    """
+    analysis = _literal_runs(pattern)
+    if analysis is None or analysis[1] is None:
+        return None
+    leading = analysis[1]
+    return leading.lower() if leading.isascii() else None
+
+
+def anchor_token(pattern: str) -> TokenAnchor | None:
+    """
+    Lowercase word token that every match of `pattern` puts into text_tokens().
+
+    Prefers the longest token the match contains WHOLE; otherwise the longest
+    word that must START a text token. None means the pattern cannot be
+    token-anchored and has to be scanned for in every text.
+    """
+    analysis = _literal_runs(pattern)
+    if analysis is None:
+        return None
+    whole: list[str] = []
+    prefixes: list[str] = []
+    for run in analysis[0]:
+        if not run.text.isascii():
+            continue
+        text = run.text.lower()
+        for word in _WORD.finditer(text):
+            if not (word.start() > 0 or run.left_bounded):
+                continue
+            if word.end() < len(text) or run.right_bounded:
+                whole.append(word.group())
+            else:
+                prefixes.append(word.group())
+    if whole:
+        return TokenAnchor(max(whole, key=len), True)
+    if prefixes:
+        return TokenAnchor(max(prefixes, key=len), False)
+    return None
+
+
+def analyze_pattern(pattern: str) -> PatternLiterals:
+    """required_literal, anchor_literal and anchor_token of one pattern"""
+    return PatternLiterals(required_literal(pattern), anchor_literal(pattern), anchor_token(pattern))
+
+
+def text_tokens(text: str) -> set[str]:
+    """Distinct lowercase word tokens of text, split the way anchor_token assumes"""
+    return set(_WORD.findall(fold_text(text)))
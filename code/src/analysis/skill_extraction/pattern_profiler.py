@@ -0,0 +1,128 @@
+"""
+Regex cost profile of a skills reference
+Times every pattern of the registry over a corpus of descriptions (a full
+finditer per text, as if no prefilter skipped it) and ranks patterns by total
+and worst-case cost. Each pattern is also run on stress inputs built from its
+own literals - one long token repeating all but its last word, the shape on
+which \\S+ / .* runs between literals backtrack - doubling its size until a run
+gets slow; a pattern whose time grows polynomially faster than the input is
+flagged as pathological.
+"""
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Sequence
+from time import perf_counter
+from typing import NamedTuple
+
+from .pattern_registry import SkillRegistry
+
+# Escapes and syntax stripped from a pattern to recover its literal words
+_PATTERN_SYNTAX = re.compile(r"\\[A-Za-z]|\(\?[:=!<]*|[\\^$.|?*+()\[\]{}]")
+_WORD = re.compile(r"[a-z0-9]+(?:[/#&.+-][a-z0-9]+)*")
+
+STRESS_MIN_CHARS = 250      # First stress input size; doubled up to the max
+STRESS_MAX_CHARS = 8000
+STRESS_SLOW_SECONDS = 0.02  # Stop doubling once a stress run takes this long
+GROWTH_THRESHOLD = 1.3      # Time ~ size ** growth; 1 is linear, 2 quadratic
+MIN_FLAGGED_SECONDS = 0.001  # Below this the growth is timer noise
+
+
+class PatternCost(NamedTuple):
+    """Measured cost of one pattern"""
+    pattern: str
+    skills: tuple[str, ...]
+    total: float        # Seconds over the whole corpus
+    worst: float        # Seconds on the slowest text
+    worst_text: int     # Corpus index of the slowest text (-1 for an empty corpus)
+    stress: float       # Seconds on the largest stress input
+    stress_chars: int   # Size of the largest stress input
+    growth: float       # Exponent of time against stress input size (1.0 when too fast to tell)
+    stress_input: str   # The repeated unit of the stress inputs
+
+    @property
+    def pathological(self) -> bool:
+        """Whether the stress inputs show superlinear (backtracking) growth"""
+        return self.growth >= GROWTH_THRESHOLD and self.stress >= MIN_FLAGGED_SECONDS
+
+
+def stress_unit(pattern: str) -> str:
+    """
+    The unit repeated into a stress input: the pattern's literal words but the
+    last, each followed by a separator, so every repetition restarts a match
+    attempt that can only fail once the whole token is scanned
+    """
+    words = _WORD.findall(_PATTERN_SYNTAX.sub(" ", pattern).lower())
+    if not words:
+        return "x"
+    return "".join(f"{word}-" for word in (words[:-1] or words))
+
+
+def _time_finditer(regex: re.Pattern[str], text: str) -> float:
+    started = perf_counter()
+    for _ in regex.finditer(text):
+        pass
+    return perf_counter() - started
+
+
+def _time_stress(regex: re.Pattern[str], unit: str, size: int) -> float:
+    """Seconds on a stress input of about `size` chars; short runs take the best of 3 against timer noise"""
+    text = unit * max(1, size // len(unit))
+    elapsed = _time_finditer(regex, text)
+    if elapsed < STRESS_SLOW_SECONDS:
+        elapsed = min(elapsed, _time_finditer(regex, text), _time_finditer(regex, text))
+    return elapsed
+
+
+def profile_pattern(
+    regex: re.Pattern[str],
+    corpus: Sequence[str],
+    skills: tuple[str, ...] = (),
+    max_stress_chars: int = STRESS_MAX_CHARS,
+) -> PatternCost:
+    """Time one compiled pattern over a corpus and its stress inputs"""
+    total = worst = 0.0
+    worst_text = -1
+    for i, text in enumerate(corpus):
+        elapsed = _time_finditer(regex, text)
+        total += elapsed
+        if elapsed > worst:
+            worst, worst_text = elapsed, i
+
+    unit = stress_unit(regex.pattern)
+    size = STRESS_MIN_CHARS
+    stress = _time_stress(regex, unit, size)
+    growth = 1.0
+    # Doubling stops early on slow runs, so a pathological pattern cannot stall the profile
+    while stress < STRESS_SLOW_SECONDS and size * 2 <= max_stress_chars:
+        size *= 2
+        previous, stress = stress, _time_stress(regex, unit, size)
+        if stress >= MIN_FLAGGED_SECONDS and previous > 0:
+            growth = math.log2(stress / previous)
+    return PatternCost(regex.pattern, skills, total, worst, worst_text, stress, size, growth, unit)
+
+
+def profile_registry(
+    registry: SkillRegistry,
+    corpus: Sequence[str],
+    max_stress_chars: int = STRESS_MAX_CHARS,
+) -> list[PatternCost]:
+    """
+    Cost of every distinct pattern of a registry, most expensive (total) first.
+    Every pattern gets compiled; expect minutes for thousands of patterns over
+    hundreds of descriptions.
+    """
+    skills_of: dict[str, list[str]] = {}
+    for skill in registry.skills:
+        for pattern in skill.patterns:
+            names = skills_of.setdefault(pattern, [])
+            if skill.name not in names:
+                names.append(skill.name)
+
+    costs = [
+        profile_pattern(registry.pattern_cache[pattern], corpus, tuple(names), max_stress_chars)
+        for pattern, names in skills_of.items()
+    ]
+    costs.sort(key=lambda cost: cost.total, reverse=True)
+    return costs
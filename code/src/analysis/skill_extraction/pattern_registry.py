@@ -0,0 +1,234 @@
+"""
+Process-wide registry of compiled skills references
+Each reference file is loaded and compiled ONCE per process, keyed by its
+path and content hash, and reloaded automatically when the file changes.
+Every extractor and validator shares the same immutable structure.
+Patterns come from the reference compiler's artifact when it is up to date
+(see reference_compiler.py), so case variants are already collapsed; a
+stale or missing artifact is rebuilt in-process and written to the compiled
+reference cache (outside the source tree) so the next process starts warm.
+Regexes are compiled on first use, so building the registry and every
+consumer's view of it does no regex compilation.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import NamedTuple, TypeVar, overload
+
+from .candidate_index import CandidateIndex
+from .pattern_engine import SkillPatternEngine, SkillReferenceData
+from .pattern_literals import PatternLiterals
+from .reference_compiler import (
+    artifact_literals,
+    cache_artifact,
+    compile_reference,
+    load_artifact,
+    load_cached_artifact,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_SKILLS_REF_PATH = "src/config/skills_reference_2025.json"
+
+
+class CompiledSkill(NamedTuple):
+    """One skill from the reference with its compiled patterns"""
+    name: str
+    patterns: tuple[str, ...]  # Valid patterns, case variants collapsed
+    # re.IGNORECASE; usually ONE alternation of all patterns, so searching
+    # any of them finds the skill in a single pass. Compiled on first access
+    regexes: Sequence[re.Pattern[str]]
+
+
+class _LazyPatternCache(Mapping[str, re.Pattern[str]]):
+    """pattern -> re.IGNORECASE regex, compiled on first lookup"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._patterns = frozenset(patterns)
+        self._compiled: dict[str, re.Pattern[str]] = {}
+
+    def __getitem__(self, pattern: str) -> re.Pattern[str]:
+        regex = self._compiled.get(pattern)
+        if regex is None:
+            if pattern not in self._patterns:
+                raise KeyError(pattern)
+            regex = self._compiled.setdefault(pattern, re.compile(pattern, re.IGNORECASE))
+        return regex
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._patterns)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, pattern: object) -> bool:
+        return pattern in self._patterns  # Without compiling it
+
+
+class _LazyRegexes(Sequence[re.Pattern[str]]):
+    """A skill's regexes, compiled together the first time any is needed"""
+
+    __slots__ = ("_sources", "_compile", "_compiled")
+
+    def __init__(self, sources: tuple[str, ...], compile_pattern: Callable[[str], re.Pattern[str]]):
+        self._sources = sources
+        self._compile = compile_pattern
+        self._compiled: tuple[re.Pattern[str], ...] | None = None
+
+    def _regexes(self) -> tuple[re.Pattern[str], ...]:
+        if self._compiled is None:
+            self._compiled = tuple(self._compile(source) for source in self._sources)
+        return self._compiled
+
+    @overload
+    def __getitem__(self, index: int) -> re.Pattern[str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[re.Pattern[str], ...]: ...
+
+    def __getitem__(self, index: int | slice) -> re.Pattern[str] | tuple[re.Pattern[str], ...]:
+        return self._regexes()[index]
+
+    def __iter__(self) -> Iterator[re.Pattern[str]]:
+        return iter(self._regexes())
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+
+def _compile_ignorecase(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@dataclass(frozen=True, eq=False)
+class SkillRegistry:
+    """Immutable, pre-compiled view of one version of a skills reference"""
+    path: str
+    content_hash: str
+    skills: tuple[CompiledSkill, ...]  # File order
+    # pattern string -> compiled pattern (on first use), shared by every derived structure
+    pattern_cache: Mapping[str, re.Pattern[str]]
+    # pattern string -> precomputed prefilter / anchor literals
+    literals: Mapping[str, PatternLiterals]
+    invalid_patterns: tuple[str, ...]
+    _derived: dict[str, object] = field(default_factory=dict, repr=False)
+    _derived_lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    @property
+    def skills_reference(self) -> list[SkillReferenceData]:
+        """Skills in the JSON list-of-dicts shape expected by layer 3"""
+        return [{"name": skill.name, "patterns": list(skill.patterns)} for skill in self.skills]
+
+    @property
+    def engine(self) -> SkillPatternEngine:
+        """Layer 3 pattern engine built from the shared compiled patterns"""
+        return self.derived(
+            "engine",
+            lambda registry: SkillPatternEngine(registry.skills_reference, registry.pattern_cache, registry.literals)
+        )
+
+    @property
+    def skill_index(self) -> CandidateIndex[CompiledSkill]:
+        """Token-anchored index from description tokens to candidate skills"""
+        return self.derived(
+            "skill_index",
+            lambda registry: CandidateIndex(
+                ((skill, skill.patterns) for skill in registry.skills),
+                anchor_of=lambda pattern: registry.literals[pattern].token,
+            )
+        )
+
+    def derived(self, key: str, build: Callable[[SkillRegistry], T]) -> T:
+        """
+        Build a consumer-specific view once per registry version.
+        `key` must be unique to the consumer; `build` gets this registry.
+        """
+        with self._derived_lock:
+            if key not in self._derived:
+                self._derived[key] = build(self)
+            return self._derived[key]  # type: ignore[return-value]
+
+
+# resolved path -> (mtime_ns, size, registry)
+_registries: dict[str, tuple[int, int, SkillRegistry]] = {}
+_registry_lock = threading.Lock()
+
+
+def _build_registry(path: str, raw: bytes, content_hash: str) -> SkillRegistry:
+    """Load (or compile and cache) the reference's artifact and build the lazy regexes"""
+    artifact = load_artifact(path, content_hash) or load_cached_artifact(content_hash)
+    if artifact is None:
+        logger.info(
+            f"No current compiled reference for {path}; compiling in-process "
+            f"(scripts/extraction/compile_skills_reference.py refreshes the committed one)"
+        )
+        artifact = compile_reference(json.loads(raw.decode("utf-8")), content_hash)
+        try:
+            cache_artifact(artifact)
+        except OSError as e:
+            logger.debug(f"Could not cache compiled reference for {path}: {e}")
+
+    pattern_cache = _LazyPatternCache(p for skill in artifact["skills"] for p in skill["patterns"])
+    skills: list[CompiledSkill] = []
+    for skill in artifact["skills"]:
+        patterns = tuple(skill["patterns"])
+        merged = skill["merged"]
+        if merged is None:
+            regexes = _LazyRegexes(patterns, pattern_cache.__getitem__)
+        elif len(patterns) == 1:
+            regexes = _LazyRegexes((merged,), pattern_cache.__getitem__)
+        else:
+            regexes = _LazyRegexes((merged,), _compile_ignorecase)
+        skills.append(CompiledSkill(skill["name"], patterns, regexes))
+
+    report = artifact["report"]
+    logger.info(
+        f"Loaded {report['regexes_after_merge']} regexes for {report['skills']} skills from {path} "
+        f"({report['patterns_before']} patterns, {report['patterns_after_dedupe']} after dedupe)"
+    )
+    return SkillRegistry(
+        path=path,
+        content_hash=content_hash,
+        skills=tuple(skills),
+        pattern_cache=pattern_cache,
+        literals=artifact_literals(artifact),
+        invalid_patterns=tuple(report["invalid_patterns"]),
+    )
+
+
+def get_skill_registry(path: str | Path = DEFAULT_SKILLS_REF_PATH) -> SkillRegistry:
+    """
+    Return the compiled registry for a skills reference file.
+
+    The file is only re-read when its mtime or size changes, and only
+    recompiled when its content hash changes.
+
+    Raises:
+        FileNotFoundError: If the reference file does not exist
+        ValueError: If the file is not valid JSON
+    """
+    resolved = str(Path(path).resolve())
+    stat = Path(resolved).stat()
+
+    with _registry_lock:
+        cached = _registries.get(resolved)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        raw = Path(resolved).read_bytes()
+        content_hash = hashlib.sha256(raw).hexdigest()
+        if cached and cached[2].content_hash == content_hash:
+            registry = cached[2]  # Touched but unchanged
+        else:
+            registry = _build_registry(resolved, raw, content_hash)
+        _registries[resolved] = (stat.st_mtime_ns, stat.st_size, registry)
+        return registry
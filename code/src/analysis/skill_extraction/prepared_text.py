@@ -0,0 +1,95 @@
+"""
+Per-description text views shared by every stage of one job
+The scraper cleans a description once and wraps it in a PreparedText; the
+language checks, extraction and validation then read its lowercased,
+normalized, whitespace-collapsed and tokenized views instead of each
+building their own multi-KB copy. Views are computed on first use and a
+view equal to the text it came from is that same object.
+"""
+from __future__ import annotations
+
+from typing import Union
+
+from .extraction_cache import normalize_description
+from .pattern_literals import text_tokens
+
+
+class PreparedText:
+    """One description and its derived views, each built once on first use"""
+
+    __slots__ = ("text", "_lower", "_normalized", "_collapsed", "_tokens")
+
+    def __init__(self, text: str, lower: str | None = None):
+        """
+        Args:
+            text: The description as is
+            lower: text.lower() if the caller already has it
+        """
+        self.text = text
+        self._lower = lower
+        self._normalized: PreparedText | None = None
+        self._collapsed: PreparedText | None = None
+        self._tokens: set[str] | None = None
+
+    @property
+    def lower(self) -> str:
+        """text.lower()"""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def normalized(self) -> PreparedText:
+        """View of normalize_description(text), the form extraction runs on and hashes"""
+        if self._normalized is None:
+            normalized = normalize_description(self.text)
+            if normalized == self.text:
+                self._normalized = self
+            else:
+                self._normalized = PreparedText(normalized)
+                self._normalized._normalized = self._normalized  # Normalizing is idempotent
+        return self._normalized
+
+    @property
+    def collapsed(self) -> PreparedText:
+        """View with every whitespace run collapsed to one space, stripped"""
+        if self._collapsed is None:
+            collapsed = " ".join(self.text.split())
+            if collapsed == self.text:
+                self._collapsed = self
+            else:
+                self._collapsed = PreparedText(collapsed)
+                self._collapsed._collapsed = self._collapsed
+        return self._collapsed
+
+    @property
+    def tokens(self) -> set[str]:
+        """text_tokens() of the lowercased text, as candidate indexes look skills up"""
+        if self._tokens is None:
+            self._tokens = text_tokens(self.lower)
+        return self._tokens
+
+    def head(self, length: int) -> PreparedText:
+        """View of the first `length` characters, sharing the lowercased text when it can"""
+        if len(self.text) <= length:
+            return self
+        # Slicing the lowercased text is only the same when lowering kept every offset
+        lower = self.lower[:length] if len(self.lower) == len(self.text) else None
+        return PreparedText(self.text[:length], lower)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"PreparedText({self.text[:40]!r}{'...' if len(self.text) > 40 else ''})"
+
+
+TextLike = Union[str, PreparedText]
+
+
+def prepare_text(text: TextLike) -> PreparedText:
+    """The PreparedText of a description (itself if it already is one)"""
+    return text if isinstance(text, PreparedText) else PreparedText(text)
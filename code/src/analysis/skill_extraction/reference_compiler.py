@@ -0,0 +1,232 @@
+"""
+Skills reference compiler
+Collapses patterns that are equivalent under re.IGNORECASE (`\\b\\.NET\\b`,
+`\\b\\.net\\b` ...) and merges each skill's remaining variants into a single
+alternation. The result is written as a compact artifact next to the
+reference JSON, keyed by the JSON's content hash, so runtime consumers load
+it instead of redoing the work on the raw file.
+The artifact also carries each pattern's literal analysis (prefilter and
+anchor literals), which costs more than compiling the regexes themselves.
+Compiled re.Pattern objects cannot be persisted, so consumers compile
+lazily from the artifact on first use.
+A reference edited since its artifact was committed is rebuilt at load time
+into a cache outside the source tree, keyed by content hash, so every later
+process starts warm without dirtying the checked-in artifact.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, TypedDict
+
+from .pattern_literals import PatternLiterals, TokenAnchor, analyze_pattern
+
+logger = logging.getLogger(__name__)
+
+COMPILER_VERSION = 2
+ARTIFACT_SUFFIX = ".compiled.json"
+# Artifacts rebuilt at load time for references whose committed artifact is stale
+COMPILED_CACHE_DIR = Path.home() / ".cache" / "job-scraper" / "compiled_references"
+
+
+class CompiledSkillSource(TypedDict):
+    """One skill in the artifact"""
+    name: str
+    patterns: list[str]  # Valid patterns, one per case-insensitive class
+    merged: str | None   # Single alternation of `patterns`, None if it cannot be built
+
+
+class CompileReport(TypedDict):
+    """Pattern counts before and after compilation"""
+    skills: int
+    patterns_before: int
+    patterns_after_dedupe: int
+    regexes_after_merge: int
+    invalid_patterns: list[str]
+
+
+class ReferenceArtifact(TypedDict):
+    """Compiled skills reference written next to the JSON"""
+    compiler_version: int
+    source_hash: str
+    report: CompileReport
+    skills: list[CompiledSkillSource]
+    # pattern -> [required literal, anchor literal, anchor token, token is whole]
+    literals: dict[str, list[str | bool | None]]
+
+
+def case_insensitive_key(pattern: str) -> str:
+    """
+    Canonical form of a pattern under re.IGNORECASE.
+    Literal letters are lowercased; escapes (\\S vs \\s) and character
+    classes are left alone because their case changes their meaning.
+    """
+    out: list[str] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        out.append(char if in_class else char.lower())
+        i += 1
+    return ''.join(out)
+
+
+def dedupe_patterns(patterns: Sequence[str]) -> list[str]:
+    """Keep the first pattern of each case-insensitive equivalence class"""
+    seen: set[str] = set()
+    unique: list[str] = []
+    for pattern in patterns:
+        key = case_insensitive_key(pattern)
+        if key not in seen:
+            seen.add(key)
+            unique.append(pattern)
+    return unique
+
+
+def merge_patterns(patterns: Sequence[str]) -> str | None:
+    """
+    Merge patterns into one alternation that searches like any of them.
+    None when they cannot share one regex (group numbering, inline flags).
+    """
+    if len(patterns) == 1:
+        return patterns[0]
+    if not patterns or any(re.search(r'\\[1-9]|\(\?[a-zA-Z]', p) for p in patterns):
+        return None
+    merged = '(?:' + '|'.join(patterns) + ')'
+    try:
+        re.compile(merged, re.IGNORECASE)
+    except re.error:
+        return None
+    return merged
+
+
+def compile_reference(data: dict[str, Any], source_hash: str) -> ReferenceArtifact:
+    """Dedupe, validate and merge every skill's patterns"""
+    skills: list[CompiledSkillSource] = []
+    invalid: list[str] = []
+    patterns_before = 0
+
+    for skill in data.get('skills', []):
+        name = str(skill.get('name', ''))
+        raw_patterns = list(skill.get('patterns') or [])
+        patterns_before += len(raw_patterns)
+
+        valid: list[str] = []
+        for pattern_str in dedupe_patterns(raw_patterns):
+            try:
+                re.compile(pattern_str, re.IGNORECASE)
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern for skill '{name}': {pattern_str} - {e}")
+                invalid.append(pattern_str)
+                continue
+            valid.append(pattern_str)
+
+        skills.append({'name': name, 'patterns': valid, 'merged': merge_patterns(valid)})
+
+    report: CompileReport = {
+        'skills': len(skills),
+        'patterns_before': patterns_before,
+        'patterns_after_dedupe': sum(len(s['patterns']) for s in skills),
+        'regexes_after_merge': sum(1 if s['merged'] else len(s['patterns']) for s in skills),
+        'invalid_patterns': invalid,
+    }
+    literals: dict[str, list[str | bool | None]] = {}
+    for skill_source in skills:
+        for pattern in skill_source['patterns']:
+            if pattern not in literals:
+                required, anchor, token = analyze_pattern(pattern)
+                literals[pattern] = [required, anchor, *(token or (None, None))]
+    return {
+        'compiler_version': COMPILER_VERSION,
+        'source_hash': source_hash,
+        'report': report,
+        'skills': skills,
+        'literals': literals,
+    }
+
+
+def artifact_literals(artifact: ReferenceArtifact) -> dict[str, PatternLiterals]:
+    """Decode the artifact's literal analysis, pattern -> PatternLiterals"""
+    return {
+        pattern: PatternLiterals(
+            required, anchor, TokenAnchor(token, bool(whole)) if token is not None else None  # type: ignore[arg-type]
+        )
+        for pattern, (required, anchor, token, whole) in artifact['literals'].items()
+    }
+
+
+def artifact_path(reference_path: str | Path) -> Path:
+    """skills_reference_2025.json -> skills_reference_2025.compiled.json"""
+    path = Path(reference_path)
+    return path.with_name(path.stem + ARTIFACT_SUFFIX)
+
+
+def cached_artifact_path(source_hash: str) -> Path:
+    """Where the load-time rebuild of a reference with this content hash is cached"""
+    return COMPILED_CACHE_DIR / f"{source_hash}.v{COMPILER_VERSION}{ARTIFACT_SUFFIX}"
+
+
+def load_artifact(reference_path: str | Path, source_hash: str) -> ReferenceArtifact | None:
+    """Load the artifact if it exists and was compiled from this exact JSON"""
+    return _read_artifact(artifact_path(reference_path), source_hash)
+
+
+def load_cached_artifact(source_hash: str) -> ReferenceArtifact | None:
+    """Load the cached rebuild of the reference with this content hash, if any"""
+    return _read_artifact(cached_artifact_path(source_hash), source_hash)
+
+
+def _read_artifact(path: Path, source_hash: str) -> ReferenceArtifact | None:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            artifact: ReferenceArtifact = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable compiled reference {path}: {e}")
+        return None
+
+    if artifact.get('compiler_version') != COMPILER_VERSION or artifact.get('source_hash') != source_hash:
+        logger.info(f"Compiled reference {path} is stale")
+        return None
+    return artifact
+
+
+def save_artifact(reference_path: str | Path, artifact: ReferenceArtifact) -> None:
+    """Write an already compiled artifact next to its reference JSON"""
+    _write_artifact(artifact_path(reference_path), artifact)
+
+
+def cache_artifact(artifact: ReferenceArtifact) -> None:
+    """Write a load-time rebuild to the compiled reference cache"""
+    path = cached_artifact_path(artifact['source_hash'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_artifact(path, artifact)
+
+
+def _write_artifact(path: Path, artifact: ReferenceArtifact) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)  # Readers never see a half-written artifact
+
+
+def write_artifact(reference_path: str | Path) -> ReferenceArtifact:
+    """Compile a reference JSON and write its artifact; returns the artifact"""
+    raw = Path(reference_path).read_bytes()
+    artifact = compile_reference(json.loads(raw.decode('utf-8')), hashlib.sha256(raw).hexdigest())
+    save_artifact(reference_path, artifact)
+    return artifact
@@ -0,0 +1,94 @@
+"""
+Skills reference diff
+Compares two versions of the skills reference JSON and reports which skills
+were added, removed or had their patterns changed, so re-extraction only has
+to look at descriptions where those skills' patterns (old or new) match.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .reference_compiler import case_insensitive_key, dedupe_patterns
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceDiff(NamedTuple):
+    """Skills whose patterns differ between two references"""
+    added: dict[str, tuple[str, ...]]                             # name -> new patterns
+    removed: dict[str, tuple[str, ...]]                           # name -> old patterns
+    changed: dict[str, tuple[tuple[str, ...], tuple[str, ...]]]   # name -> (old, new)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def patterns(self) -> list[str]:
+        """Every old and new pattern of the affected skills, deduplicated"""
+        patterns: list[str] = []
+        for new in self.added.values():
+            patterns.extend(new)
+        for old in self.removed.values():
+            patterns.extend(old)
+        for old, new in self.changed.values():
+            patterns.extend(old)
+            patterns.extend(new)
+        return dedupe_patterns(patterns)
+
+    def summary(self) -> str:
+        return f"{len(self.added)} added, {len(self.removed)} removed, {len(self.changed)} changed skill(s)"
+
+
+def load_reference_data(path: str | Path) -> dict[str, Any]:
+    """Read a skills reference JSON"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def skill_patterns(data: Mapping[str, Any]) -> dict[str, tuple[str, ...]]:
+    """Skill name -> patterns as the extractors see them (case variants collapsed)"""
+    patterns: dict[str, list[str]] = {}
+    for skill in data.get('skills', []):
+        patterns.setdefault(str(skill.get('name', '')), []).extend(skill.get('patterns') or [])
+    return {name: tuple(dedupe_patterns(p)) for name, p in patterns.items()}
+
+
+def diff_references(old_data: Mapping[str, Any], new_data: Mapping[str, Any]) -> ReferenceDiff:
+    """
+    Skills added, removed or changed between two references.
+    A skill counts as changed when its patterns differ under re.IGNORECASE
+    or appear in a different order (order decides which match claims a span).
+    Moving a skill within the file is not a change.
+    """
+    old = skill_patterns(old_data)
+    new = skill_patterns(new_data)
+
+    def keys(patterns: tuple[str, ...]) -> list[str]:
+        return [case_insensitive_key(p) for p in patterns]
+
+    return ReferenceDiff(
+        added={name: new[name] for name in new.keys() - old.keys()},
+        removed={name: old[name] for name in old.keys() - new.keys()},
+        changed={
+            name: (old[name], new[name])
+            for name in old.keys() & new.keys()
+            if keys(old[name]) != keys(new[name])
+        },
+    )
+
+
+def compile_diff_patterns(diff: ReferenceDiff) -> list[re.Pattern[str]]:
+    """Regexes that find every description the diff can affect (invalid patterns skipped)"""
+    compiled: list[re.Pattern[str]] = []
+    for pattern in diff.patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error as e:
+            logger.debug(f"Skipping invalid pattern in reference diff: {pattern} - {e}")
+    return compiled
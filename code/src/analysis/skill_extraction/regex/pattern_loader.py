@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import re
 from typing import TypedDict
 
+from ..pattern_registry import get_skill_registry
 from .config import EXCLUDED_SKILLS, SKILLS_JSON_PATH
 
 
@@ -22,29 +22,21 @@ class SkillsJsonData(TypedDict, total=False):
 
 
 def load_skill_patterns() -> dict[str, list[re.Pattern[str]]]:
-    """Load and compile skill patterns from JSON for fast matching"""
+    """Load skill patterns from JSON, compiled once via the shared registry"""
 
-    with open(SKILLS_JSON_PATH, 'r', encoding='utf-8') as f:
-        data: SkillsJsonData = json.load(f)
+    registry = get_skill_registry(SKILLS_JSON_PATH)
 
     compiled_patterns: dict[str, list[re.Pattern[str]]] = {}
 
-    # skills is now a flat list, not categorized dict
-    skills_list: list[SkillPatternData] = data.get("skills", [])
-
-    for skill_obj in skills_list:
-        skill_name: str = skill_obj.get("name", "")
-
+    for skill in registry.skills:
         # Skip specific non-technical skills
-        if skill_name in EXCLUDED_SKILLS:
+        if skill.name in EXCLUDED_SKILLS:
             continue
 
-        patterns: list[str] = skill_obj.get("patterns", [skill_name.lower()])
-
-        # Compile regex patterns (patterns already have \b boundaries)
-        compiled_patterns[skill_name] = [
-            re.compile(p, re.IGNORECASE)
-            for p in patterns
-        ]
+        if skill.patterns:
+            # Patterns already have \b boundaries and are compiled by the registry
+            compiled_patterns[skill.name] = list(skill.regexes)
+        else:
+            compiled_patterns[skill.name] = [re.compile(skill.name.lower(), re.IGNORECASE)]
 
     return compiled_patterns
@@ -2,16 +2,18 @@
 
 import re
 
+from ..prepared_text import TextLike, prepare_text
+
 
 def match_skills_in_text(
-    text: str,
+    text: TextLike,
     skill_patterns: dict[str, list[re.Pattern[str]]]
 ) -> list[str]:
     """
     Match skills in text using compiled regex patterns
     
     Args:
-        text: Job description text
+        text: Job description text (a PreparedText lends its lowercased text)
         skill_patterns: Pre-compiled regex patterns
     
     Returns:
@@ -22,7 +24,7 @@ def match_skills_in_text(
         return []
     
     found_skills: set[str] = set()
-    text_lower = text.lower()
+    text_lower = prepare_text(text).lower
     
     # Fast matching: check each skill's patterns
     for skill_name, patterns in skill_patterns.items():
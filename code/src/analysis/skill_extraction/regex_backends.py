@@ -0,0 +1,158 @@
+"""
+Pluggable regex backends for skill matching
+The stdlib `re` backend is the default and is what the registry compiles.
+The `regex` module and RE2 bindings (google-re2 / pyre2, both imported as
+`re2`) are used when installed. RE2 does not backtrack, so it is immune to
+patterns like \\b5G\\S+TECHNOLOGY\\b, but it rejects lookarounds and
+backreferences; patterns a backend cannot compile fall back to `re`.
+
+scripts/benchmarks/benchmark_regex_backends.py runs every installed backend
+over the same corpus and reports throughput and per-skill differences, so a
+backend is only switched to once it finds the same skills. Production code
+selects one with a `regex_backend` argument (the skill validators), which
+goes through skill_matcher() so each registry version compiles it once.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable, Sequence
+from typing import NamedTuple, Protocol
+
+from .pattern_registry import SkillRegistry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = "re"
+
+
+class CompiledRegex(Protocol):
+    """What matchers need from a compiled pattern (re, regex and re2 all provide it)"""
+
+    def search(self, string: str, /) -> object | None: ...
+
+
+class RegexBackend(NamedTuple):
+    """A regex engine compiling skill patterns case-insensitively"""
+    name: str
+    compile: Callable[[str], CompiledRegex]
+    errors: tuple[type[Exception], ...]  # Raised by compile for patterns the engine does not support
+
+
+def _stdlib_backend() -> RegexBackend:
+    def compile_pattern(pattern: str) -> re.Pattern[str]:
+        return re.compile(pattern, re.IGNORECASE)
+
+    return RegexBackend("re", compile_pattern, (re.error,))
+
+
+def _regex_module_backend() -> RegexBackend:
+    import regex  # pyright: ignore[reportMissingModuleSource]  # Optional dependency
+
+    # VERSION0 keeps re's semantics for the same pattern syntax
+    flags: int = regex.IGNORECASE | regex.VERSION0
+    error: type[Exception] = regex.error
+
+    def compile_pattern(pattern: str) -> CompiledRegex:
+        compiled: CompiledRegex = regex.compile(pattern, flags)
+        return compiled
+
+    return RegexBackend("regex", compile_pattern, (error,))
+
+
+def _re2_backend() -> RegexBackend:
+    import re2  # pyright: ignore[reportMissingImports]  # Optional dependency
+
+    error: type[Exception] = re2.error
+
+    def compile_pattern(pattern: str) -> CompiledRegex:
+        # Inline flag: google-re2 and pyre2 take different option arguments
+        compiled: CompiledRegex = re2.compile(f"(?i){pattern}")
+        return compiled
+
+    return RegexBackend("re2", compile_pattern, (error, re.error, ValueError))
+
+
+_BACKENDS: dict[str, Callable[[], RegexBackend]] = {
+    "re": _stdlib_backend,
+    "regex": _regex_module_backend,
+    "re2": _re2_backend,
+}
+
+
+def get_regex_backend(name: str = DEFAULT_BACKEND) -> RegexBackend:
+    """
+    Return a regex backend by name.
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend's module is not installed
+    """
+    loader = _BACKENDS.get(name)
+    if loader is None:
+        raise ValueError(f"Unknown regex backend {name!r} (known: {', '.join(_BACKENDS)})")
+    return loader()
+
+
+def available_backends() -> list[str]:
+    """Names of the backends whose modules are installed, default first"""
+    available: list[str] = []
+    for name in _BACKENDS:
+        try:
+            get_regex_backend(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+class SkillMatcher:
+    """Finds which registry skills occur in a description, with a chosen backend"""
+
+    def __init__(self, registry: SkillRegistry, backend: RegexBackend | str = DEFAULT_BACKEND):
+        """
+        Args:
+            registry: Compiled skills reference (results follow its skill order)
+            backend: Backend or backend name; the stdlib backend reuses the registry's regexes
+        """
+        self.backend = get_regex_backend(backend) if isinstance(backend, str) else backend
+        self.skills = [skill.name for skill in registry.skills]
+        fallbacks: list[str] = []
+        self._regexes: list[Sequence[CompiledRegex]] = []
+        for skill in registry.skills:
+            if self.backend.name == DEFAULT_BACKEND:
+                self._regexes.append(skill.regexes)
+                continue
+            compiled: list[CompiledRegex] = []
+            for pattern in skill.patterns:
+                try:
+                    compiled.append(self.backend.compile(pattern))
+                except self.backend.errors:
+                    compiled.append(registry.pattern_cache[pattern])
+                    fallbacks.append(pattern)
+            self._regexes.append(compiled)
+
+        # Skill name -> its regexes under this backend
+        self.regexes_by_skill: dict[str, Sequence[CompiledRegex]] = dict(zip(self.skills, self._regexes))
+        # Patterns matched with re because the backend rejected them
+        self.fallbacks = tuple(fallbacks)
+        if fallbacks:
+            logger.info(f"{len(fallbacks)} patterns fall back to re under the {self.backend.name} backend")
+
+    def match(self, text: str) -> list[str]:
+        """Names of the skills with a pattern match in text, in registry order"""
+        return [
+            name for name, regexes in zip(self.skills, self._regexes)
+            if any(regex.search(text) for regex in regexes)
+        ]
+
+
+def skill_matcher(registry: SkillRegistry, backend: str = DEFAULT_BACKEND) -> SkillMatcher:
+    """
+    The registry's matcher for a backend, built once per registry version.
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If the backend's module is not installed
+    """
+    return registry.derived(f"skill_matcher:{backend}", lambda registry: SkillMatcher(registry, backend))
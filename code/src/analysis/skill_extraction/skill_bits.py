@@ -0,0 +1,102 @@
+"""
+Skill sets as integer bitmasks
+Each skill of a reference is interned to a bit position (registry order),
+so a job's skills are one Python int: true/false positives and negatives
+are &, & ~ and bit_count() over whole sets instead of hashing names, and
+per-skill FP/FN counts over a batch only visit the set bits. Names outside
+the reference cannot have a bit and are carried next to the mask.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from .pattern_registry import SkillRegistry
+
+
+class SkillMask(NamedTuple):
+    """A set of skills: bits of reference skills plus any names outside the reference"""
+    bits: int
+    unknown: frozenset[str]
+
+
+class SkillBits:
+    """Skill name <-> bit position for one skills reference"""
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Args:
+            names: Skill names in column order (duplicates share the first one's bit)
+        """
+        positions: dict[str, int] = {}
+        column_bits: list[int] = []
+        for name in names:
+            column_bits.append(1 << positions.setdefault(name, len(positions)))
+        self.names = tuple(positions)  # Bit position -> name
+        self._bits = {name: 1 << position for name, position in positions.items()}
+        self._lower_bits: dict[str, int] = {}
+        for name, bit in self._bits.items():
+            self._lower_bits.setdefault(name.lower(), bit)
+        self._column_bits = column_bits
+
+    @classmethod
+    def for_registry(cls, registry: SkillRegistry) -> SkillBits:
+        """Bits of a registry's skills in file order (= CorpusMatcher columns), built once per version"""
+        return registry.derived("skill_bits", lambda r: cls(skill.name for skill in r.skills))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def bit(self, name: str) -> int:
+        """Bit of a skill name (0 if it is not in the reference)"""
+        return self._bits.get(name, 0)
+
+    def lower_bit(self, name: str) -> int:
+        """Bit of the reference skill matching name case-insensitively (0 if none)"""
+        return self._lower_bits.get(name.lower(), 0)
+
+    def encode(self, names: Iterable[str]) -> SkillMask:
+        """Mask of skill names (exact names)"""
+        bits = 0
+        unknown: list[str] = []
+        known = self._bits
+        for name in names:
+            bit = known.get(name)
+            if bit is None:
+                unknown.append(name)
+            else:
+                bits |= bit
+        return SkillMask(bits, frozenset(unknown))
+
+    def parse(self, skills: str) -> SkillMask:
+        """Mask of a comma-separated skills string, as the jobs table stores them"""
+        return self.encode(s.strip() for s in skills.split(",") if s.strip())
+
+    def from_columns(self, columns: Iterable[int]) -> int:
+        """Bits of skill columns (indices into the names this index was built from)"""
+        bits = 0
+        column_bits = self._column_bits
+        for column in columns:
+            bits |= column_bits[column]
+        return bits
+
+    def positions(self, bits: int) -> Iterator[int]:
+        """Set bit positions, lowest first"""
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def decode(self, bits: int) -> set[str]:
+        """Names of the set bits"""
+        names = self.names
+        return {names[position] for position in self.positions(bits)}
+
+    def count(self, bits: int, counts: list[int]) -> None:
+        """Add one to counts[position] for every set bit (counts has len(self) entries)"""
+        for position in self.positions(bits):
+            counts[position] += 1
+
+    def counts_by_name(self, counts: list[int]) -> dict[str, int]:
+        """Position counts -> name -> count, zero counts left out"""
+        return {name: count for name, count in zip(self.names, counts) if count}
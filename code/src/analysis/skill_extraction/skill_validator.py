@@ -1,71 +1,96 @@
 # Skill Validator - Reference-Only Extraction (EMD ≤80 lines)
 # Validates job descriptions against canonical 557 skills
 
-import json
 import re
-from typing import Dict, List, Set, Union
+from typing import Dict, List, Optional, Sequence, Set, Union
 from pathlib import Path
 
+from .extraction_result import ExtractionResult
+from .pattern_registry import get_skill_registry
+from .prepared_text import TextLike, prepare_text
+from .regex_backends import DEFAULT_BACKEND, CompiledRegex, skill_matcher
+from .skill_bits import SkillBits
+
 class SkillValidator:
     """Validates and extracts ONLY canonical skills from reference file"""
     
-    def __init__(self, reference_path: str):
+    def __init__(self, reference_path: str, regex_backend: str = DEFAULT_BACKEND):
         self.reference_path = Path(reference_path)
+        self.regex_backend = regex_backend  # see regex_backends.py
         self.canonical_skills: List[Dict[str, Union[str, List[str]]]] = []
-        self.skill_patterns: List[tuple[str, List[str]]] = []
+        self.skill_patterns: List[tuple[str, Sequence[re.Pattern[str]]]] = []
         self._load_reference()
     
     def _load_reference(self) -> None:
-        """Load 557 canonical skills with regex patterns"""
-        with open(self.reference_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            self.canonical_skills = data['skills']
+        """Load canonical skills with patterns compiled by the shared registry"""
+        registry = get_skill_registry(self.reference_path)
+        self.canonical_skills = registry.skills_reference
+        self.reference_hash = registry.content_hash
+        self.candidate_index = registry.skill_index
+        self.skill_bits = SkillBits.for_registry(registry)
             
-        # Build (skill_name, patterns) lookup
-        for skill in self.canonical_skills:
-            name = str(skill['name'])
-            patterns = list(skill['patterns']) if isinstance(skill['patterns'], list) else []
-            self.skill_patterns.append((name, patterns))
+        # Build (skill_name, compiled patterns) lookup; invalid patterns already dropped,
+        # regexes compiled by the registry on first use
+        for skill in registry.skills:
+            self.skill_patterns.append((skill.name, skill.regexes))
+        # The same patterns compiled by the chosen backend (re reuses the registry's)
+        self.skill_regexes: Dict[str, Sequence[CompiledRegex]] = skill_matcher(
+            registry, self.regex_backend
+        ).regexes_by_skill
     
-    def validate_and_extract(self, job_description: str) -> Set[str]:
-        """Extract ONLY skills matching canonical 557 patterns"""
+    def validate_and_extract(self, job_description: TextLike,
+                             extraction: Optional[ExtractionResult] = None) -> Set[str]:
+        """Extract ONLY skills matching canonical 557 patterns
+        
+        An extraction result of this description (same reference) already
+        holds them; patterns are searched only without one. Matching runs on
+        lowercased text, so only ASCII descriptions can reuse it. A
+        PreparedText lends its lowercased text and tokens.
+        """
         if not job_description:
             return set()
+        prepared = prepare_text(job_description)
+        
+        if extraction is not None and prepared.text.isascii():
+            detected = extraction.detected_in(prepared.text, self.reference_hash)
+            if detected is not None:
+                return set(detected)
         
         extracted_skills: Set[str] = set()
-        text = job_description.lower()
+        text = prepared.lower
         
-        # Match against canonical patterns ONLY
-        for skill_name, patterns in self.skill_patterns:
-            for pattern in patterns:
-                try:
-                    if re.search(pattern, text, re.IGNORECASE):
-                        extracted_skills.add(skill_name)
-                        break  # Found match, move to next skill
-                except re.error:
-                    continue  # Skip invalid patterns
+        # Match against canonical patterns ONLY, for skills whose anchor tokens occur
+        for skill in self.candidate_index.candidates_for_tokens(prepared.tokens):
+            for pattern in self.skill_regexes[skill.name]:
+                if pattern.search(text):
+                    extracted_skills.add(skill.name)
+                    break  # Found match, move to next skill
         
         return extracted_skills
     
     def calculate_accuracy(self, 
-                          job_description: str, 
-                          scraped_skills: str) -> Dict[str, Union[List[str], float]]:
+                          job_description: TextLike, 
+                          scraped_skills: str,
+                          extraction: Optional[ExtractionResult] = None) -> Dict[str, Union[List[str], float]]:
         """Calculate false positive/negative rates"""
-        canonical = self.validate_and_extract(job_description)
-        scraped = set([s.strip() for s in scraped_skills.split(',') if s.strip()])
+        bits = self.skill_bits
+        canonical = self.validate_and_extract(job_description, extraction)
+        canonical_bits = bits.encode(canonical).bits
+        scraped = bits.parse(scraped_skills)  # Names outside the reference are FPs
         
-        true_positives = canonical & scraped
-        false_positives = scraped - canonical
-        false_negatives = canonical - scraped
+        true_positives = canonical_bits & scraped.bits
+        false_positives = scraped.bits & ~canonical_bits
+        false_negatives = canonical_bits & ~scraped.bits
         
-        precision = len(true_positives) / len(scraped) if scraped else 0
-        recall = len(true_positives) / len(canonical) if canonical else 0
+        n_scraped = scraped.bits.bit_count() + len(scraped.unknown)
+        precision = true_positives.bit_count() / n_scraped if n_scraped else 0
+        recall = true_positives.bit_count() / len(canonical) if canonical else 0
         
         return {
             'canonical_skills': list(canonical),
-            'true_positives': list(true_positives),
-            'false_positives': list(false_positives),
-            'false_negatives': list(false_negatives),
+            'true_positives': list(bits.decode(true_positives)),
+            'false_positives': list(bits.decode(false_positives) | scraped.unknown),
+            'false_negatives': list(bits.decode(false_negatives)),
             'precision': round(precision, 2),
             'recall': round(recall, 2)
         }
@@ -9,7 +9,7 @@ import logging
 import os
 import random
 import re
-from typing import List, Optional, cast
+from typing import List, Optional
 
 from playwright.async_api import (
     Page,
@@ -28,6 +28,7 @@ from src.scraper.unified.linkedin.selector_config import (
     EXPIRED_JOB_INDICATORS,
     LOGIN_WALL_INDICATORS,
 )
+from src.scraper.unified.scalable.extraction_executor import get_extraction_executor
 from src.scraper.unified.scalable.user_agent_pool import get_random_user_agent
 
 logger = logging.getLogger(__name__)
@@ -292,34 +293,12 @@ async def scrape_single_job(
                 break
 
         # ===== SKILL EXTRACTION =====
-        extracted_skills_list = cast(
-            list[str],
-            skill_extractor.extract(job_description, return_confidence=False),
+        # Extract (deduped, top 15) + validate on the shared executor, off the event loop
+        extraction_executor = get_extraction_executor()
+        skills_result = await extraction_executor.extract_skills(
+            skill_extractor, skills_validator, job_description
         )
-
-        # Deduplicate skills
-        if extracted_skills_list:
-            seen_lower: set[str] = set()
-            unique_extracted: list[str] = []
-            for skill in extracted_skills_list:
-                skill_lower = skill.lower()
-                if skill_lower not in seen_lower:
-                    seen_lower.add(skill_lower)
-                    unique_extracted.append(skill)
-            extracted_skills_list = unique_extracted[:15]
-
-        extracted_skills = (
-            ", ".join(extracted_skills_list) if extracted_skills_list else ""
-        )
-
-        # Validate skills
-        validated_skills = ""
-        if extracted_skills.strip():
-            canonical_skills = skills_validator.validate_and_extract(job_description)
-            if canonical_skills:
-                validated_skills = ", ".join(sorted(canonical_skills))
-            else:
-                validated_skills = extracted_skills
+        validated_skills = skills_result.validated_skills
 
         # Parse date
         posted_date = parse_linkedin_date(posted_date_str) if posted_date_str else None
@@ -352,8 +331,11 @@ async def scrape_single_job(
 
         # Skill precision check
         if validated_skills:
-            accuracy_report = skills_validator.calculate_accuracy(
-                job.job_description, validated_skills
+            accuracy_report = await extraction_executor.run(
+                skills_validator.calculate_accuracy,
+                job.job_description,
+                validated_skills,
+                skills_result.extraction,
             )
             precision_val = accuracy_report.get("precision", 0.0)
             precision = (
@@ -630,6 +612,7 @@ async def scrape_job_details_concurrent(
     logger.info(f"   🔴 Rate limits hit:       {state.rate_limit_count}")
     logger.info(f"   📈 Success rate:          {success_rate:.1f}%")
     logger.info("=" * 60)
+    get_extraction_executor().log_metrics()
 
     return state.job_details
 
@@ -2,8 +2,9 @@
 
 import logging
 import re
-from typing import Tuple
+from typing import Optional, Tuple
 
+from src.analysis.skill_extraction.prepared_text import PreparedText, TextLike, prepare_text
 from src.models.models import JobDetailModel
 
 logger = logging.getLogger(__name__)
@@ -103,14 +104,14 @@ NON_ENGLISH_INDICATORS = {
 }
 
 
-def detect_non_english_language(text: str) -> tuple[bool, str]:
+def detect_non_english_language(text: TextLike) -> tuple[bool, str]:
     """
     Detect if text contains significant non-English content.
 
     Returns:
         (is_non_english, detected_language) - True if non-English detected
     """
-    text_lower = text.lower()
+    text_lower = prepare_text(text).lower
 
     for language, indicators in NON_ENGLISH_INDICATORS.items():
         # Count matches for this language
@@ -123,7 +124,7 @@ def detect_non_english_language(text: str) -> tuple[bool, str]:
     return False, ""
 
 
-def is_english_content(text: str, threshold: int | None = None) -> bool:
+def is_english_content(text: TextLike, threshold: int | None = None) -> bool:
     """
     Check if text is primarily in English using dual detection:
     1. Positive: Count English indicators
@@ -132,7 +133,7 @@ def is_english_content(text: str, threshold: int | None = None) -> bool:
     FIX FN-5: Uses ADAPTIVE threshold based on text length to prevent false negatives.
 
     Args:
-        text: Text to check
+        text: Text to check (or its PreparedText)
         threshold: Minimum English indicators (None = auto-calculate based on length)
 
     Returns:
@@ -141,11 +142,12 @@ def is_english_content(text: str, threshold: int | None = None) -> bool:
     if not text or len(text) < 50:
         return False
 
-    text_lower = text.lower()
+    prepared = prepare_text(text)
+    text_lower = prepared.lower
     text_len = len(text)
 
     # STEP 1: Check for non-English language patterns (fast rejection)
-    is_non_english, detected_lang = detect_non_english_language(text_lower)
+    is_non_english, detected_lang = detect_non_english_language(prepared)
     if is_non_english:
         logger.debug(f"Non-English detected: {detected_lang}")
         return False
@@ -175,16 +177,24 @@ class JobValidator:
         self.min_description_length = min_description_length
         self.max_skills = max_skills
 
-    def validate_job(self, job: JobDetailModel) -> Tuple[bool, str]:
-        """Validate single job - returns (is_valid, reason)"""
+    def validate_job(
+        self, job: JobDetailModel, description: Optional[PreparedText] = None
+    ) -> Tuple[bool, str]:
+        """Validate single job - returns (is_valid, reason)
+
+        description: PreparedText the scraper already built for job.job_description
+        (ignored if it holds a different text)
+        """
+        if description is None or description.text != job.job_description:
+            description = PreparedText(job.job_description or "")
 
         # Check 0: English language only (reject non-English jobs)
         # FIX FN-5: Use adaptive threshold (None = auto-calculate based on text length)
         if job.job_description:
-            is_non_english, detected_lang = detect_non_english_language(job.job_description.lower())
+            is_non_english, detected_lang = detect_non_english_language(description)
             if is_non_english:
                 return False, f"Non-English content detected ({detected_lang})"
-            if not is_english_content(job.job_description):
+            if not is_english_content(description):
                 return False, "Non-English content (insufficient English indicators)"
 
         # Check 1: Required fields present
@@ -202,7 +212,7 @@ class JobValidator:
             )
 
         # Check 2a: Placeholder content detection
-        desc_lower = job.job_description.lower()
+        desc_lower = description.lower
         for pattern in PLACEHOLDER_PATTERNS:
             if re.search(pattern, desc_lower, re.IGNORECASE):
                 return False, "Placeholder/test content detected in description"
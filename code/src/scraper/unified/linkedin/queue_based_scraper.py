@@ -35,6 +35,7 @@ from src.scraper.unified.linkedin.selector_config import (
     EXPIRED_JOB_INDICATORS,
     LOGIN_WALL_INDICATORS,
 )
+from src.scraper.unified.scalable.extraction_executor import get_extraction_executor
 from src.scraper.unified.scalable.user_agent_pool import get_random_user_agent
 
 logger = logging.getLogger(__name__)
@@ -100,6 +101,7 @@ class QueueBasedScraper:
         self.skills_validator = SkillValidator("src/config/skills_reference_2025.json")
         self.job_validator = JobValidator(min_description_length=100)
         self.db_ops = JobStorageOperations()
+        self.extraction_executor = get_extraction_executor()
 
         # Seen tracking for deduplication
         self.seen_urls: set[str] = set()
@@ -303,34 +305,11 @@ class QueueBasedScraper:
 
         posted_date = parse_linkedin_date(posted_date_str) if posted_date_str else None
 
-        # Extract and validate skills
-        extracted_result = self.skill_extractor.extract(
-            job_description, return_confidence=False
+        # Extract and validate skills (deduped, top 15) off the event loop
+        skills_result = await self.extraction_executor.extract_skills(
+            self.skill_extractor, self.skills_validator, job_description
         )
-        # Type narrow: when return_confidence=False, returns list[str]
-        extracted_skills: list[str] = []
-        for item in extracted_result:
-            if isinstance(item, str):
-                extracted_skills.append(item)
-
-        # Deduplicate skills
-        if extracted_skills:
-            seen_lower: set[str] = set()
-            unique_skills: list[str] = []
-            for skill in extracted_skills:
-                if skill.lower() not in seen_lower:
-                    seen_lower.add(skill.lower())
-                    unique_skills.append(skill)
-            extracted_skills = unique_skills[:15]
-
-        # Validate skills
-        validated_skills = ""
-        if extracted_skills:
-            canonical = self.skills_validator.validate_and_extract(job_description)
-            if canonical:
-                validated_skills = ", ".join(sorted(canonical))
-            else:
-                validated_skills = ", ".join(extracted_skills)
+        validated_skills = skills_result.validated_skills
 
         # Create job model
         job = JobDetailModel(
@@ -446,6 +425,7 @@ class QueueBasedScraper:
         logger.info(f"   🗑️ Expired/deleted:  {self.total_expired}")
         logger.info(f"   ❌ Failed:           {self.total_failed}")
         logger.info("=" * 60)
+        self.extraction_executor.log_metrics()
         logger.info("👷 Worker Statistics:")
         for wid, stats in sorted(self.worker_stats.items()):
             logger.info(
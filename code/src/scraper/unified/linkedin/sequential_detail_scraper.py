@@ -5,7 +5,7 @@ Anti-detection: 8 concurrent with adaptive throttling and user agent rotation
 import asyncio
 import logging
 import os
-from typing import List, Optional, cast
+from typing import List, Optional
 
 from playwright.async_api import (
     Browser,
@@ -33,6 +33,7 @@ from src.scraper.unified.linkedin.selector_config import (
 from src.scraper.unified.scalable.adaptive_rate_limiter import (
     AdaptiveLinkedInRateLimiter,
 )
+from src.scraper.unified.scalable.extraction_executor import get_extraction_executor
 from src.scraper.unified.scalable.user_agent_pool import get_random_user_agent
 
 logger = logging.getLogger(__name__)
@@ -57,6 +58,7 @@ async def scrape_job_details_sequential(
     )
     skills_validator = SkillValidator("src/config/skills_reference_2025.json")
     skill_extractor = AdvancedSkillExtractor("src/config/skills_reference_2025.json")
+    extraction_executor = get_extraction_executor()
     proxy_url = os.getenv("PROXY_URL")
     proxy_config = None
     if proxy_url:
@@ -446,49 +448,13 @@ async def scrape_job_details_sequential(
                     logger.warning(f"⏭️  Skipped {job_id} - empty description")
                     continue
 
-                # Extract skills from job description using 3-layer advanced extractor
-                extracted_skills_list = cast(
-                    list[str],
-                    skill_extractor.extract(job_description, return_confidence=False),
+                # Extract skills with the 3-layer extractor (deduped, top 15) and
+                # validate against canonical skills - on the shared executor so the
+                # event loop keeps serving the other concurrent tabs
+                skills_result = await extraction_executor.extract_skills(
+                    skill_extractor, skills_validator, job_description
                 )
-
-                # FIX FP-2: Deduplicate skills BEFORE validation (prevents inflated counts)
-                # Case-insensitive deduplication to remove "Python, PYTHON, python"
-                if extracted_skills_list:
-                    seen_lower: set[str] = set()
-                    unique_extracted: list[str] = []
-                    for skill in extracted_skills_list:
-                        skill_lower = skill.lower()
-                        if skill_lower not in seen_lower:
-                            seen_lower.add(skill_lower)
-                            unique_extracted.append(skill)
-
-                    original_extracted_count = len(extracted_skills_list)
-                    extracted_skills_list = unique_extracted[:15]  # Keep top 15
-                    if len(unique_extracted) < original_extracted_count:
-                        logger.debug(
-                            f"🔧 Pre-validation dedup: {original_extracted_count} → {len(unique_extracted)}"
-                        )
-
-                extracted_skills = (
-                    ", ".join(extracted_skills_list) if extracted_skills_list else ""
-                )
-
-                # Validate extracted skills against canonical skills
-                validated_skills = ""
-                if extracted_skills.strip():
-                    # SkillValidator.validate_and_extract returns Set[str], not tuple
-                    canonical_skills = skills_validator.validate_and_extract(
-                        job_description
-                    )
-                    if canonical_skills:
-                        # Deduplicate canonical skills as well (already a set, but ensure string dedup)
-                        validated_skills = ", ".join(sorted(canonical_skills))
-                    else:
-                        logger.debug(
-                            f"💡 {job_id} - no canonical matches, using extracted"
-                        )
-                        validated_skills = extracted_skills
+                validated_skills = skills_result.validated_skills
 
                 # Parse posted date from relative time string
                 posted_date = (
@@ -537,8 +503,11 @@ async def scrape_job_details_sequential(
 
                 # ✅ VALIDATION GATE 2: SkillValidator - False positive/negative accuracy
                 if validated_skills:
-                    accuracy_report = skills_validator.calculate_accuracy(
-                        job.job_description, validated_skills
+                    accuracy_report = await extraction_executor.run(
+                        skills_validator.calculate_accuracy,
+                        job.job_description,
+                        validated_skills,
+                        skills_result.extraction,
                     )
                     precision_val = accuracy_report.get("precision", 0.0)
                     recall_val = accuracy_report.get("recall", 0.0)
@@ -656,5 +625,6 @@ async def scrape_job_details_sequential(
     )
     logger.info(f"   📈 Success rate:         {success_rate:.1f}%")
     logger.info("=" * 60)
+    extraction_executor.log_metrics()
 
     return job_details
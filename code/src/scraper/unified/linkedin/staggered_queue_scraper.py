@@ -34,8 +34,8 @@ from playwright.async_api import (
 )
 
 from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
-from src.analysis.skill_extraction.skill_validator import SkillValidator
-from src.validation.single_job_validator import SingleJobValidator, ValidationResult
+from src.analysis.skill_extraction.prepared_text import PreparedText
+from src.validation.single_job_validator import SingleJobValidator
 from src.db.operations import JobStorageOperations
 from src.models.models import JobDetailModel
 from src.scraper.unified.linkedin.date_parser import parse_linkedin_date
@@ -47,10 +47,14 @@ from src.scraper.unified.linkedin.selector_config import (
     DETAIL_SELECTORS,
     EXPIRED_JOB_INDICATORS,
 )
+from src.scraper.unified.scalable.extraction_executor import get_extraction_executor
 from src.scraper.unified.scalable.user_agent_pool import get_random_user_agent
 
 logger = logging.getLogger(__name__)
 
+STORED_DESCRIPTION_CHARS = 5000  # job_description is stored (and validated) truncated to this
+PATTERN_TIME_BUDGET = 0.05  # CPU seconds a skill pattern may take on one description before it is stopped there
+
 
 def emit_progress(event_type: str, data: dict[str, Union[str, int, float, bool, None, dict[str, int]]]) -> None:
     """Emit progress event as JSON line to stdout for real-time UI updates"""
@@ -275,15 +279,18 @@ class RoundRobinScraper:
 
         # Validators
         self.skill_extractor = AdvancedSkillExtractor(
-            "src/config/skills_reference_2025.json"
+            "src/config/skills_reference_2025.json", pattern_time_budget=PATTERN_TIME_BUDGET
         )
-        self.skills_validator = SkillValidator("src/config/skills_reference_2025.json")
         self.job_validator = JobValidator(min_description_length=100)
         self.db_ops = JobStorageOperations()
 
-        # 7-Layer Single Job Validator - validates and fixes skills after each job
+        # 7-Layer Single Job Validator - its pattern detection on the stored description
+        # decides the final skills, computed in the same pass as extraction
         self.single_job_validator = SingleJobValidator("src/config/skills_reference_2025.json")
 
+        # CPU-bound extraction/validation runs here, never on the event loop
+        self.extraction_executor = get_extraction_executor()
+
     async def _wait_for_rate_limit(self) -> float:
         """Check if we're in a rate limit backoff period.
 
@@ -563,37 +570,6 @@ class RoundRobinScraper:
             if stored > 0:
                 await asyncio.to_thread(self.db_ops.mark_urls_scraped, [task.url])
 
-                # ═══════════════════════════════════════════════════════════════════
-                # 7-LAYER VALIDATION: Validate and fix skills after storing
-                # Layers: FP detection, FN detection, context validation
-                # ═══════════════════════════════════════════════════════════════════
-                validation_result: ValidationResult = await asyncio.to_thread(
-                    self.single_job_validator.validate_and_fix,
-                    task.job_id,
-                    job.job_description or "",
-                    job.skills or ""
-                )
-
-                if validation_result.was_modified:
-                    # Update skills in database with validated skills
-                    validated_skills_str = self.single_job_validator.get_validated_skills_string(validation_result)
-                    await asyncio.to_thread(
-                        self.db_ops.update_job_skills,
-                        task.job_id,
-                        validated_skills_str
-                    )
-                    job.skills = validated_skills_str  # Update local object too
-
-                    # Emit validation event for UI
-                    emit_progress("job_validated", {
-                        "slot_id": slot_id,
-                        "job_id": task.job_id[:20],
-                        "fp_removed": len(validation_result.false_positives_removed),
-                        "fn_added": len(validation_result.false_negatives_added),
-                        "log": validation_result.validation_log[:80]
-                    })
-                    logger.info(f"🔧 Slot {slot_id}: Validated - {validation_result.validation_log}")
-
                 async with self.results_lock:
                     self.results.append(job)
                     self.total_success += 1
@@ -842,19 +818,23 @@ class RoundRobinScraper:
 
         # Extract description (with timeout - slightly longer for description)
         job_description = await safe_query_text(DETAIL_SELECTORS["description"], timeout=3.0)
+        # Built once; the language checks, extraction and validation share its views
+        description: Optional[PreparedText] = None
         if job_description:
             job_description = html.unescape(job_description)
-            job_description = re.sub(r"<[^>]+>", " ", job_description)
-            job_description = re.sub(r"&[a-zA-Z]+;", " ", job_description)
-            job_description = " ".join(job_description.split())
+            if "<" in job_description:
+                job_description = re.sub(r"<[^>]+>", " ", job_description)
+            if "&" in job_description:
+                job_description = re.sub(r"&[a-zA-Z]+;", " ", job_description)
+            description = PreparedText(job_description).collapsed
+            job_description = description.text
 
             # ═══════════════════════════════════════════════════════════════════
             # LANGUAGE CHECK: Only check the JOB DESCRIPTION, not the page
             # This allows collecting English jobs from non-English country sites
             # (e.g., German/French/Spanish LinkedIn with English job postings)
             # ═══════════════════════════════════════════════════════════════════
-            desc_sample = job_description[:1500] if len(job_description) > 1500 else job_description
-            is_non_english, detected_lang = detect_non_english_language(desc_sample.lower())
+            is_non_english, detected_lang = detect_non_english_language(description.head(1500))
             if is_non_english:
                 logger.info(f"🌐 Skipping non-English JOB DESCRIPTION ({detected_lang}): {task.url[:50]}...")
                 raise ExpiredJobError(f"Non-English job description ({detected_lang})")
@@ -912,33 +892,16 @@ class RoundRobinScraper:
         posted_date_str = await safe_query_text(DETAIL_SELECTORS["posted_date"])
         posted_date = parse_linkedin_date(posted_date_str) if posted_date_str else None
 
-        # Extract skills (return_confidence=False returns list[str])
-        extracted_skills_raw = self.skill_extractor.extract(
-            job_description, return_confidence=False
+        # Extract + validate skills off the event loop (other slots keep navigating).
+        # One pass over the stored text gives the skills the 7-layer validation
+        # (FP removal + FN addition) would settle on, so they are stored as is
+        stored_description = description.head(STORED_DESCRIPTION_CHARS) if description else None
+        skills_result = await self.extraction_executor.extract_skills_fused(
+            self.skill_extractor,
+            self.single_job_validator,
+            stored_description or job_description[:STORED_DESCRIPTION_CHARS],
         )
-        # Convert to list[str] - when return_confidence=False, items are strings
-        extracted_skills: list[str] = [
-            str(s) if isinstance(s, str) else s[0]
-            for s in extracted_skills_raw
-        ] if extracted_skills_raw else []
-
-        if extracted_skills:
-            seen_lower: set[str] = set()
-            unique_skills: list[str] = []
-            for skill in extracted_skills:
-                if skill.lower() not in seen_lower:
-                    seen_lower.add(skill.lower())
-                    unique_skills.append(skill)
-            extracted_skills = unique_skills[:15]
-
-        validated_skills = ""
-        if extracted_skills:
-            canonical = self.skills_validator.validate_and_extract(job_description)
-            validated_skills = (
-                ", ".join(sorted(canonical))
-                if canonical
-                else ", ".join(extracted_skills)
-            )
+        validated_skills = skills_result.validated_skills
 
         # Create job model
         job = JobDetailModel(
@@ -946,14 +909,14 @@ class RoundRobinScraper:
             platform=task.platform,
             actual_role=job_title,
             url=task.url,
-            job_description=job_description[:5000],
+            job_description=job_description[:STORED_DESCRIPTION_CHARS],
             skills=validated_skills,
             company_name=company_name,
             posted_date=posted_date,
         )
 
         # Validate
-        is_valid, reason = self.job_validator.validate_job(job)
+        is_valid, reason = self.job_validator.validate_job(job, stored_description)
         if not is_valid:
             if "Non-English" in reason:
                 raise ExpiredJobError(f"Non-English: {reason}")
@@ -1665,6 +1628,7 @@ class RoundRobinScraper:
         logger.info(f"   ❌ Failed:        {self.total_failed}")
         logger.info(f"   🔄 Retried:       {self.total_retried}")
         logger.info("=" * 60)
+        self.extraction_executor.log_metrics()
 
         # Emit finish event
         emit_progress("scraper_finish", {
@@ -4,6 +4,7 @@ Platform-specific rate limiters based on real-world constraints (2025 research).
 """
 from .batch_processor import BatchProcessor
 from .checkpoint_manager import CheckpointManager
+from .extraction_executor import ExtractionExecutor, get_extraction_executor
 from .progress_tracker import ProgressTracker
 from .rate_limiters import (
     IndeedRateLimiter,
@@ -15,6 +16,8 @@ from .rate_limiters import (
 __all__ = [
     "BatchProcessor",
     "CheckpointManager",
+    "ExtractionExecutor",
+    "get_extraction_executor",
     "ProgressTracker",
     "IndeedRateLimiter",
     "LinkedInRateLimiter",
@@ -0,0 +1,283 @@
+"""Shared extraction executor for the async detail scrapers
+
+Skill extraction and validation are CPU-bound regex work. Running them
+inline in a scraper coroutine stalls every other slot's navigation and
+timeouts, so scrapers await this executor instead:
+- Bounded worker thread pool (never blocks the event loop)
+- Bounded queue: callers wait for a slot when too many calls are pending (backpressure)
+- Per-call timing (queue wait + run time) aggregated into metrics
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Protocol, TypedDict, TypeVar
+
+from src.analysis.skill_extraction.extraction_result import ExtractionResult
+from src.analysis.skill_extraction.prepared_text import TextLike, prepare_text
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MAX_EXTRACTED_SKILLS = 15
+SLOW_CALL_SECONDS = 1.0  # Warn when a single call runs longer than this
+
+
+class SkillExtractorLike(Protocol):
+    """What the executor needs from AdvancedSkillExtractor"""
+    def extract_result(self, job_description: TextLike) -> ExtractionResult: ...
+
+
+class SkillValidatorLike(Protocol):
+    """What the executor needs from SkillValidator"""
+    def validate_and_extract(
+        self, job_description: TextLike, extraction: ExtractionResult | None = None
+    ) -> set[str]: ...
+
+
+class SingleJobValidatorLike(Protocol):
+    """What the fused pipeline needs from SingleJobValidator"""
+    reference_hash: str
+
+    def detect_skills_in_text(self, text: str) -> set[str]: ...
+
+
+@dataclass(frozen=True)
+class SkillExtractionResult:
+    """Skills for one description, as the detail scrapers store them"""
+    extracted_skills: list[str]  # Case-insensitively unique, at most MAX_EXTRACTED_SKILLS
+    validated_skills: str        # Comma-separated canonical skills (or extracted if none)
+    # Spans and detected skills of the description, for later validation without a rescan
+    extraction: ExtractionResult | None = None
+
+
+class ExecutorMetrics(TypedDict):
+    """Aggregated per-call timings"""
+    calls: int
+    failed: int
+    timed_out: int
+    in_flight: int
+    peak_in_flight: int
+    avg_wait_ms: float
+    max_wait_ms: float
+    avg_run_ms: float
+    max_run_ms: float
+
+
+def extract_and_validate(
+    extractor: SkillExtractorLike,
+    validator: SkillValidatorLike,
+    job_description: TextLike,
+) -> SkillExtractionResult:
+    """Extract, dedupe (top 15) and validate skills - synchronous, runs in the pool"""
+    # The validator reads what the extraction pass detected instead of searching again,
+    # and both share the normalized text's views
+    job_description = prepare_text(job_description or "").normalized
+    extraction = extractor.extract_result(job_description)
+    extracted_skills = _unique_skills(extraction.skill_names)
+
+    validated_skills = ""
+    if extracted_skills:
+        canonical = validator.validate_and_extract(job_description, extraction)
+        validated_skills = (
+            ", ".join(sorted(canonical)) if canonical else ", ".join(extracted_skills)
+        )
+
+    return SkillExtractionResult(extracted_skills, validated_skills, extraction)
+
+
+def extract_and_validate_fused(
+    extractor: SkillExtractorLike,
+    validator: SingleJobValidatorLike,
+    stored_description: TextLike,
+) -> SkillExtractionResult:
+    """
+    The skills extract_and_validate followed by SingleJobValidator.validate_and_fix
+    settle on, from ONE extraction pass - synchronous, runs in the pool.
+
+    validate_and_fix replaces the validated skills with the reference skills its
+    patterns find in the stored description (reference skills it does not find are
+    dropped, ones it finds are added), so those are detected directly: extraction
+    runs on the stored text and its detected skills are the validated skills.
+    """
+    stored_description = prepare_text(stored_description or "").normalized
+    extraction = extractor.extract_result(stored_description)
+    detected = extraction.detected_in(stored_description.text, validator.reference_hash)
+    if detected is None:  # Extracted with another reference than the validator's
+        detected = validator.detect_skills_in_text(stored_description.text)
+
+    return SkillExtractionResult(
+        _unique_skills(extraction.skill_names), ", ".join(sorted(detected)), extraction
+    )
+
+
+def _unique_skills(skills: list[str]) -> list[str]:
+    """Case-insensitive deduplication to remove "Python, PYTHON, python" (top 15)"""
+    seen_lower: set[str] = set()
+    unique_skills: list[str] = []
+    for skill in skills:
+        if skill.lower() not in seen_lower:
+            seen_lower.add(skill.lower())
+            unique_skills.append(skill)
+    return unique_skills[:MAX_EXTRACTED_SKILLS]
+
+
+class ExtractionExecutor:
+    """Bounded thread pool that async scrapers await for CPU-bound work"""
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 8, timeout: float | None = None):
+        """
+        Args:
+            max_workers: Threads running extraction
+            max_pending: Calls queued or running at once; further callers wait
+            timeout: Seconds a caller waits for its result (None = no limit)
+        """
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="skill-extract")
+        # One semaphore per event loop: scrapers may run several asyncio.run() in one process
+        self._slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+        self._max_run = 0.0
+
+    def _loop_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_pending)
+        return slots
+
+    def _timed(self, fn: Callable[..., T], args: tuple[Any, ...], name: str) -> T:
+        """Runs in a pool thread: call fn and record how long it took"""
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = fn(*args)
+            failed = False
+            return result
+        finally:
+            # Counted here, not on the loop: the loop may be gone once a timed-out call ends
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._in_flight -= 1
+                self._failed += failed
+                self._total_run += elapsed
+                self._max_run = max(self._max_run, elapsed)
+            if elapsed > SLOW_CALL_SECONDS:
+                logger.warning(f"Slow extraction call {name}: {elapsed:.2f}s")
+
+    async def run(self, fn: Callable[..., T], *args: object) -> T:
+        """Run fn(*args) in the pool, waiting for a free slot first (backpressure)"""
+        slots = self._loop_slots()
+        queued_at = time.perf_counter()
+        await slots.acquire()
+        wait = time.perf_counter() - queued_at
+
+        with self._lock:
+            self._calls += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+        loop = asyncio.get_running_loop()
+        name = getattr(fn, "__qualname__", repr(fn))
+        try:
+            future = loop.run_in_executor(self._pool, self._timed, fn, args, name)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            slots.release()
+            raise
+
+        def release(done: asyncio.Future[T]) -> None:
+            # The slot is held until the thread finishes, even if the caller gave up
+            if not done.cancelled():
+                done.exception()  # Retrieved: a timed-out caller never awaits it
+            slots.release()
+
+        future.add_done_callback(release)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            raise
+
+    async def extract_skills(
+        self,
+        extractor: SkillExtractorLike,
+        validator: SkillValidatorLike,
+        job_description: TextLike,
+    ) -> SkillExtractionResult:
+        """Extract and validate skills for one description off the event loop"""
+        return await self.run(extract_and_validate, extractor, validator, job_description)
+
+    async def extract_skills_fused(
+        self,
+        extractor: SkillExtractorLike,
+        validator: SingleJobValidatorLike,
+        stored_description: TextLike,
+    ) -> SkillExtractionResult:
+        """Final validated skills of a stored description in one pass, off the event loop"""
+        return await self.run(extract_and_validate_fused, extractor, validator, stored_description)
+
+    def metrics(self) -> ExecutorMetrics:
+        """Snapshot of the per-call timings so far"""
+        with self._lock:
+            calls = self._calls or 1
+            return {
+                "calls": self._calls,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "avg_wait_ms": self._total_wait / calls * 1000,
+                "max_wait_ms": self._max_wait * 1000,
+                "avg_run_ms": self._total_run / calls * 1000,
+                "max_run_ms": self._max_run * 1000,
+            }
+
+    def log_metrics(self) -> None:
+        """Log the metrics snapshot"""
+        m = self.metrics()
+        logger.info(
+            f"Extraction executor: {m['calls']} calls, {m['failed']} failed, {m['timed_out']} timed out | "
+            f"wait avg {m['avg_wait_ms']:.1f}ms max {m['max_wait_ms']:.1f}ms | "
+            f"run avg {m['avg_run_ms']:.1f}ms max {m['max_run_ms']:.1f}ms | peak {m['peak_in_flight']}"
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued calls finish"""
+        self._pool.shutdown(wait=True)
+
+
+_shared_executor: ExtractionExecutor | None = None
+_shared_lock = threading.Lock()
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """Process-wide executor shared by every scraper"""
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = ExtractionExecutor()
+        return _shared_executor
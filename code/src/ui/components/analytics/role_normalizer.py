@@ -3,7 +3,11 @@
 
 import json
 import re
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# resolved path -> (mtime_ns, size, compiled patterns), shared by every instance
+_compiled_references: Dict[str, Tuple[int, int, Dict[str, List[re.Pattern[str]]]]] = {}
 
 class RoleNormalizer:
     """Normalizes job roles using pattern matching from reference file"""
@@ -14,9 +18,16 @@ class RoleNormalizer:
         self._load_patterns()
     
     def _load_patterns(self) -> None:
-        """Load and compile regex patterns from reference file"""
+        """Load and compile regex patterns from reference file (once per file version)"""
         try:
-            with open(self.reference_file, 'r', encoding='utf-8') as f:
+            path = str(Path(self.reference_file).resolve())
+            stat = Path(path).stat()
+            cached = _compiled_references.get(path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self.role_patterns = cached[2]
+                return
+            
+            with open(path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
             for role_config in data.get('roles', []):
@@ -26,6 +37,7 @@ class RoleNormalizer:
                     for pattern in role_config['patterns']
                 ]
                 self.role_patterns[name] = patterns
+            _compiled_references[path] = (stat.st_mtime_ns, stat.st_size, self.role_patterns)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Warning: Could not load role reference file: {e}")
             self.role_patterns = {}
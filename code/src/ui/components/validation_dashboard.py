@@ -1,16 +1,21 @@
 """
 Validation Dashboard Component
 Full batch validation and fix for all jobs in database
-Uses Node.js for speed (~60+ jobs/sec)
+Detection runs on a process pool (~230 jobs/sec measured with one worker)
+Past runs are read back from the validation history tables
 """
 
-import json
 import sqlite3
-import subprocess
-from pathlib import Path
 
 import streamlit as st
 
+from src.validation.batch_validation import BatchValidationStats, ProgressCallback, validate_jobs_table
+from src.validation.validation_history import recent_runs, skill_history
+
+# Measured single-worker batch validation throughput. Extra workers add only
+# ~15% (265 jobs/sec with two), so the estimate does not scale with CPU count
+BATCH_JOBS_PER_SECOND = 230
+
 
 def get_job_count(db_path: str) -> int:
     """Get total job count with descriptions"""
@@ -25,174 +30,21 @@ def get_job_count(db_path: str) -> int:
 def run_batch_validation(
     db_path: str,
     skills_ref_path: str,
-    progress_callback,
+    progress_callback: ProgressCallback,
     batch_size: int = 500,
-) -> dict:
+    workers: int | None = None,
+    incremental: bool = True,
+) -> BatchValidationStats:
     """
-    Run batch validation using Node.js for speed.
+    Run batch validation on a process pool (one worker per CPU by default).
+    Incremental runs skip jobs unchanged since they were last validated.
     Returns stats dict with FP/FN counts.
     """
-    # Node.js script for batch validation with progress
-    node_script = f"""
-const fs = require('fs');
-const Database = require('better-sqlite3');
-
-const skillsData = JSON.parse(fs.readFileSync('{skills_ref_path}', 'utf8'));
-
-// Build skill pattern map
-const skillPatterns = [];
-for (const skill of skillsData.skills) {{
-    const regexes = [];
-    for (const p of skill.patterns || []) {{
-        try {{ regexes.push(new RegExp(p, 'i')); }} catch (e) {{}}
-    }}
-    if (regexes.length) {{
-        skillPatterns.push({{ name: skill.name, regexes }});
-    }}
-}}
-
-function findSkillsInText(text) {{
-    const found = new Set();
-    for (const {{ name, regexes }} of skillPatterns) {{
-        for (const r of regexes) {{
-            if (r.test(text)) {{
-                found.add(name);
-                break;
-            }}
-        }}
-    }}
-    return found;
-}}
-
-const db = new Database('{db_path}');
-const totalCount = db.prepare('SELECT COUNT(*) as c FROM jobs WHERE job_description IS NOT NULL').get().c;
-
-const selectStmt = db.prepare('SELECT job_id, job_description, skills FROM jobs WHERE job_description IS NOT NULL');
-const updateStmt = db.prepare('UPDATE jobs SET skills = ? WHERE job_id = ?');
-
-let processed = 0;
-let updated = 0;
-let totalFpRemoved = 0;
-let totalFnAdded = 0;
-const fpCounts = {{}};
-const fnCounts = {{}};
-
-db.exec('BEGIN');
-
-for (const job of selectStmt.iterate()) {{
-    const jobDesc = job.job_description || '';
-    const oldSkills = new Set((job.skills || '').split(',').map(s => s.trim()).filter(s => s));
-    const patternMatchedSkills = findSkillsInText(jobDesc);
-
-    const falsePositives = [...oldSkills].filter(s => !patternMatchedSkills.has(s));
-    const falseNegatives = [...patternMatchedSkills].filter(s => !oldSkills.has(s));
-
-    for (const fp of falsePositives) {{
-        fpCounts[fp] = (fpCounts[fp] || 0) + 1;
-        totalFpRemoved++;
-    }}
-    for (const fn of falseNegatives) {{
-        fnCounts[fn] = (fnCounts[fn] || 0) + 1;
-        totalFnAdded++;
-    }}
-
-    const newSkills = [...patternMatchedSkills].sort().join(', ');
-    const oldSkillsStr = [...oldSkills].sort().join(', ');
-
-    if (newSkills !== oldSkillsStr) {{
-        updateStmt.run(newSkills, job.job_id);
-        updated++;
-    }}
-
-    processed++;
-
-    if (processed % {batch_size} === 0) {{
-        console.log(JSON.stringify({{
-            type: 'progress',
-            processed,
-            total: totalCount,
-            updated,
-            fpRemoved: totalFpRemoved,
-            fnAdded: totalFnAdded
-        }}));
-    }}
-}}
-
-db.exec('COMMIT');
-db.close();
-
-// Top 10 FP and FN
-const topFps = Object.entries(fpCounts).sort((a, b) => b[1] - a[1]).slice(0, 10);
-const topFns = Object.entries(fnCounts).sort((a, b) => b[1] - a[1]).slice(0, 10);
-
-console.log(JSON.stringify({{
-    type: 'complete',
-    processed,
-    total: totalCount,
-    updated,
-    fpRemoved: totalFpRemoved,
-    fnAdded: totalFnAdded,
-    topFps,
-    topFns
-}}));
-"""
-
-    # Run Node.js script
-    code_dir = Path(db_path).parent.parent
-    process = subprocess.Popen(
-        ["node", "-e", node_script],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        cwd=str(code_dir),
+    return validate_jobs_table(
+        db_path, skills_ref_path, progress_callback, batch_size=batch_size, workers=workers,
+        incremental=incremental,
     )
 
-    result = {
-        "processed": 0,
-        "total": 0,
-        "updated": 0,
-        "fpRemoved": 0,
-        "fnAdded": 0,
-        "topFps": [],
-        "topFns": [],
-        "error": None,
-    }
-
-    # Read output line by line for progress updates
-    for line in process.stdout:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            if data.get("type") == "progress":
-                progress_callback(
-                    data["processed"],
-                    data["total"],
-                    data["updated"],
-                    data["fpRemoved"],
-                    data["fnAdded"],
-                )
-            elif data.get("type") == "complete":
-                result = data
-                progress_callback(
-                    data["processed"],
-                    data["total"],
-                    data["updated"],
-                    data["fpRemoved"],
-                    data["fnAdded"],
-                )
-        except json.JSONDecodeError:
-            pass
-
-    process.wait()
-
-    if process.returncode != 0:
-        stderr = process.stderr.read()
-        result["error"] = stderr
-
-    return result
-
 
 def render_validation_dashboard(db_path: str) -> None:
     """Render the validation dashboard UI"""
@@ -206,7 +58,7 @@ def render_validation_dashboard(db_path: str) -> None:
     with col1:
         st.metric("Total Jobs with Descriptions", f"{job_count:,}")
     with col2:
-        est_time = job_count / 60  # ~60 jobs/sec
+        est_time = job_count / BATCH_JOBS_PER_SECOND
         st.metric("Estimated Time", f"~{est_time:.0f} seconds")
 
     st.divider()
@@ -221,6 +73,11 @@ def render_validation_dashboard(db_path: str) -> None:
     3. Update the database with corrected skills
     """
     )
+    incremental = st.checkbox(
+        "Only jobs new or changed since the last validation",
+        value=True,
+        help="Jobs are revisited when their skills change or the skills reference is updated",
+    )
 
     # Initialize session state for results
     if "validation_results" not in st.session_state:
@@ -256,7 +113,7 @@ def render_validation_dashboard(db_path: str) -> None:
         # Run validation
         skills_ref = "src/config/skills_reference_2025.json"
         results = run_batch_validation(
-            db_path, skills_ref, update_progress, batch_size=500
+            db_path, skills_ref, update_progress, batch_size=500, incremental=incremental
         )
 
         st.session_state.validation_results = results
@@ -267,7 +124,8 @@ def render_validation_dashboard(db_path: str) -> None:
         else:
             progress_bar.progress(1.0, text="Validation complete!")
             status_container.success(
-                f"Validated {results['processed']:,} jobs in database!"
+                f"Validated {results['processed']:,} jobs in database "
+                f"({results.get('skipped', 0):,} unchanged skipped)!"
             )
 
     # Display results if available
@@ -279,11 +137,12 @@ def render_validation_dashboard(db_path: str) -> None:
             st.subheader("Validation Results")
 
             # Summary metrics
-            col1, col2, col3, col4 = st.columns(4)
+            col1, col2, col3, col4, col5 = st.columns(5)
             col1.metric("Total Processed", f"{results.get('processed', 0):,}")
-            col2.metric("Jobs Updated", f"{results.get('updated', 0):,}")
-            col3.metric("FP Removed", f"{results.get('fpRemoved', 0):,}")
-            col4.metric("FN Added", f"{results.get('fnAdded', 0):,}")
+            col2.metric("Skipped (Unchanged)", f"{results.get('skipped', 0):,}")
+            col3.metric("Jobs Updated", f"{results.get('updated', 0):,}")
+            col4.metric("FP Removed", f"{results.get('fpRemoved', 0):,}")
+            col5.metric("FN Added", f"{results.get('fnAdded', 0):,}")
 
             # Top FP and FN tables
             col_fp, col_fn = st.columns(2)
@@ -310,3 +169,42 @@ def render_validation_dashboard(db_path: str) -> None:
             if st.button("Clear Results"):
                 st.session_state.validation_results = None
                 st.rerun()
+
+    render_validation_history(db_path)
+
+
+def render_validation_history(db_path: str) -> None:
+    """Past validation runs and one skill's FP/FN trend across them"""
+    conn = sqlite3.connect(db_path)
+    try:
+        runs = recent_runs(conn, limit=50)
+        if not runs:
+            return
+        st.divider()
+        st.subheader("Validation History")
+        st.dataframe(
+            [{
+                "Run": run["run_id"], "Kind": run["kind"], "Finished": run["finished_at"],
+                "Jobs": run["jobs_validated"], "Skipped": run["jobs_skipped"],
+                "FP": run["false_positives"], "FN": run["false_negatives"],
+                "Precision": round(run["precision"], 4), "Recall": round(run["recall"], 4),
+                "F1": round(run["f1_score"], 4),
+            } for run in runs],
+            use_container_width=True, hide_index=True,
+        )
+
+        skill = st.text_input("Skill trend", placeholder="e.g. Apache Spark")
+        if skill:
+            history = skill_history(conn, skill.strip())
+            if history:
+                st.line_chart(
+                    {
+                        "FP": [row.false_positives for row in history],
+                        "FN": [row.false_negatives for row in history],
+                    },
+                )
+                st.caption(f"{len(history)} runs, from run {history[0].run_id} to run {history[-1].run_id}")
+            else:
+                st.info(f"No recorded FP/FN/TP for '{skill}'")
+    finally:
+        conn.close()
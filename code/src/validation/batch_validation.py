@@ -0,0 +1,211 @@
+"""
+Batch FP/FN validation and fix of the whole jobs table
+Every job's skills are replaced by the reference skills its description
+matches (JS-semantics patterns, as the Node validator matched them). Jobs
+stream in job_id pages, detection runs chunk by chunk on a process pool whose
+workers build the corpus matcher once, and corrections are written in one
+transaction per batch. Per-skill FP/FN counters are kept on skill bitmasks.
+Incremental runs only revisit jobs that are new, whose skills changed since
+they were validated or that were validated with another reference. Every run
+that writes is added to the validation history with its per-skill counts.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from typing import TypedDict
+
+from src.analysis.skill_extraction.corpus_matcher import CorpusMatcher
+from src.analysis.skill_extraction.job_stream import SkillUpdateWriter, count_jobs, iter_jobs
+from src.analysis.skill_extraction.parallel_extraction import ChunkExtractFn, extract_chunks_parallel
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.skill_bits import SkillBits
+from src.validation.realtime_validator import python_semantics_agree, validate_skills_in_process
+from src.validation.validation_history import SkillCounts, ValidationRun, record_run, skill_counts
+from src.validation.validation_state import ValidationState
+
+logger = logging.getLogger(__name__)
+
+VALIDATOR_NAME = "batch_fix"
+
+# processed, total, updated, FPs removed, FNs added
+ProgressCallback = Callable[[int, int, int, int, int], None]
+
+
+class BatchValidationStats(TypedDict):
+    """Outcome of a batch validation run (keys as the dashboard reads them)"""
+    processed: int
+    total: int
+    skipped: int
+    updated: int
+    fpRemoved: int
+    fnAdded: int
+    topFps: list[tuple[str, int]]
+    topFns: list[tuple[str, int]]
+    error: str | None
+
+
+def js_skill_detector(skills_ref_path: str) -> ChunkExtractFn:
+    """
+    Worker factory: descriptions -> reference skills each one matches, sorted.
+    A chunk is matched at once by the corpus matcher (plain regexes); the few
+    descriptions where Python and JS regex semantics can differ are re-run
+    through the JS-semantics validator.
+    """
+    registry = get_skill_registry(skills_ref_path)
+    matcher = CorpusMatcher(registry)
+
+    def detect(texts: list[str]) -> list[list[str]]:
+        matrix = matcher.match((str(row), text) for row, text in enumerate(texts))
+        return [
+            sorted(matrix.row(row)) if python_semantics_agree(text, registry)
+            else validate_skills_in_process(text, skills_ref_path)
+            for row, text in enumerate(texts)
+        ]
+
+    return detect
+
+
+def validate_jobs_table(
+    db_path: str,
+    skills_ref_path: str,
+    progress_callback: ProgressCallback | None = None,
+    batch_size: int = 500,
+    workers: int | None = None,
+    dry_run: bool = False,
+    incremental: bool = True,
+) -> BatchValidationStats:
+    """
+    Re-detect every job's skills, count FPs/FNs and write corrected skills.
+
+    Args:
+        db_path: Jobs database
+        skills_ref_path: Skills reference JSON
+        progress_callback: Called after every batch and once at the end
+        batch_size: Jobs per progress report and per write transaction
+        workers: Detection processes; None/0 = CPU count, 1 = in-process
+        dry_run: Count but never write (validation records and history included)
+        incremental: Skip jobs validated since their skills last changed, with this reference
+
+    Returns:
+        Stats (`total` counts the jobs to process, `skipped` the up-to-date
+        ones); `error` holds the message if the run failed
+    """
+    stats: BatchValidationStats = {
+        "processed": 0,
+        "total": 0,
+        "skipped": 0,
+        "updated": 0,
+        "fpRemoved": 0,
+        "fnAdded": 0,
+        "topFps": [],
+        "topFns": [],
+        "error": None,
+    }
+    batch_size = max(1, batch_size)
+    started_at = datetime.now()
+
+    try:
+        registry = get_skill_registry(skills_ref_path)
+        bits = SkillBits.for_registry(registry)
+        true_positives = 0  # Stored skills the detector confirms
+        tp_per_skill = [0] * len(bits)
+        fp_per_skill = [0] * len(bits)
+        fn_per_skill = [0] * len(bits)
+        unknown_fps: dict[str, int] = {}  # Stored skills outside the reference
+
+        conn = sqlite3.connect(db_path)
+        try:
+            state = ValidationState(conn, VALIDATOR_NAME, registry.content_hash)
+            if incremental:
+                stats["total"] = state.count_stale()
+                stats["skipped"] = count_jobs(conn) - stats["total"]
+                rows = state.iter_stale(batch_size)
+            else:
+                stats["total"] = count_jobs(conn)
+                rows = iter_jobs(conn, batch_size)
+            writer = SkillUpdateWriter(conn, dry_run=dry_run)
+            # Stored skills ride along in the key; only descriptions go to the workers
+            jobs = (((row.job_id, row.skills), row.description) for row in rows)
+
+            for (job_id, stored), detected in extract_chunks_parallel(
+                jobs, js_skill_detector, (skills_ref_path,), workers
+            ):
+                old = bits.parse(stored or "")
+                new = bits.encode(detected)
+                false_positives = old.bits & ~new.bits
+                false_negatives = new.bits & ~old.bits
+                true_positives += (old.bits & new.bits).bit_count()
+                bits.count(old.bits & new.bits, tp_per_skill)
+                bits.count(false_positives, fp_per_skill)
+                bits.count(false_negatives, fn_per_skill)
+                for name in old.unknown:
+                    unknown_fps[name] = unknown_fps.get(name, 0) + 1
+                stats["fpRemoved"] += false_positives.bit_count() + len(old.unknown)
+                stats["fnAdded"] += false_negatives.bit_count()
+
+                new_skills = ", ".join(detected)
+                old_skills = ", ".join(sorted(old.unknown.union(bits.decode(old.bits))))
+                changed = new_skills != old_skills
+                writer.record(job_id, new_skills if changed else None)
+                if not dry_run:
+                    state.mark(job_id, new_skills if changed else stored)
+                stats["updated"] += changed
+                stats["processed"] += 1
+
+                if stats["processed"] % batch_size == 0:
+                    state.flush()  # Committed with the skills updates
+                    writer.flush()
+                    _report(stats, progress_callback)
+
+            state.flush()
+            writer.flush()
+
+            fp_counts = {**bits.counts_by_name(fp_per_skill), **unknown_fps}
+            fn_counts = bits.counts_by_name(fn_per_skill)
+            if not dry_run:
+                _record(
+                    conn, stats, registry.content_hash, started_at, true_positives,
+                    skill_counts(bits.counts_by_name(tp_per_skill), fp_counts, fn_counts),
+                    {"incremental": incremental, "updated": stats["updated"]},
+                )
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logger.error(f"Batch validation of {db_path} failed: {e}")
+        stats["error"] = str(e)
+        return stats
+
+    stats["topFps"] = sorted(fp_counts.items(), key=lambda item: item[1], reverse=True)[:10]
+    stats["topFns"] = sorted(fn_counts.items(), key=lambda item: item[1], reverse=True)[:10]
+    _report(stats, progress_callback)
+    return stats
+
+
+def _record(
+    conn: sqlite3.Connection,
+    stats: BatchValidationStats,
+    reference_hash: str,
+    started_at: datetime,
+    true_positives: int,
+    skills: Mapping[str, SkillCounts],
+    details: dict[str, object],
+) -> None:
+    """Add the run to the validation history (stored skills scored against the detector)"""
+    fp, fn = stats["fpRemoved"], stats["fnAdded"]
+    precision = true_positives / (true_positives + fp) if (true_positives + fp) > 0 else 1.0
+    recall = true_positives / (true_positives + fn) if (true_positives + fn) > 0 else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
+    record_run(conn, ValidationRun(
+        VALIDATOR_NAME, reference_hash, started_at, stats["processed"], stats["skipped"],
+        true_positives, fp, fn, precision, recall, f1, details,
+    ), skills)
+
+
+def _report(stats: BatchValidationStats, progress_callback: ProgressCallback | None) -> None:
+    if progress_callback is not None:
+        progress_callback(
+            stats["processed"], stats["total"], stats["updated"], stats["fpRemoved"], stats["fnAdded"]
+        )
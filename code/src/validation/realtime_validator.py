@@ -1,11 +1,191 @@
 """
 Real-time Validation Module
-Calls Node.js validation directly for speed - NO PYTHON PATTERN MATCHING
+In-process pattern matching with the same semantics as the Node.js validator.
+A pattern is only compiled (and searched) once its required literal occurs
+in a description, so a fresh process does not pay for the whole reference.
 """
 
+from __future__ import annotations
+
 import json
+import logging
+import re
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.analysis.skill_extraction.pattern_registry import SkillRegistry
+
+logger = logging.getLogger(__name__)
+
+# JavaScript's \s class (WhiteSpace + LineTerminator), which differs from
+# Python's: JS includes U+FEFF, Python includes U+001C-U+001F and U+0085
+_JS_WHITESPACE = (
+    "\\t\\n\\x0b\\x0c\\r \\u00a0\\u1680\\u2000-\\u200a"
+    "\\u2028\\u2029\\u202f\\u205f\\u3000\\ufeff"
+)
+# JavaScript's `.` (without the s flag) excludes every line terminator;
+# Python's only excludes \n
+_JS_DOT = "[^\\n\\r\\u2028\\u2029]"
+
+
+class _JsPattern:
+    """One reference pattern with JS semantics, compiled on first use"""
+
+    __slots__ = ("source", "literal", "_regex", "_compiled")
+
+    def __init__(self, source: str, literal: str | None):
+        self.source = source
+        self.literal = literal  # Lowercase text every match contains (None: always search)
+        self._regex: re.Pattern[str] | None = None
+        self._compiled = False
+
+    @property
+    def regex(self) -> re.Pattern[str] | None:
+        """Compiled pattern, None if it does not compile (Node skips those too)"""
+        if not self._compiled:
+            try:
+                self._regex = compile_js_pattern(self.source)
+            except re.error:
+                self._regex = None
+            self._compiled = True
+        return self._regex
+
+
+# Type alias for (skill_name, patterns) pairs
+CompiledSkill = tuple[str, tuple[_JsPattern, ...]]
+
+
+def js_pattern_to_python(pattern: str) -> str:
+    """
+    Rewrite a JS regex source so Python's re matches it the same way.
+
+    \\s, \\S and `.` outside a character class need rewriting; \\b, \\w and
+    \\d are ASCII-only in JS and are made ASCII-only in Python via re.ASCII
+    when compiling.
+    """
+    out: list[str] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped == "s":
+                out.append(_JS_WHITESPACE if in_class else f"[{_JS_WHITESPACE}]")
+            elif escaped == "S" and not in_class:
+                out.append(f"[^{_JS_WHITESPACE}]")
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == "." and not in_class:
+            out.append(_JS_DOT)
+            i += 1
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+        elif char == "]" and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def compile_js_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a reference pattern with JavaScript `new RegExp(p, 'i')` semantics"""
+    return re.compile(js_pattern_to_python(pattern), re.IGNORECASE | re.ASCII)
+
+
+# Python's \s matches these ASCII separators and its `.` matches \r, JS's do not
+_PYTHON_ONLY_MATCHES = re.compile("[\r\x1c-\x1f]")
+# Escapes that can name a non-ASCII character inside an ASCII pattern source
+_CODEPOINT_ESCAPE = re.compile(r"\\[xuUN0-7]")
+
+
+def _patterns_ascii_only(registry: SkillRegistry) -> bool:
+    """Whether every registry pattern can only match ASCII text literally"""
+    return all(
+        p.isascii() and not _CODEPOINT_ESCAPE.search(p) for skill in registry.skills for p in skill.patterns
+    )
+
+
+def python_semantics_agree(job_description: str, registry: SkillRegistry) -> bool:
+    """
+    Whether the registry's plain re.IGNORECASE regexes find exactly the skills
+    validate_skills_in_process finds in this description, so a pass that
+    already ran them can stand in for validation.
+
+    JS \\w, \\b, \\d and case folding only differ from Python's outside ASCII,
+    JS \\s only differs on U+001C-U+001F and JS `.` on \\r (and the non-ASCII
+    line separators), so ASCII text without those characters matches the same
+    way when the patterns themselves are ASCII.
+    """
+    return (
+        job_description.isascii()
+        and _PYTHON_ONLY_MATCHES.search(job_description) is None
+        and registry.derived("patterns_ascii_only", _patterns_ascii_only)
+    )
+
+
+def _compile_js_skills(registry: SkillRegistry) -> tuple[CompiledSkill, ...]:
+    """
+    Wrap the registry's patterns for JS-semantics matching (once per version).
+    The registry's required literals stay sound under re.IGNORECASE | re.ASCII:
+    they are ASCII, and ASCII case folding only relates ASCII letters.
+    """
+    compiled: list[CompiledSkill] = []
+    for skill in registry.skills:
+        compiled.append((
+            skill.name,
+            tuple(_JsPattern(p, registry.literals[p].required) for p in skill.patterns),
+        ))
+
+    logger.info(f"Prepared {len(compiled)} skills for real-time validation")
+    return tuple(compiled)
+
+
+def validate_skills_in_process(
+    job_description: str,
+    skills_reference_path: str = "src/config/skills_reference_2025.json",
+) -> list[str]:
+    """
+    Validate and extract skills without leaving the Python process.
+    Returns exactly what validate_skills_via_node returns for the same input.
+
+    Args:
+        job_description: The job description text
+        skills_reference_path: Path to skills reference JSON
+
+    Returns:
+        Sorted list of validated skills (pattern-matched only)
+    """
+    if not job_description or not job_description.strip():
+        return []
+
+    # Imported here: the skill_extraction package imports this module
+    from src.analysis.skill_extraction.pattern_literals import fold_text
+    from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+
+    try:
+        registry = get_skill_registry(skills_reference_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load skills reference {skills_reference_path}: {e}")
+        return []
+
+    folded = fold_text(job_description)
+    found: set[str] = set()
+    for name, patterns in registry.derived("realtime_validator", _compile_js_skills):
+        for pattern in patterns:
+            if pattern.literal is not None and pattern.literal not in folded:
+                continue
+            regex = pattern.regex
+            if regex is not None and regex.search(job_description):
+                found.add(name)
+                break
+
+    return sorted(found)
 
 
 def validate_skills_via_node(
@@ -13,8 +193,9 @@ def validate_skills_via_node(
     skills_reference_path: str = "src/config/skills_reference_2025.json",
 ) -> list[str]:
     """
-    Validate and extract skills using Node.js for speed.
-    This bypasses Python regex entirely - uses the same patterns as .sh validation layers.
+    Validate and extract skills using Node.js.
+    Kept as the reference implementation for parity checks against
+    validate_skills_in_process.
 
     Args:
         job_description: The job description text
@@ -82,6 +263,7 @@ def validate_skills(
 ) -> list[str]:
     """
     Validate extracted skills - returns ONLY pattern-matched skills.
-    Uses Node.js for speed, same as .sh validation layers.
+    Patterns are compiled once per process and matched in-process,
+    with the same results as the Node.js validation layers.
     """
-    return validate_skills_via_node(job_description, skills_reference_path)
+    return validate_skills_in_process(job_description, skills_reference_path)
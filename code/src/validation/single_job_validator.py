@@ -12,12 +12,17 @@ Layers:
 """
 from __future__ import annotations
 
-import json
 import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Set
+from typing import TYPE_CHECKING, Sequence, Set
+
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.skill_bits import SkillBits
+
+if TYPE_CHECKING:
+    from src.analysis.skill_extraction.extraction_result import ExtractionResult
 
 logger = logging.getLogger(__name__)
 
@@ -39,32 +44,21 @@ class SingleJobValidator:
 
     def __init__(self, skills_ref_path: str = "src/config/skills_reference_2025.json"):
         self.skills_ref_path = Path(skills_ref_path)
-        self.skill_patterns: dict[str, list[re.Pattern[str]]] = {}
+        self.skill_patterns: dict[str, Sequence[re.Pattern[str]]] = {}
         self.skill_names: dict[str, str] = {}  # lowercase -> canonical name
         self._load_patterns()
 
     def _load_patterns(self) -> None:
-        """Load skill patterns from reference file"""
-        with open(self.skills_ref_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        for skill in data.get("skills", []):
-            name = skill.get("name", "")
-            patterns = skill.get("patterns", [])
+        """Load skill patterns from the shared compiled registry"""
+        registry = get_skill_registry(self.skills_ref_path)
+        self.candidate_index = registry.skill_index
+        self.reference_hash = registry.content_hash
+        self.skill_bits = SkillBits.for_registry(registry)
 
-            if not name or not patterns:
-                continue
-
-            compiled_patterns: list[re.Pattern[str]] = []
-            for p in patterns:
-                try:
-                    compiled_patterns.append(re.compile(p, re.IGNORECASE))
-                except re.error:
-                    continue
-
-            if compiled_patterns:
-                self.skill_patterns[name.lower()] = compiled_patterns
-                self.skill_names[name.lower()] = name
+        for skill in registry.skills:
+            if skill.name and skill.regexes:
+                self.skill_patterns[skill.name.lower()] = skill.regexes
+                self.skill_names[skill.name.lower()] = skill.name
 
         logger.info(f"Loaded {len(self.skill_patterns)} skill patterns for validation")
 
@@ -72,8 +66,10 @@ class SingleJobValidator:
         """Detect all skills that match patterns in the text"""
         detected: Set[str] = set()
 
-        for skill_lower, patterns in self.skill_patterns.items():
-            for pattern in patterns:
+        # Only skills whose anchor tokens occur in the text can match
+        for skill in self.candidate_index.candidates(text):
+            skill_lower = skill.name.lower()
+            for pattern in self.skill_patterns.get(skill_lower, ()):
                 if pattern.search(text):
                     detected.add(self.skill_names[skill_lower])
                     break
@@ -84,7 +80,8 @@ class SingleJobValidator:
         self,
         job_id: str,
         job_description: str,
-        extracted_skills: str
+        extracted_skills: str,
+        extraction: ExtractionResult | None = None
     ) -> ValidationResult:
         """Validate a single job and return fixed skills
 
@@ -92,6 +89,8 @@ class SingleJobValidator:
             job_id: Job identifier
             job_description: Full job description text
             extracted_skills: Comma-separated skills string
+            extraction: Extraction result of this description; its detected
+                skills are used instead of searching the text again
 
         Returns:
             ValidationResult with original, validated skills, and changes
@@ -102,30 +101,29 @@ class SingleJobValidator:
         )
 
         # Layer 3: Detect skills that SHOULD be in the description
-        detected_in_jd = self.detect_skills_in_text(job_description)
+        detected_in_jd: Set[str] | frozenset[str] | None = None
+        if extraction is not None:
+            detected_in_jd = extraction.detected_in(job_description, self.reference_hash)
+        if detected_in_jd is None:
+            detected_in_jd = self.detect_skills_in_text(job_description)
+
+        detected_bits = self.skill_bits.encode(detected_in_jd).bits
 
         # Layer 3: False Positive Detection
         # Skills in extracted but pattern doesn't match in JD
+        # (a skill's patterns match exactly when detection found it)
         false_positives: Set[str] = set()
+        original_bits = 0  # Reference skills of the original, case-insensitively
         for skill in original_skills:
-            skill_lower = skill.lower()
-            if skill_lower in self.skill_patterns:
-                # Check if pattern actually matches in JD
-                found = False
-                for pattern in self.skill_patterns[skill_lower]:
-                    if pattern.search(job_description):
-                        found = True
-                        break
-                if not found:
+            if skill.lower() in self.skill_patterns:
+                bit = self.skill_bits.lower_bit(skill)
+                original_bits |= bit
+                if not bit & detected_bits:
                     false_positives.add(skill)
 
         # Layer 4: False Negative Detection
         # Skills detected by pattern but not in extracted
-        original_lower = {s.lower() for s in original_skills}
-        false_negatives: Set[str] = set()
-        for skill in detected_in_jd:
-            if skill.lower() not in original_lower:
-                false_negatives.add(skill)
+        false_negatives = self.skill_bits.decode(detected_bits & ~original_bits)
 
         # Build validated skills set
         validated_skills = (original_skills - false_positives) | false_negatives
@@ -0,0 +1,120 @@
+"""
+Stratified random sampling of the jobs table for validation estimates
+Jobs are grouped by platform, input_role and scrape date (whichever of those
+columns the table has) and every stratum is shuffled once with a seeded RNG.
+A sample of size n takes the first n_h jobs of each stratum (proportional
+allocation), so growing a sample only ever adds jobs. Ratios such as
+precision = TP / (TP + FP) are estimated with the combined ratio estimator
+and its linearized variance, with finite population correction.
+"""
+from __future__ import annotations
+
+import math
+import random
+import sqlite3
+from collections.abc import Sequence
+from typing import NamedTuple
+
+# Stratum column -> expression grouping it
+STRATUM_EXPRESSIONS = {
+    "platform": "platform",
+    "input_role": "input_role",
+    "scraped_at": "DATE(scraped_at)",
+}
+
+
+class Stratum(NamedTuple):
+    """Jobs sharing a platform, role and scrape date, in sampling order"""
+    key: tuple[object, ...]
+    job_ids: list[str]
+
+
+class StratumSample(NamedTuple):
+    """Per-job y and x values sampled from one stratum of `size` jobs"""
+    size: int
+    y: Sequence[float]
+    x: Sequence[float]
+
+
+class RatioEstimate(NamedTuple):
+    """Estimate of a population proportion sum(y) / sum(x), interval clipped to [0, 1]"""
+    estimate: float
+    low: float
+    high: float
+    half_width: float
+
+
+def load_strata(conn: sqlite3.Connection, seed: int | None = None) -> list[Stratum]:
+    """Jobs with a description and skills, stratified and shuffled (seed fixes the order)"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+    expressions = [expr for column, expr in STRATUM_EXPRESSIONS.items() if column in columns]
+    key_sql = ", ".join(expressions) if expressions else "NULL"
+
+    groups: dict[tuple[object, ...], list[str]] = {}
+    for row in conn.execute(f"""
+        SELECT job_id, {key_sql} FROM jobs
+        WHERE job_description IS NOT NULL AND skills IS NOT NULL
+        ORDER BY job_id
+    """):
+        groups.setdefault(tuple(row[1:]), []).append(row[0])
+
+    rng = random.Random(seed)
+    strata = [Stratum(key, job_ids) for key, job_ids in sorted(groups.items(), key=lambda item: repr(item[0]))]
+    for stratum in strata:
+        rng.shuffle(stratum.job_ids)
+    return strata
+
+
+def allocate(sizes: Sequence[int], n: int) -> list[int]:
+    """
+    Proportional allocation of n sampled jobs over strata of the given sizes
+    (largest remainder, so the counts add up to min(n, population)).
+    Strata too small for a whole job at this n may get none.
+    """
+    population = sum(sizes)
+    n = min(n, population)
+    if n <= 0:
+        return [0] * len(sizes)
+    quotas = [n * size / population for size in sizes]
+    counts = [int(quota) for quota in quotas]
+    by_remainder = sorted(range(len(sizes)), key=lambda h: quotas[h] - counts[h], reverse=True)
+    for h in by_remainder[:n - sum(counts)]:
+        counts[h] += 1
+    return counts
+
+
+def ratio_estimate(samples: Sequence[StratumSample], z: float, empty: float = 1.0) -> RatioEstimate:
+    """
+    Combined ratio estimate of sum(y) / sum(x) from stratified samples.
+    Strata without sampled jobs are left out and the rest weighted up to the
+    population; a stratum with one sampled job borrows the pooled variance.
+
+    Args:
+        samples: One entry per stratum
+        z: Normal quantile of the confidence level
+        empty: Estimate when x sums to zero (as validate_batch reports it)
+    """
+    sampled = [s for s in samples if s.y]
+    y_total = sum(s.size * sum(s.y) / len(s.y) for s in sampled)
+    x_total = sum(s.size * sum(s.x) / len(s.x) for s in sampled)
+    if x_total == 0:
+        return RatioEstimate(empty, empty, empty, 0.0)
+    ratio = y_total / x_total
+
+    residuals = [[y - ratio * x for y, x in zip(s.y, s.x)] for s in sampled]
+    pooled = _variance([e for stratum in residuals for e in stratum])
+    variance = 0.0
+    for s, e in zip(sampled, residuals):
+        n = len(e)
+        s2 = _variance(e) if n > 1 else pooled
+        variance += s.size ** 2 * (1 - n / s.size) * s2 / n
+    half_width = z * math.sqrt(variance) / x_total
+    return RatioEstimate(ratio, max(0.0, ratio - half_width), min(1.0, ratio + half_width), half_width)
+
+
+def _variance(values: Sequence[float]) -> float:
+    """Sample variance (0 for fewer than two values)"""
+    if len(values) < 2:
+        return 0.0
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / (len(values) - 1)
@@ -0,0 +1,155 @@
+"""
+Persisted history of validation runs
+Each run is one validation_runs row (what ran, against which reference, its
+totals and metrics) plus one validation_run_skills row per skill with its
+TP / FP / FN counts, all written in one transaction at the end of the run.
+Trends per skill ("did FPs for Apache Spark drop after the pattern change?")
+are then indexed lookups instead of re-validating old data.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, NamedTuple
+
+
+class SkillCounts(NamedTuple):
+    """One skill's outcome in a run"""
+    true_positives: int
+    false_positives: int
+    false_negatives: int
+
+
+class ValidationRun(NamedTuple):
+    """Metadata and totals of one validation run"""
+    kind: str  # Which validation ran: 'batch', 'sample', 'batch_fix'
+    reference_hash: str
+    started_at: datetime
+    jobs_validated: int
+    jobs_skipped: int
+    true_positives: int
+    false_positives: int
+    false_negatives: int
+    precision: float
+    recall: float
+    f1_score: float
+    details: Mapping[str, Any] = {}  # Run parameters and extra results, stored as JSON
+
+
+class SkillHistoryRow(NamedTuple):
+    """A skill's counts in one run"""
+    run_id: int
+    kind: str
+    finished_at: str
+    true_positives: int
+    false_positives: int
+    false_negatives: int
+
+
+def skill_counts(
+    true_positives: Mapping[str, float],
+    false_positives: Mapping[str, float],
+    false_negatives: Mapping[str, float],
+) -> dict[str, SkillCounts]:
+    """Per-skill counts from name -> count maps (estimated counts are rounded)"""
+    return {
+        skill: SkillCounts(
+            round(true_positives.get(skill, 0)), round(false_positives.get(skill, 0)),
+            round(false_negatives.get(skill, 0)),
+        )
+        for skill in {*true_positives, *false_positives, *false_negatives}
+    }
+
+
+def ensure_history_tables(conn: sqlite3.Connection) -> None:
+    """Create the history tables and their indexes if missing"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS validation_runs (
+            run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            reference_hash TEXT NOT NULL,
+            started_at DATETIME NOT NULL,
+            finished_at DATETIME NOT NULL,
+            jobs_validated INTEGER NOT NULL,
+            jobs_skipped INTEGER NOT NULL,
+            true_positives INTEGER NOT NULL,
+            false_positives INTEGER NOT NULL,
+            false_negatives INTEGER NOT NULL,
+            precision REAL NOT NULL,
+            recall REAL NOT NULL,
+            f1_score REAL NOT NULL,
+            details TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS validation_run_skills (
+            run_id INTEGER NOT NULL REFERENCES validation_runs(run_id),
+            skill TEXT NOT NULL,
+            true_positives INTEGER NOT NULL,
+            false_positives INTEGER NOT NULL,
+            false_negatives INTEGER NOT NULL,
+            PRIMARY KEY (run_id, skill)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_validation_runs_kind ON validation_runs(kind, finished_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_validation_run_skills_skill ON validation_run_skills(skill, run_id)")
+
+
+def record_run(conn: sqlite3.Connection, run: ValidationRun, skills: Mapping[str, SkillCounts]) -> int:
+    """
+    Write a finished run and its per-skill counts (skills with all zero
+    counts are left out) in one transaction. Returns the run_id.
+    """
+    ensure_history_tables(conn)
+    with conn:
+        cursor = conn.execute("""
+            INSERT INTO validation_runs (
+                kind, reference_hash, started_at, finished_at, jobs_validated, jobs_skipped,
+                true_positives, false_positives, false_negatives, precision, recall, f1_score, details
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            run.kind, run.reference_hash, run.started_at.isoformat(sep=" ", timespec="seconds"),
+            datetime.now().isoformat(sep=" ", timespec="seconds"), run.jobs_validated, run.jobs_skipped,
+            run.true_positives, run.false_positives, run.false_negatives,
+            run.precision, run.recall, run.f1_score, json.dumps(dict(run.details)),
+        ))
+        assert cursor.lastrowid is not None
+        run_id = int(cursor.lastrowid)
+        conn.executemany(
+            "INSERT INTO validation_run_skills VALUES (?, ?, ?, ?, ?)",
+            ((run_id, skill, *counts) for skill, counts in skills.items() if any(counts))
+        )
+    return run_id
+
+
+def recent_runs(conn: sqlite3.Connection, limit: int = 20, kind: str | None = None) -> list[dict[str, Any]]:
+    """Latest runs first, as dicts of their columns (details decoded)"""
+    ensure_history_tables(conn)
+    query = "SELECT * FROM validation_runs"
+    params: tuple[Any, ...] = ()
+    if kind is not None:
+        query += " WHERE kind = ?"
+        params = (kind,)
+    cursor = conn.execute(f"{query} ORDER BY run_id DESC LIMIT ?", (*params, limit))
+    names = [column[0] for column in cursor.description]
+    runs = [dict(zip(names, row)) for row in cursor.fetchall()]
+    for run in runs:
+        run["details"] = json.loads(run["details"]) if run["details"] else {}
+    return runs
+
+
+def skill_history(conn: sqlite3.Connection, skill: str, kind: str | None = None) -> list[SkillHistoryRow]:
+    """A skill's counts in every run that saw it, oldest first"""
+    ensure_history_tables(conn)
+    query = """
+        SELECT s.run_id, r.kind, r.finished_at, s.true_positives, s.false_positives, s.false_negatives
+        FROM validation_run_skills s JOIN validation_runs r ON r.run_id = s.run_id
+        WHERE s.skill = ?
+    """
+    params: tuple[Any, ...] = (skill,)
+    if kind is not None:
+        query += " AND r.kind = ?"
+        params += (kind,)
+    return [SkillHistoryRow(*row) for row in conn.execute(f"{query} ORDER BY s.run_id", params)]
@@ -4,13 +4,27 @@ Validation Pipeline - Fast FP/FN Detection Layer
 Integrates with shell scripts for speed boost
 """
 
+import math
 import sqlite3
 import subprocess
-import json
 import re
+from collections.abc import Callable, Iterator, Mapping
+from datetime import datetime
 from operator import itemgetter
 from pathlib import Path
-from typing import TypedDict
+from statistics import NormalDist
+from typing import Sequence, TypedDict
+
+from src.analysis.skill_extraction.corpus_matcher import CorpusMatcher
+from src.analysis.skill_extraction.extraction_result import ExtractionResult
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.regex_backends import DEFAULT_BACKEND, skill_matcher
+from src.analysis.skill_extraction.skill_bits import SkillBits, SkillMask
+from src.validation.stratified_sampling import RatioEstimate, StratumSample, allocate, load_strata, ratio_estimate
+from src.validation.validation_history import SkillCounts, ValidationRun, record_run, skill_counts
+from src.validation.validation_state import ValidationState
+
+VALIDATOR_NAME = "pipeline"
 
 
 class JobValidationResult(TypedDict):
@@ -30,91 +44,190 @@ class BatchValidationResult(TypedDict):
     f1_score: float
     top_false_positives: list[tuple[str, int]]
     top_false_negatives: list[tuple[str, int]]
+    jobs_validated: int
+    jobs_skipped: int
+
+
+class SampledValidationResult(BatchValidationResult):
+    """Estimates from a stratified sample; totals and top skills are scaled to the population"""
+    precision_ci: tuple[float, float]
+    recall_ci: tuple[float, float]
+    f1_ci: tuple[float, float]
+    margin_of_error: float  # Widest half-width of the three intervals
+    confidence: float
+    population: int
+    strata: int
+
+
+# A job's (tp, fp, fn) counts -> its term in the numerator or denominator of a ratio
+CountTerm = Callable[[int, int, int], int]
+
+
+def _tp(tp: int, fp: int, fn: int) -> int:
+    return tp
+
+
+def _tp_fp(tp: int, fp: int, fn: int) -> int:
+    return tp + fp
+
+
+def _tp_fn(tp: int, fp: int, fn: int) -> int:
+    return tp + fn
+
+
+def _f1_num(tp: int, fp: int, fn: int) -> int:
+    return 2 * tp
+
+
+def _f1_den(tp: int, fp: int, fn: int) -> int:
+    return 2 * tp + fp + fn
+
 
 class SkillValidator:
     """Validates skill extraction for False Positives and False Negatives"""
 
-    def __init__(self, db_path: str = "data/jobs.db", skills_ref_path: str = "src/config/skills_reference_2025.json"):
+    def __init__(
+        self,
+        db_path: str = "data/jobs.db",
+        skills_ref_path: str = "src/config/skills_reference_2025.json",
+        regex_backend: str = DEFAULT_BACKEND,
+    ):
         self.db_path = db_path
         self.skills_ref_path = skills_ref_path
+        self.regex_backend = regex_backend  # Engine of validate_job's pattern search (see regex_backends.py)
         self._load_skills_reference()
 
     def _load_skills_reference(self):
-        """Load skill patterns from JSON"""
-        with open(self.skills_ref_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        self.skill_patterns = {}
-        for skill in data['skills']:
-            patterns = []
-            for p in skill.get('patterns', []):
-                try:
-                    patterns.append(re.compile(p, re.IGNORECASE))
-                except re.error:
-                    pass
-            if patterns:
-                self.skill_patterns[skill['name']] = patterns
-
-    def validate_job(self, job_description: str, extracted_skills: str) -> JobValidationResult:
-        """Validate a single job's skill extraction"""
-        extracted = set(s.strip() for s in extracted_skills.split(',') if s.strip())
-        detected = set()
+        """Load skill patterns from the shared compiled registry"""
+        registry = get_skill_registry(self.skills_ref_path)
+        self.reference_hash = registry.content_hash
+        self.skill_bits = SkillBits.for_registry(registry)
+        self.matcher = skill_matcher(registry, self.regex_backend)
+
+        self.skill_patterns: dict[str, Sequence[re.Pattern[str]]] = {}
+        for skill in registry.skills:
+            if skill.regexes:
+                self.skill_patterns[skill.name] = skill.regexes
+
+    def validate_job(
+        self, job_description: str, extracted_skills: str, extraction: ExtractionResult | None = None
+    ) -> JobValidationResult:
+        """Validate a single job's skill extraction (an extraction result of it saves the search)"""
+        if extraction is not None:
+            known = extraction.detected_in(job_description, self.reference_hash)
+            if known is not None:
+                return self._compare(extracted_skills, self.skill_bits.encode(known).bits)
 
         # Detect skills using patterns
-        for skill_name, patterns in self.skill_patterns.items():
-            for pattern in patterns:
-                if pattern.search(job_description):
-                    detected.add(skill_name)
-                    break
+        detected = self.skill_bits.encode(self.matcher.match(job_description)).bits
+        return self._compare(extracted_skills, detected)
 
-        # Calculate FP and FN
-        false_positives = extracted - detected  # In extracted but not detected
-        false_negatives = detected - extracted  # Detected but not extracted
-        true_positives = extracted & detected   # Both
+    def _compare(self, extracted_skills: str, detected: int) -> JobValidationResult:
+        """FP/FN of an extracted skills string against the pattern-detected skill bits"""
+        extracted = self.skill_bits.parse(extracted_skills)
+        true_positives, false_positives, false_negatives = self._split(extracted, detected)
+        decode = self.skill_bits.decode
+        n_extracted = extracted.bits.bit_count() + len(extracted.unknown)
+        n_true = true_positives.bit_count()
+        n_detected = detected.bit_count()
 
         return {
-            'true_positives': true_positives,
-            'false_positives': false_positives,
-            'false_negatives': false_negatives,
-            'precision': len(true_positives) / len(extracted) if extracted else 1.0,
-            'recall': len(true_positives) / len(detected) if detected else 1.0
+            'true_positives': decode(true_positives),
+            # Skills outside the reference are never detected
+            'false_positives': decode(false_positives) | extracted.unknown,
+            'false_negatives': decode(false_negatives),
+            'precision': n_true / n_extracted if n_extracted else 1.0,
+            'recall': n_true / n_detected if n_detected else 1.0
         }
 
-    def validate_batch(self, limit: int = 100) -> BatchValidationResult:
-        """Validate a batch of jobs and return aggregate stats"""
+    @staticmethod
+    def _split(extracted: SkillMask, detected: int) -> tuple[int, int, int]:
+        """(true positive, false positive, false negative) bits; unknown names are FPs too"""
+        return (
+            extracted.bits & detected,   # Both
+            extracted.bits & ~detected,  # In extracted but not detected
+            detected & ~extracted.bits,  # Detected but not extracted
+        )
+
+    def _compare_rows(self, rows: Sequence[tuple[str, str, str]]) -> Iterator[tuple[int, int, int, SkillMask]]:
+        """(true positive, false positive, false negative bits, extracted skills) of each (job_id, description, skills) row"""
+        # Detect skills across the whole batch at once, one sparse row per job
+        matcher = get_skill_registry(self.skills_ref_path).derived("corpus_matcher", CorpusMatcher)
+        detected = matcher.match((job_id, desc) for job_id, desc, _ in rows)
+        indptr, indices = detected.indptr, detected.indices
+        bits = self.skill_bits
+        for i, (_, _, skills) in enumerate(rows):
+            extracted = bits.parse(skills)
+            tp, fp, fn = self._split(extracted, bits.from_columns(indices[indptr[i]:indptr[i + 1]]))
+            yield tp, fp, fn, extracted
+
+    def validate_batch(self, limit: int = 100, incremental: bool = False, record: bool = True) -> BatchValidationResult:
+        """
+        Validate a batch of jobs and return aggregate stats.
+        An incremental batch only takes jobs not validated since their skills
+        last changed (or validated with another reference), and records them;
+        the stats then cover just those jobs. With `record`, the run and its
+        per-skill counts are added to the validation history.
+        """
+        started_at = datetime.now()
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
+        state = None
+        skipped = 0
+        rows: list[tuple[str, str, str]]
 
-        cursor.execute(
-            "SELECT job_id, job_description, skills FROM jobs "
-            "WHERE job_description IS NOT NULL AND skills IS NOT NULL "
-            f"LIMIT {limit}"
-        )
+        if incremental:
+            state = ValidationState(conn, VALIDATOR_NAME, self.reference_hash)
+            cursor.execute(
+                "SELECT COUNT(*) FROM jobs WHERE job_description IS NOT NULL AND skills IS NOT NULL"
+            )
+            skipped = cursor.fetchone()[0] - state.count_stale(require_skills=True)
+            rows = [
+                (row.job_id, row.description, row.skills or "")
+                for row in state.iter_stale(require_skills=True, limit=limit)
+            ]
+        else:
+            cursor.execute(
+                "SELECT job_id, job_description, skills FROM jobs "
+                "WHERE job_description IS NOT NULL AND skills IS NOT NULL "
+                f"LIMIT {limit}"
+            )
+            rows = cursor.fetchall()
 
         total_tp = 0
         total_fp = 0
         total_fn = 0
-        fp_counts = {}
-        fn_counts = {}
+        bits = self.skill_bits
+        tp_per_skill = [0] * len(bits)
+        fp_per_skill = [0] * len(bits)
+        fn_per_skill = [0] * len(bits)
+        unknown_fp_counts: dict[str, int] = {}
 
-        for _, desc, skills in cursor.fetchall():
-            result = self.validate_job(desc, skills)
-            total_tp += len(result['true_positives'])
-            total_fp += len(result['false_positives'])
-            total_fn += len(result['false_negatives'])
+        # Set algebra and counts on skill bitmasks; names only for the top lists
+        for tp, fp, fn, extracted in self._compare_rows(rows):
+            total_tp += tp.bit_count()
+            total_fp += fp.bit_count() + len(extracted.unknown)
+            total_fn += fn.bit_count()
 
-            for fp in result['false_positives']:
-                fp_counts[fp] = fp_counts.get(fp, 0) + 1
-            for fn in result['false_negatives']:
-                fn_counts[fn] = fn_counts.get(fn, 0) + 1
+            bits.count(tp, tp_per_skill)
+            bits.count(fp, fp_per_skill)
+            bits.count(fn, fn_per_skill)
+            for name in extracted.unknown:
+                unknown_fp_counts[name] = unknown_fp_counts.get(name, 0) + 1
 
-        conn.close()
+        if state is not None:
+            for job_id, _, skills in rows:
+                state.mark(job_id, skills)
+            state.flush()
+            conn.commit()
+        fp_counts = {**bits.counts_by_name(fp_per_skill), **unknown_fp_counts}
+        fn_counts = bits.counts_by_name(fn_per_skill)
 
         precision = total_tp / (total_tp + total_fp) if (total_tp + total_fp) > 0 else 1.0
         recall = total_tp / (total_tp + total_fn) if (total_tp + total_fn) > 0 else 1.0
         f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
 
-        return {
+        result: BatchValidationResult = {
             'total_true_positives': total_tp,
             'total_false_positives': total_fp,
             'total_false_negatives': total_fn,
@@ -122,8 +235,166 @@ class SkillValidator:
             'recall': recall,
             'f1_score': f1,
             'top_false_positives': sorted(fp_counts.items(), key=itemgetter(1), reverse=True)[:10],
-            'top_false_negatives': sorted(fn_counts.items(), key=itemgetter(1), reverse=True)[:10]
+            'top_false_negatives': sorted(fn_counts.items(), key=itemgetter(1), reverse=True)[:10],
+            'jobs_validated': len(rows),
+            'jobs_skipped': skipped
+        }
+        if record:
+            self._record(
+                conn, "batch", started_at, result,
+                skill_counts(bits.counts_by_name(tp_per_skill), fp_counts, fn_counts),
+                {'limit': limit, 'incremental': incremental},
+            )
+        conn.close()
+        return result
+
+    def _record(
+        self,
+        conn: sqlite3.Connection,
+        kind: str,
+        started_at: datetime,
+        result: BatchValidationResult,
+        skills: Mapping[str, SkillCounts],
+        details: dict[str, object],
+    ) -> None:
+        """Add a finished run to the validation history"""
+        record_run(conn, ValidationRun(
+            kind, self.reference_hash, started_at, result['jobs_validated'], result['jobs_skipped'],
+            result['total_true_positives'], result['total_false_positives'], result['total_false_negatives'],
+            result['precision'], result['recall'], result['f1_score'], details,
+        ), skills)
+
+    def validate_sample(
+        self,
+        margin_of_error: float = 0.02,
+        confidence: float = 0.95,
+        initial_size: int = 200,
+        max_size: int = 5000,
+        seed: int | None = None,
+        record: bool = True,
+    ) -> SampledValidationResult:
+        """
+        Sampling mode of validate_batch: estimate precision, recall and F1 of
+        the whole table from a stratified random sample (by platform,
+        input_role and scrape date), with confidence intervals. The sample
+        grows until every interval's half-width is within margin_of_error,
+        max_size is reached or every job is in it.
+
+        Args:
+            margin_of_error: Target half-width of the intervals
+            confidence: Confidence level of the intervals
+            initial_size: Jobs in the first round
+            max_size: Largest sample to draw
+            seed: Fixes the sample (None = a new sample every call)
+            record: Add the run and its estimated per-skill counts to the validation history
+        """
+        started_at = datetime.now()
+        conn = sqlite3.connect(self.db_path)
+        strata = load_strata(conn, seed)
+        sizes = [len(stratum.job_ids) for stratum in strata]
+        population = sum(sizes)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        bits = self.skill_bits
+
+        # Per stratum: per-job (tp, fp, fn) counts and the FP / FN skills of its sample
+        counts: list[list[tuple[int, int, int]]] = [[] for _ in strata]
+        skills: list[list[tuple[int, int, int, frozenset[str]]]] = [[] for _ in strata]
+        taken = [0] * len(strata)
+        size = min(initial_size, max_size, population)
+
+        def estimate(y: CountTerm, x: CountTerm) -> RatioEstimate:
+            return ratio_estimate(
+                [StratumSample(n, [y(*c) for c in cs], [x(*c) for c in cs]) for n, cs in zip(sizes, counts)],
+                z,
+            )
+
+        while True:
+            target = allocate(sizes, size)
+            new_jobs = [
+                (h, job_id) for h, stratum in enumerate(strata)
+                for job_id in stratum.job_ids[taken[h]:target[h]]
+            ]
+            taken = target
+            rows = self._fetch_jobs(conn, [job_id for _, job_id in new_jobs])
+            for (h, _), (tp, fp, fn, extracted) in zip(new_jobs, self._compare_rows(rows)):
+                counts[h].append((tp.bit_count(), fp.bit_count() + len(extracted.unknown), fn.bit_count()))
+                skills[h].append((tp, fp, fn, extracted.unknown))
+
+            precision = estimate(_tp, _tp_fp)
+            recall = estimate(_tp, _tp_fn)
+            # Aggregate F1 = 2TP / (2TP + FP + FN), a ratio like the other two
+            f1 = estimate(_f1_num, _f1_den)
+            achieved = max(precision.half_width, recall.half_width, f1.half_width)
+
+            limit = min(max_size, population)
+            if achieved <= margin_of_error or size >= limit:
+                break
+            # Half-widths shrink with 1/sqrt(n); grow at most 4x per round
+            growth = min(4.0, (achieved / margin_of_error) ** 2) if margin_of_error > 0 else 4.0
+            size = min(limit, max(size + 1, math.ceil(size * growth)))
+
+        # Population estimates: each sampled job stands for size / sampled jobs of its stratum
+        totals = [0.0, 0.0, 0.0]
+        tp_counts: dict[str, float] = {}
+        fp_counts: dict[str, float] = {}
+        fn_counts: dict[str, float] = {}
+        for n, cs, ss in zip(sizes, counts, skills):
+            if not cs:
+                continue
+            weight = n / len(cs) * population / sum(s for s, c in zip(sizes, counts) if c)
+            for c in cs:
+                totals = [t + weight * v for t, v in zip(totals, c)]
+            for tp, fp, fn, unknown in ss:
+                for name in bits.decode(tp):
+                    tp_counts[name] = tp_counts.get(name, 0.0) + weight
+                for name in bits.decode(fp) | unknown:
+                    fp_counts[name] = fp_counts.get(name, 0.0) + weight
+                for name in bits.decode(fn):
+                    fn_counts[name] = fn_counts.get(name, 0.0) + weight
+
+        def top(estimates: dict[str, float]) -> list[tuple[str, int]]:
+            return [(name, round(count)) for name, count in sorted(estimates.items(), key=itemgetter(1), reverse=True)[:10]]
+
+        sampled = sum(taken)
+        result: SampledValidationResult = {
+            'total_true_positives': round(totals[0]),
+            'total_false_positives': round(totals[1]),
+            'total_false_negatives': round(totals[2]),
+            'precision': precision.estimate,
+            'recall': recall.estimate,
+            'f1_score': f1.estimate,
+            'top_false_positives': top(fp_counts),
+            'top_false_negatives': top(fn_counts),
+            'jobs_validated': sampled,
+            'jobs_skipped': population - sampled,
+            'precision_ci': (precision.low, precision.high),
+            'recall_ci': (recall.low, recall.high),
+            'f1_ci': (f1.low, f1.high),
+            'margin_of_error': achieved,
+            'confidence': confidence,
+            'population': population,
+            'strata': len(strata)
         }
+        if record:
+            self._record(conn, "sample", started_at, result, skill_counts(tp_counts, fp_counts, fn_counts), {
+                'margin_of_error': margin_of_error, 'achieved_margin': achieved, 'confidence': confidence,
+                'precision_ci': result['precision_ci'], 'recall_ci': result['recall_ci'], 'f1_ci': result['f1_ci'],
+                'population': population, 'strata': len(strata), 'seed': seed,
+            })
+        conn.close()
+        return result
+
+    @staticmethod
+    def _fetch_jobs(conn: sqlite3.Connection, job_ids: Sequence[str]) -> list[tuple[str, str, str]]:
+        """(job_id, description, skills) rows of job_ids, in that order"""
+        found: dict[str, tuple[str, str, str]] = {}
+        for start in range(0, len(job_ids), 500):
+            chunk = job_ids[start:start + 500]
+            found.update((row[0], row) for row in conn.execute(
+                f"SELECT job_id, job_description, skills FROM jobs WHERE job_id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ))
+        return [found[job_id] for job_id in job_ids]
 
     def run_shell_validation(self) -> str:
         """Run shell script for fast pattern validation"""
@@ -0,0 +1,104 @@
+"""
+Per-job validation bookkeeping for incremental runs
+Each validator records, per job, the skills reference hash it validated with,
+a hash of the skills string as it left the job and when. A later run only
+reads jobs that are new, whose skills changed since (re-scraped or edited)
+or that were validated with another reference; the rest are skipped without
+loading their descriptions. Staleness is decided in SQL through a registered
+skills_hash() function, keyset-paged by job_id like job_stream.iter_jobs.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from collections.abc import Iterator
+
+from src.analysis.skill_extraction.job_stream import DEFAULT_PAGE_SIZE, JobRow
+
+
+def skills_hash(skills: str | None) -> str:
+    """Hash of a jobs.skills value (NULL hashes like the empty string)"""
+    return hashlib.blake2b((skills or "").encode("utf-8"), digest_size=8).hexdigest()
+
+
+class ValidationState:
+    """One validator's record of which jobs it has validated, and against what"""
+
+    def __init__(self, conn: sqlite3.Connection, validator: str, reference_hash: str):
+        """
+        Args:
+            conn: Connection to the jobs database
+            validator: Name the records are kept under (validators do not share them)
+            reference_hash: Content hash of the skills reference this run validates with
+        """
+        self.conn = conn
+        self.validator = validator
+        self.reference_hash = reference_hash
+        self._pending: list[tuple[str, str, str, str]] = []
+        conn.create_function("skills_hash", 1, skills_hash, deterministic=True)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_validation_state (
+                validator TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                reference_hash TEXT NOT NULL,
+                skills_hash TEXT NOT NULL,
+                validated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (validator, job_id)
+            ) WITHOUT ROWID
+        """)
+
+    def _stale_condition(self, require_skills: bool) -> str:
+        return f"""
+            j.job_description IS NOT NULL {"AND j.skills IS NOT NULL" if require_skills else ""}
+            AND (s.job_id IS NULL OR s.reference_hash != ? OR s.skills_hash != skills_hash(j.skills))
+        """
+
+    def count_stale(self, require_skills: bool = False) -> int:
+        """Jobs with a description (and skills, if required) that need validating"""
+        row = self.conn.execute(f"""
+            SELECT COUNT(*) FROM jobs j
+            LEFT JOIN job_validation_state s ON s.validator = ? AND s.job_id = j.job_id
+            WHERE {self._stale_condition(require_skills)}
+        """, (self.validator, self.reference_hash)).fetchone()
+        return int(row[0])
+
+    def iter_stale(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        require_skills: bool = False,
+        limit: int | None = None,
+    ) -> Iterator[JobRow]:
+        """
+        Stream the jobs that need validating in job_id order, one page in memory.
+        As with iter_jobs, the caller may write on the same connection between rows.
+        """
+        after_job_id = ""
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            rows = self.conn.execute(f"""
+                SELECT j.job_id, j.job_description, j.skills FROM jobs j
+                LEFT JOIN job_validation_state s ON s.validator = ? AND s.job_id = j.job_id
+                WHERE j.job_id > ? AND {self._stale_condition(require_skills)}
+                ORDER BY j.job_id LIMIT ?
+            """, (self.validator, after_job_id, self.reference_hash, size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield JobRow(*row)
+            after_job_id = rows[-1][0]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def mark(self, job_id: str, skills: str | None) -> None:
+        """Record job_id as validated, with the skills value it now holds in the table"""
+        self._pending.append((self.validator, job_id, self.reference_hash, skills_hash(skills)))
+
+    def flush(self) -> None:
+        """Write the buffered records; the caller commits (with its own updates)"""
+        if self._pending:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO job_validation_state (validator, job_id, reference_hash, skills_hash)
+                VALUES (?, ?, ?, ?)
+            """, self._pending)
+            self._pending.clear()
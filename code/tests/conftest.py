@@ -0,0 +1,53 @@
+"""Shared pytest fixtures"""
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Protocol
+
+import pytest
+
+from src.analysis.skill_extraction import reference_compiler
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+# Descriptions the validation tests cycle through; tests append their own edge cases
+JOB_DESCRIPTIONS = [
+    "Senior Data Engineer with Python, SQL, Apache Spark and AWS Glue experience.",
+    "Experience with React Native, React, Node.js and TypeScript is required.",
+    "Kubernetes and Docker on Azure; Excel and Power BI reporting",
+]
+
+JOB_COLUMNS = ("job_id TEXT PRIMARY KEY", "job_description TEXT", "skills TEXT")
+
+
+class JobsDbFactory(Protocol):
+    def __call__(
+        self, rows: Iterable[Sequence[object]], extra_columns: Sequence[str] = (), name: str = "jobs.db"
+    ) -> Path: ...
+
+
+@pytest.fixture(autouse=True, scope="session")
+def compiled_reference_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Keep load-time rebuilds of test references out of the user's cache"""
+    original = reference_compiler.COMPILED_CACHE_DIR
+    reference_compiler.COMPILED_CACHE_DIR = tmp_path_factory.mktemp("compiled_references")
+    yield reference_compiler.COMPILED_CACHE_DIR
+    reference_compiler.COMPILED_CACHE_DIR = original
+
+
+@pytest.fixture
+def make_jobs_db(tmp_path: Path) -> JobsDbFactory:
+    """
+    Build a jobs table at tmp_path / name and return its path.
+    Rows are (job_id, job_description, skills, *extra) with one value per extra column.
+    """
+    def make(rows: Iterable[Sequence[object]], extra_columns: Sequence[str] = (), name: str = "jobs.db") -> Path:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = [*JOB_COLUMNS, *extra_columns]
+        with sqlite3.connect(path) as conn:
+            conn.execute(f"CREATE TABLE jobs ({', '.join(columns)})")
+            conn.executemany(f"INSERT INTO jobs VALUES ({', '.join('?' * len(columns))})", rows)
+        return path
+
+    return make
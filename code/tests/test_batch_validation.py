@@ -0,0 +1,82 @@
+"""Tests for the Python batch FP/FN validation of the jobs table
+Run with: python -m pytest tests/test_batch_validation.py
+"""
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.validation.batch_validation import js_skill_detector, validate_jobs_table
+from src.validation.realtime_validator import validate_skills_in_process
+from tests.conftest import JOB_DESCRIPTIONS, SKILLS_REF, JobsDbFactory
+
+DESCRIPTIONS = [*JOB_DESCRIPTIONS, "İnformatica and PoſtgreSQL on Azure, Kenntnisse in Python", ""]
+SCRAPED = ["Python", "Excel", "Not A Skill", "Kubernetes", "SQL", "Tableau", "React"]
+
+
+def _rows(count: int) -> list[tuple[str, str | None, str | None]]:
+    rng = random.Random(21)
+    rows: list[tuple[str, str | None, str | None]] = []
+    for i in range(count):
+        description = DESCRIPTIONS[i % len(DESCRIPTIONS)] if i % 7 else None
+        skills = ", ".join(rng.sample(SCRAPED, rng.randint(0, 4))) if i % 5 else None
+        rows.append((f"job-{i:03d}", description, skills))
+    return rows
+
+
+def test_detector_matches_js_semantics() -> None:
+    detect = js_skill_detector(SKILLS_REF)
+    assert detect(DESCRIPTIONS) == [validate_skills_in_process(text, SKILLS_REF) for text in DESCRIPTIONS]
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_validate_jobs_table(make_jobs_db: JobsDbFactory, dry_run: bool) -> None:
+    rows = _rows(60)
+    db_path = make_jobs_db(rows)
+
+    # What the Node script computed, job by job on name sets
+    expected_skills: dict[str, str | None] = {}
+    fps: dict[str, int] = {}
+    fns: dict[str, int] = {}
+    updated = 0
+    for job_id, description, skills in rows:
+        if description is None:
+            expected_skills[job_id] = skills
+            continue
+        old = {s.strip() for s in (skills or "").split(",") if s.strip()}
+        detected = set(validate_skills_in_process(description, SKILLS_REF))
+        for skill in old - detected:
+            fps[skill] = fps.get(skill, 0) + 1
+        for skill in detected - old:
+            fns[skill] = fns.get(skill, 0) + 1
+        new_skills = ", ".join(sorted(detected))
+        updated += new_skills != ", ".join(sorted(old))
+        expected_skills[job_id] = skills if dry_run or new_skills == ", ".join(sorted(old)) else new_skills
+
+    progress: list[tuple[int, int, int, int, int]] = []
+
+    def on_progress(processed: int, total: int, updated: int, fp_removed: int, fn_added: int) -> None:
+        progress.append((processed, total, updated, fp_removed, fn_added))
+
+    stats = validate_jobs_table(str(db_path), SKILLS_REF, on_progress, batch_size=20, workers=1, dry_run=dry_run)
+
+    total = sum(description is not None for _, description, _ in rows)
+    assert stats["error"] is None
+    assert stats["processed"] == stats["total"] == total
+    assert stats["updated"] == updated
+    assert stats["fpRemoved"] == sum(fps.values()) and stats["fnAdded"] == sum(fns.values())
+    assert {skill: fps[skill] for skill, _ in stats["topFps"]} == dict(stats["topFps"])
+    assert [count for _, count in stats["topFps"]] == sorted(fps.values(), reverse=True)[:10]
+    assert [count for _, count in stats["topFns"]] == sorted(fns.values(), reverse=True)[:10]
+
+    # Every batch_size jobs, then once at completion
+    assert [p[0] for p in progress] == [20, 40, total]
+    assert progress[-1] == (total, total, stats["updated"], stats["fpRemoved"], stats["fnAdded"])
+    with sqlite3.connect(db_path) as conn:
+        assert dict(conn.execute("SELECT job_id, skills FROM jobs")) == expected_skills
+
+
+def test_missing_database_reports_error(tmp_path: Path) -> None:
+    stats = validate_jobs_table(str(tmp_path / "missing" / "jobs.db"), SKILLS_REF, workers=1)
+    assert stats["error"] and stats["processed"] == 0
@@ -0,0 +1,74 @@
+"""Tests for the token-anchored candidate index
+Run with: python -m pytest tests/test_candidate_index.py
+"""
+import random
+from pathlib import Path
+
+import pytest
+
+from src.analysis.skill_extraction.pattern_literals import anchor_token, text_tokens
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.validation.single_job_validator import SingleJobValidator
+
+SKILLS_REF = Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json"
+REGISTRY = get_skill_registry(SKILLS_REF)
+
+
+def _random_description(seed: int, length: int = 3000) -> str:
+    """Skill names glued to punctuation, suffixes and filler prose"""
+    rng = random.Random(seed)
+    names = [s.name for s in REGISTRY.skills]
+    filler = "we build reliable data products with partners across the business".split()
+    words: list[str] = []
+    while sum(len(w) + 1 for w in words) < length:
+        if rng.random() < 0.2:
+            name = rng.choice(names)
+            variant = rng.choice([name, name.upper(), name.lower(), name.replace(" ", "-")])
+            words.append(variant + rng.choice(["", "", ",", "s", "/", ".", "ing"]))
+        else:
+            words.append(rng.choice(filler))
+    return " ".join(words)[:length]
+
+
+@pytest.mark.parametrize("pattern, token, whole", [
+    (r"\bPython\b", "python", True),
+    (r"\bAzure\s+Blob\s+Storage\b", "storage", True),
+    (r"\bGo\s*\(Golang\)\b", "golang", True),
+    (r"\bC\#\b", "c", True),
+    (r"\bjobs?\b", "job", False),
+    (r"\bADOBE\S+ANALYTICS\b", "adobe", False),
+    (r"Python", None, None),
+    (r"\b(Python|SQL|SAS),\s*R,", None, None),
+])
+def test_anchor_token(pattern: str, token: str | None, whole: bool | None) -> None:
+    anchor = anchor_token(pattern)
+    if token is None:
+        assert anchor is None
+    else:
+        assert anchor == (token, whole)
+
+
+def test_text_tokens_fold_case_variants() -> None:
+    assert text_tokens("PYTHON, İnformatica and C#/.NET") == {"python", "informatica", "and", "c", "net"}
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_index_never_drops_a_matching_skill(seed: int) -> None:
+    text = _random_description(seed)
+    candidates = {skill.name for skill in REGISTRY.skill_index.candidates(text)}
+    for skill in REGISTRY.skills:
+        if any(regex.search(text) for regex in skill.regexes):
+            assert skill.name in candidates
+
+
+def test_validators_match_full_scan() -> None:
+    single = SingleJobValidator(str(SKILLS_REF))
+    reference = SkillValidator(str(SKILLS_REF))
+    for seed in range(4):
+        text = _random_description(seed)
+        full_scan = {s.name for s in REGISTRY.skills if any(r.search(text) for r in s.regexes)}
+        assert single.detect_skills_in_text(text) == full_scan
+        assert reference.validate_and_extract(text) == {
+            s.name for s in REGISTRY.skills if any(r.search(text.lower()) for r in s.regexes)
+        }
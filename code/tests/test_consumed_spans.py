@@ -0,0 +1,36 @@
+"""Tests for the sorted consumed-span structure
+Run with: python -m pytest tests/test_consumed_spans.py
+"""
+import random
+
+import pytest
+
+from src.analysis.skill_extraction.consumed_spans import ConsumedSpans
+
+
+def _legacy_overlaps(consumed: list[tuple[int, int]], start: int, end: int) -> bool:
+    return any(s <= start < e or s < end <= e for s, e in consumed)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_legacy_list_scan(seed: int) -> None:
+    rng = random.Random(seed)
+    legacy: list[tuple[int, int]] = []
+    spans = ConsumedSpans()
+    for _ in range(300):
+        start = rng.randrange(500)
+        end = start + rng.randrange(0, 25)
+        expected = _legacy_overlaps(legacy, start, end)
+        assert spans.overlaps(start, end) == expected
+        # Sometimes add overlapping spans too, like callers that skip the check
+        if not expected or rng.random() < 0.2:
+            legacy.append((start, end))
+            spans.add(start, end)
+
+
+def test_spans_are_merged() -> None:
+    spans = ConsumedSpans([(10, 20), (30, 40), (20, 25), (5, 12)])
+    assert list(spans) == [(5, 25), (30, 40)]
+    assert spans.overlaps(24, 30)
+    assert not spans.overlaps(25, 30)
+    assert not spans.overlaps(0, 50)  # Enclosing a span is not a collision
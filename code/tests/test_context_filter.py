@@ -0,0 +1,63 @@
+"""Tests for education-context zones used by the degree filters
+Run with: python -m pytest tests/test_context_filter.py
+"""
+import random
+import re
+
+from src.analysis.skill_extraction import batch_reextract
+from src.analysis.skill_extraction.context_filter import (
+    DEGREE_CONTEXT_DETECTOR,
+    DEGREE_CONTEXT_PATTERNS,
+    filter_degree_contexts,
+    is_degree_context,
+)
+
+FRAGMENTS = [
+    "bachelor's degree in ", "Bachelor of ", "masters   in ", "MS in ", "programs of ", "PhD ",
+    "mba\t", "studied ", "educational requirements: ", "field of study:", "major in ",
+    "İn ", "ß", "background in ", "Statistics", "Python", " ", "\n", "in", "of", "x",
+]
+
+
+def _window_search(patterns: list[re.Pattern[str]], text: str, start: int, end: int) -> bool:
+    return any(p.search(text[start:end].lower()) for p in patterns)
+
+
+def test_zones_match_window_searches() -> None:
+    filter_patterns = [re.compile(p, re.IGNORECASE) for p in DEGREE_CONTEXT_PATTERNS]
+    reextract_patterns = [re.compile(p, re.IGNORECASE) for p in batch_reextract.DEGREE_DETECTOR.patterns]
+    rng = random.Random(7)
+    for i in range(500):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 30)))
+        zones = DEGREE_CONTEXT_DETECTOR.zones(text)
+        reextract_zones = batch_reextract.degree_zones(text)
+        if i % 2:
+            zones.scan()  # Otherwise the first checks search their windows
+            reextract_zones.scan()
+        for _ in range(20):
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, len(text))
+            window = rng.choice([5, 40, 100])
+            lookback = max(0, start - window)
+
+            expected = _window_search(filter_patterns, text, lookback, end)
+            assert is_degree_context(text, start, end, window) == expected
+            assert is_degree_context(text, start, end, window, zones=zones) == expected
+
+            expected = _window_search(reextract_patterns, text, lookback, start)
+            assert batch_reextract.is_degree_context(text, start, window) == expected
+            assert batch_reextract.is_degree_context(text, start, window, zones=reextract_zones) == expected
+
+
+def test_shortest_matches_and_filter() -> None:
+    text = "MS in Statistics; teams of analysts use Statistics"
+    assert DEGREE_CONTEXT_DETECTOR.spans(text.lower()) == [(0, 3), (21, 24)]
+
+    skills = [
+        {"skill": "Statistics", "start": 6, "end": 16},
+        {"skill": "Statistics", "start": 40, "end": 50},
+        {"skill": "Python", "start": 0, "end": 2},
+    ]
+    kept = filter_degree_contexts(text, skills)
+    assert kept == [skills[2]]  # "ms " in "teams of" counts as degree context too
+    assert filter_degree_contexts(text, skills, skills_to_check=set()) == skills
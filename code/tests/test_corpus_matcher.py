@@ -0,0 +1,83 @@
+"""Tests for corpus-level skill matching
+Run with: python -m pytest tests/test_corpus_matcher.py
+"""
+import json
+import sqlite3
+from pathlib import Path
+
+from src.analysis.skill_extraction.corpus_matcher import CorpusMatcher, context_free, write_job_skills
+from src.analysis.skill_extraction.pattern_registry import SkillRegistry, get_skill_registry
+from src.validation.validation_pipeline import SkillValidator
+from tests.conftest import JobsDbFactory
+
+SKILLS_REF = Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json"
+
+DESCRIPTIONS = [
+    "Senior Data Engineer with Python, SQL, Apache Spark and AWS Glue experience.",
+    "Experience with React Native, React, Node.js and TypeScript is required.",
+    "Skills: .NET, C#, C++, R and Python, Vue.js, scikit-learn, 5G technology",
+    "Kubernetes and PoſtgreSQL and İnformatica on Azure Blob Storage",
+    "MACHINE LEARNING, deep learning, Deep-Learning, NLP\nLLMs\r\nRAG\tagents",
+    "",
+    "No technical content here at all, just a friendly hello.",
+    "Go",
+]
+
+
+def _per_description(registry: SkillRegistry, texts: list[str]) -> list[list[str]]:
+    return [
+        [skill.name for skill in registry.skills if any(regex.search(text) for regex in skill.regexes)]
+        for text in texts
+    ]
+
+
+def test_matrix_matches_per_description_search() -> None:
+    registry = get_skill_registry(SKILLS_REF)
+    matrix = CorpusMatcher(registry, buffer_chars=100).match(
+        (f"job-{i}", text) for i, text in enumerate(DESCRIPTIONS)
+    )
+    assert matrix.job_ids == [f"job-{i}" for i in range(len(DESCRIPTIONS))]
+    assert [matrix.row(i) for i in range(len(DESCRIPTIONS))] == _per_description(registry, DESCRIPTIONS)
+    assert len(matrix.indptr) == len(DESCRIPTIONS) + 1 and matrix.indptr[-1] == matrix.nnz
+
+
+def test_buffer_scan_ignores_matches_across_descriptions(tmp_path: Path) -> None:
+    ref = tmp_path / "skills.json"
+    ref.write_text(json.dumps({"skills": [
+        {"name": "XY", "patterns": [r"x\W+y|qqq"]},     # Unanchored: scanned over the joined buffer
+        {"name": "Start", "patterns": [r"^go\b|zzz"]},  # Anchored to the start: searched per description
+    ]}), encoding="utf-8")
+    registry = get_skill_registry(ref)
+    texts = ["ends with x", "y starts this", "x - y", "go first", "not go"]
+
+    matrix = CorpusMatcher(registry).match((str(i), text) for i, text in enumerate(texts))
+    assert [matrix.row(i) for i in range(len(texts))] == [[], [], ["XY"], ["Start"], []]
+    assert matrix.skill_counts() == {"XY": 1, "Start": 1}
+
+
+def test_context_free_detection() -> None:
+    assert context_free(r"\bC\+\+\b")
+    assert context_free(r"[^a-z]go\b")
+    assert not context_free(r"^go\b")
+    assert not context_free(r"\bgo(?!\w)")
+    assert not context_free(r"go\Z")
+
+
+def test_job_skills_table_and_batch_validation(make_jobs_db: JobsDbFactory) -> None:
+    db_path = make_jobs_db([(f"job-{i}", text, "Python, Excel") for i, text in enumerate(DESCRIPTIONS)])
+
+    registry = get_skill_registry(SKILLS_REF)
+    with sqlite3.connect(db_path) as conn:
+        matrix = CorpusMatcher(registry).match(conn.execute("SELECT job_id, job_description FROM jobs"))
+        assert write_job_skills(conn, matrix) == matrix.nnz
+        assert write_job_skills(conn, matrix) == matrix.nnz  # Rewriting replaces the rows
+        stored = conn.execute("SELECT COUNT(*) FROM job_skills").fetchone()[0]
+        python_jobs = {row[0] for row in conn.execute("SELECT job_id FROM job_skills WHERE skill = 'Python'")}
+    assert stored == matrix.nnz
+    assert python_jobs == {"job-0", "job-2"}
+
+    validator = SkillValidator(str(db_path), str(SKILLS_REF))
+    batch = validator.validate_batch(limit=len(DESCRIPTIONS))
+    per_job = [validator.validate_job(text, "Python, Excel") for text in DESCRIPTIONS]
+    assert batch["total_true_positives"] == sum(len(r["true_positives"]) for r in per_job)
+    assert batch["total_false_negatives"] == sum(len(r["false_negatives"]) for r in per_job)
@@ -0,0 +1,95 @@
+"""Tests for the content-hash extraction cache
+Run with: python -m pytest tests/test_extraction_cache.py
+"""
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+from src.analysis.skill_extraction.extraction_cache import (
+    ExtractionCache,
+    description_hash,
+    extract_cached,
+    reference_version,
+)
+from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+DESCRIPTION = "Python and SQL with Apache Spark on AWS. Docker and Kubernetes a plus."
+
+calls: list[str] = []
+
+
+def _upper(text: str) -> list[str]:
+    calls.append(text)
+    return [text.upper()]
+
+
+def _upper_factory() -> Callable[[str], list[str]]:
+    return _upper
+
+
+def test_extractor_reuses_cached_result(tmp_path: Path) -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF, cache_db=str(tmp_path / "cache.db"))
+    first = extractor.extract(DESCRIPTION)
+    scored = extractor.extract(DESCRIPTION, return_confidence=True)
+    before = extractor.cache.stats()
+
+    # Same description as reposted elsewhere: other line endings, padding
+    repost = extractor.extract("\r\n  " + DESCRIPTION.replace(". ", ".\r\n") + "  \n")
+    assert extractor.extract(DESCRIPTION) == first
+    assert sorted(skill for skill, _ in scored) == first
+    assert first and repost
+
+    after = extractor.cache.stats()
+    assert after["misses"] - before["misses"] == 1  # only the repost with new line breaks
+    assert after["memory_hits"] - before["memory_hits"] == 1
+
+
+def test_results_persist_across_processes(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "cache.db")
+    version = reference_version(SKILLS_REF)
+    key = description_hash(DESCRIPTION)
+    ExtractionCache("test", db_path).put(key, version, [["Python", 0.9]])
+
+    fresh = ExtractionCache("test", db_path)
+    assert fresh.get(key, version) == [["Python", 0.9]]
+    assert fresh.get(key, "other-version") is None
+    assert fresh.stats()["disk_hits"] == 1
+    assert fresh.stats()["misses"] == 1
+
+
+def test_reference_change_invalidates(tmp_path: Path) -> None:
+    reference = tmp_path / "skills.json"
+    reference.write_text(json.dumps({"skills": [{"name": "Python", "patterns": [r"\bpython\b"]}]}))
+    old_version = reference_version(reference)
+
+    cache = ExtractionCache("test", str(tmp_path / "cache.db"))
+    cache.put("a", old_version, ["Python"])
+    cache.put("b", old_version, ["Python"])
+
+    reference.write_text(json.dumps({"skills": [{"name": "Go", "patterns": [r"\bgolang\b"]}]}))
+    new_version = reference_version(reference)
+    assert new_version != old_version
+    assert cache.get("a", new_version) is None
+
+    cache.put("c", new_version, ["Go"])
+    fresh = ExtractionCache("test", str(tmp_path / "cache.db"))
+    assert fresh.get("a", old_version) is None  # purged on the first write of the new version
+    assert fresh.get("c", new_version) == ["Go"]
+
+
+def test_extract_cached_extracts_each_description_once() -> None:
+    calls.clear()
+    cache = ExtractionCache("test")
+    cache.put(description_hash("known"), "v1", ["FROM CACHE"])
+    jobs = list(enumerate(["a", "b", "a", "", "known", "b\r\n", "c"] * 2))
+
+    results = list(extract_cached(jobs, cache, "v1", _upper_factory, chunk_size=2))
+    expected = {"a": ["A"], "b": ["B"], "b\r\n": ["B"], "": [], "known": ["FROM CACHE"], "c": ["C"]}
+    assert results == [(i, expected[text]) for i, text in jobs]
+    assert sorted(calls) == ["a", "b", "c"]
+
+    stats = cache.stats()
+    assert stats["misses"] == 3
+    assert stats["memory_hits"] == 9
@@ -0,0 +1,146 @@
+"""Tests for the shared extraction executor used by the async scrapers
+Run with: python -m pytest tests/test_extraction_executor.py
+"""
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
+from src.analysis.skill_extraction.prepared_text import PreparedText
+from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.scraper.unified.scalable.extraction_executor import (
+    ExtractionExecutor,
+    extract_and_validate,
+    extract_and_validate_fused,
+)
+from src.validation.single_job_validator import SingleJobValidator
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+DESCRIPTION = "Python, PYTHON and SQL with Apache Spark on AWS; Docker and Kubernetes a plus"
+
+
+def test_result_matches_direct_call() -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF)
+    validator = SkillValidator(SKILLS_REF)
+    executor = ExtractionExecutor(max_workers=2)
+    try:
+        result = asyncio.run(executor.extract_skills(extractor, validator, DESCRIPTION))
+    finally:
+        executor.shutdown()
+
+    assert result == extract_and_validate(extractor, validator, DESCRIPTION)
+    assert result.validated_skills == ", ".join(sorted(validator.validate_and_extract(DESCRIPTION)))
+    assert len({s.lower() for s in result.extracted_skills}) == len(result.extracted_skills)
+
+
+def test_fused_pass_matches_validated_chain() -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF)
+    validator = SkillValidator(SKILLS_REF)
+    single_job_validator = SingleJobValidator(SKILLS_REF)
+    stored_chars = 120
+    descriptions = [
+        DESCRIPTION,
+        "İnformatica and PoſtgreSQL on Azure, PYTHON and Power BI",
+        "Excel " * 20 + "then Kubernetes, Terraform and Snowflake past the stored text",  # Truncated
+        "No skills at all here",
+        "",
+    ]
+    for description in descriptions:
+        # The scraper's chain: extract + validate, store truncated, then fix FPs/FNs
+        result = extract_and_validate(extractor, validator, description)
+        expected = single_job_validator.validate_and_fix(
+            "job", description[:stored_chars], result.validated_skills, result.extraction
+        ).validated_skills
+
+        fused = extract_and_validate_fused(
+            extractor, single_job_validator, PreparedText(description).head(stored_chars)
+        )
+        assert {s for s in fused.validated_skills.split(", ") if s} == expected
+    # Skills only past the stored text are what the fix step drops
+    truncated = descriptions[2]
+    assert "Kubernetes" in extract_and_validate(extractor, validator, truncated).validated_skills
+    fused = extract_and_validate_fused(extractor, single_job_validator, truncated[:stored_chars])
+    assert "Kubernetes" not in fused.validated_skills
+
+
+def test_backpressure_bounds_in_flight_calls() -> None:
+    executor = ExtractionExecutor(max_workers=2, max_pending=3)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work(i: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return i
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(executor.run(work, i) for i in range(12)))
+
+    try:
+        assert asyncio.run(main()) == list(range(12))
+    finally:
+        executor.shutdown()
+
+    metrics = executor.metrics()
+    assert peak <= 2
+    assert metrics["calls"] == 12
+    assert metrics["peak_in_flight"] == 3
+    assert metrics["in_flight"] == 0
+    assert metrics["max_wait_ms"] > 0
+
+
+def test_failures_and_timeouts_are_counted() -> None:
+    executor = ExtractionExecutor(max_workers=1, timeout=0.01)
+
+    def boom() -> None:
+        raise ValueError("bad pattern")
+
+    async def main() -> None:
+        with pytest.raises(ValueError):
+            await executor.run(boom)
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(time.sleep, 0.2)
+
+    try:
+        asyncio.run(main())
+    finally:
+        executor.shutdown()
+
+    metrics = executor.metrics()
+    assert metrics["calls"] == 2
+    assert metrics["failed"] == 1
+    assert metrics["timed_out"] == 1
+    assert metrics["in_flight"] == 0
+
+
+def test_event_loop_stays_responsive() -> None:
+    executor = ExtractionExecutor(max_workers=1)
+
+    async def main() -> int:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.1)
+        task.cancel()
+        return ticks
+
+    try:
+        assert asyncio.run(main()) >= 5
+    finally:
+        executor.shutdown()
@@ -0,0 +1,99 @@
+"""Tests for the structured single-pass extraction result
+Run with: python -m pytest tests/test_extraction_result.py
+"""
+from pathlib import Path
+
+from src.analysis.skill_extraction.confidence_scorer import ConfidenceScorer
+from src.analysis.skill_extraction.context_filter import filter_degree_result
+from src.analysis.skill_extraction.extraction_result import ExtractionResult
+from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
+from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.validation.realtime_validator import validate_skills_in_process
+from src.validation.single_job_validator import SingleJobValidator
+from src.validation.validation_pipeline import SkillValidator as PipelineValidator
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+DESCRIPTIONS = [
+    "Statistics and Python daily, Python again. Master's degree in Statistics required",
+    "Strong experience with Docker and Kubernetes; using Terraform on AWS; SQL, SQL, SQL",
+    "Kubernetes and PoſtgreSQL and İnformatica on Azure Blob Storage",
+    "MACHINE LEARNING\x1cdeep learning, C#, .NET Core and R\r\n",
+]
+
+
+def test_spans_counts_and_detection() -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF)
+    for description in DESCRIPTIONS:
+        result = extractor.extract_result(description)
+        assert result.text == description.strip().replace("\r\n", "\n")
+        assert extractor.extract(description, return_confidence=True) == list(result.skills)
+        # Validated skills are what the JS-semantics validator finds, ASCII text or not
+        assert result.skill_names == validate_skills_in_process(result.text, SKILLS_REF)
+        assert set(result.skill_names) <= result.detected
+
+        for skill, occurrence in result.occurrences.items():
+            assert occurrence.match_count == len(occurrence.spans) >= 1
+            assert list(occurrence.spans) == sorted(occurrence.spans)
+            for (_, end), (start, _) in zip(occurrence.spans, occurrence.spans[1:]):
+                assert end <= start
+            assert occurrence.skill == skill
+
+    result = extractor.extract_result(DESCRIPTIONS[1])
+    assert result.occurrences["SQL"].match_count == 3
+    assert result.occurrences["SQL"].layer == 3
+    assert result.occurrences["SQL"].pattern_id == r"\bSQL\b"
+    assert result.occurrences["Docker and Kubernetes"].layer == 2
+    assert result.occurrences["Docker and Kubernetes"].pattern_id == "experience"
+    # Layer 2 consumed the region, but detection still saw the reference skills in it
+    assert "Docker" not in result.occurrences
+    assert {"Docker", "Kubernetes"} <= result.detected
+    # Repeated matches raise confidence instead of counting once
+    assert dict(result.skills)["SQL"] > ConfidenceScorer().calculate("SQL", "skills_reference", 1, True)
+
+
+def test_cached_result_round_trips() -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF)
+    result = extractor.extract_result(DESCRIPTIONS[0])
+    assert ExtractionResult.from_payload(result.text, result.to_payload()) == result
+    assert extractor.extract_result(DESCRIPTIONS[0]) == result  # Served from the cache
+    assert extractor.extract_result("   ") == ExtractionResult("", {}, frozenset())
+
+
+def test_validators_reuse_the_result() -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF)
+    validator = SkillValidator(SKILLS_REF)
+    single = SingleJobValidator(SKILLS_REF)
+    pipeline = PipelineValidator(skills_ref_path=SKILLS_REF)
+    for description in DESCRIPTIONS:
+        result = extractor.extract_result(description)
+        text = result.text
+        assert validator.validate_and_extract(text, result) == validator.validate_and_extract(text)
+        assert validator.calculate_accuracy(text, "Python, Excel", result) == validator.calculate_accuracy(
+            text, "Python, Excel"
+        )
+        assert pipeline.validate_job(text, "Python, Excel", result) == pipeline.validate_job(text, "Python, Excel")
+
+        fixed = single.validate_and_fix("job", description, "Python, Excel", result)
+        assert fixed == single.validate_and_fix("job", text, "Python, Excel")
+
+    # A result of another description is ignored
+    other = extractor.extract_result("Python only")
+    assert other.detected_in(DESCRIPTIONS[1], validator.reference_hash) is None
+    assert validator.validate_and_extract(DESCRIPTIONS[1], other) == validator.validate_and_extract(DESCRIPTIONS[1])
+
+
+def test_degree_filter_uses_recorded_spans() -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF)
+    result = extractor.extract_result(DESCRIPTIONS[0])
+    assert result.occurrences["Statistics"].match_count == 2
+
+    filtered = filter_degree_result(result)
+    assert filtered.occurrences["Statistics"].match_count == 1
+    assert dict(filtered.skills)["Statistics"] < dict(result.skills)["Statistics"]
+    assert dict(filtered.skills)["Python"] == dict(result.skills)["Python"]
+
+    degree_only = filter_degree_result(extractor.extract_result("Master's degree in Statistics. Python."))
+    assert "Statistics" not in degree_only.occurrences
+    assert degree_only.skill_names == ["Python"]
+    assert filter_degree_result(result, skills_to_check=set()) is result
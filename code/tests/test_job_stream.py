@@ -0,0 +1,61 @@
+"""Tests for keyset-paginated job streaming and resumable re-extraction
+Run with: python -m pytest tests/test_job_stream.py
+"""
+import sqlite3
+from pathlib import Path
+
+from src.analysis.skill_extraction.batch_reextract import REEXTRACT_CHECKPOINT, reextract_all_jobs
+from src.analysis.skill_extraction.extraction_cache import reference_version
+from src.analysis.skill_extraction.job_stream import (
+    SkillUpdateWriter,
+    count_jobs,
+    iter_jobs,
+    load_checkpoint,
+)
+from tests.conftest import JobsDbFactory
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+
+def _rows(count: int = 10) -> list[tuple[str, str | None, str]]:
+    # Inserted out of key order so pagination cannot lean on rowid order
+    return [(f"job-{i:02d}", None if i == 4 else f"Python and SQL {i}", "") for i in reversed(range(count))]
+
+
+def test_iter_jobs_pages_by_keyset(make_jobs_db: JobsDbFactory) -> None:
+    conn = sqlite3.connect(make_jobs_db(_rows()))
+    ids = [row.job_id for row in iter_jobs(conn, page_size=3)]
+    assert ids == [f"job-{i:02d}" for i in range(10) if i != 4]
+    assert [row.job_id for row in iter_jobs(conn, page_size=3, after_job_id="job-06")] == ids[-3:]
+    assert count_jobs(conn) == 9
+    assert count_jobs(conn, "job-06") == 3
+
+
+def test_writer_batches_updates_with_checkpoint(make_jobs_db: JobsDbFactory) -> None:
+    conn = sqlite3.connect(make_jobs_db(_rows()))
+    writer = SkillUpdateWriter(conn, "test", "v1")
+    writer.record("job-00", "Python")
+    writer.record("job-01", None)
+    writer.flush()
+
+    assert writer.written == 1
+    assert conn.execute("SELECT skills FROM jobs WHERE job_id = 'job-00'").fetchone() == ("Python",)
+    assert load_checkpoint(conn, "test", "v1") == "job-01"
+    assert load_checkpoint(conn, "test", "v2") is None
+
+
+def test_reextraction_resumes_after_checkpoint(make_jobs_db: JobsDbFactory) -> None:
+    db_path = make_jobs_db(_rows())
+    conn = sqlite3.connect(db_path)
+    writer = SkillUpdateWriter(conn, REEXTRACT_CHECKPOINT, reference_version(SKILLS_REF))
+    writer.record("job-06", None)  # An earlier run committed up to job-06
+    writer.flush()
+    conn.close()
+
+    stats = reextract_all_jobs(str(db_path), SKILLS_REF, batch_size=2, use_cache=False, resume=True)
+    assert stats["total_jobs"] == stats["processed"] == 3
+
+    with sqlite3.connect(db_path) as conn:
+        skills = dict(conn.execute("SELECT job_id, skills FROM jobs").fetchall())
+        assert load_checkpoint(conn, REEXTRACT_CHECKPOINT, reference_version(SKILLS_REF)) is None
+    assert [job_id for job_id, value in sorted(skills.items()) if value] == ["job-07", "job-08", "job-09"]
@@ -0,0 +1,49 @@
+"""Tests for layer 2 context extraction with the compiled context patterns
+Run with: python -m pytest tests/test_layer2_context.py
+"""
+import random
+import re
+from typing import Any
+
+from src.analysis.skill_extraction.advanced_regex_extractor import SKILL_CONTEXT_PATTERNS, layer2_extract_context
+
+FRAGMENTS = [
+    "Experience with ", "experience with ", "proficient in ", "expert at ", "using ", "building ",
+    "knowledge of ", "hands-on experience with ", "must have ", "requires experience with ", "requires ",
+    "Docker and Kubernetes", "Python", "SQL", "Apache Spark", ". ", ", ", "\n", " ", "x",
+]
+
+
+def _legacy(text: str, consumed: list[tuple[int, int]]) -> list[dict[str, Any]]:
+    skills: list[dict[str, Any]] = []
+    taken = list(consumed)
+    for context_name, pattern in SKILL_CONTEXT_PATTERNS.items():
+        for match in re.finditer(pattern, text):
+            start, end = match.span(1)
+            if any(s <= start < e or s < end <= e for s, e in taken):
+                continue
+            skills.append({
+                'skill': match.group(1).strip(), 'start': start, 'end': end, 'context': context_name, 'layer': 2
+            })
+            taken.append((start, end))
+    return skills
+
+
+def test_matches_per_pattern_finditer() -> None:
+    rng = random.Random(16)
+    for _ in range(300):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        consumed = [(start, start + 4) for start in rng.sample(range(len(text) + 1), min(2, len(text) + 1))]
+        skills, spans = layer2_extract_context(text, consumed)
+        assert skills == _legacy(text, consumed)
+        assert all(spans.overlaps(skill['start'], skill['end']) for skill in skills)
+
+
+def test_earlier_patterns_claim_overlapping_spans() -> None:
+    # "experience" runs before "action" and "requirement", so its span wins
+    skills, _ = layer2_extract_context("Must have experience with Docker and using Python", [])
+    assert [(skill['skill'], skill['context']) for skill in skills] == [("Docker and using Python", "experience")]
+
+    skills, spans = layer2_extract_context("Experience with Docker; proficient in Python. requires SQL", [(16, 22)])
+    assert [(skill['skill'], skill['context']) for skill in skills] == [("Python", "skilled"), ("SQL", "requirement")]
+    assert list(spans) == [(16, 22), (38, 44), (55, 58)]
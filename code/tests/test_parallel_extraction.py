@@ -0,0 +1,57 @@
+"""Tests for multi-process batch skill extraction
+Run with: python -m pytest tests/test_parallel_extraction.py
+"""
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+from src.analysis.skill_extraction.batch_processor import extract_skills_batch
+from src.analysis.skill_extraction.batch_reextract import reextract_all_jobs
+from src.analysis.skill_extraction.parallel_extraction import extract_parallel
+from tests.conftest import JobsDbFactory
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+DESCRIPTIONS = [
+    "Python and SQL with Apache Spark on AWS",
+    "",
+    "Experience with Kubernetes, Docker and Terraform",
+    "React Native, TypeScript and Node.js",
+    "Bachelor's degree in Computer Science; Tableau and Power BI",
+] * 7
+
+
+def _word_count(text: str) -> list[str]:
+    return [str(len(text.split()))]
+
+
+def _word_counter() -> Callable[[str], list[str]]:
+    return _word_count
+
+
+def test_results_stream_back_in_order() -> None:
+    jobs = [(i, "word " * i) for i in range(50)]
+    results = list(extract_parallel(jobs, _word_counter, workers=3, chunk_size=4))
+    assert results == [(i, [str(i)] if i else []) for i in range(50)]
+
+
+def test_parallel_batch_matches_single_process() -> None:
+    single = extract_skills_batch(DESCRIPTIONS)
+    assert extract_skills_batch(DESCRIPTIONS, workers=2, chunk_size=3) == single
+    assert single[1] == []
+
+
+def test_parallel_reextract_matches_single_process(make_jobs_db: JobsDbFactory) -> None:
+    # Separate directories: each database gets its own extraction cache
+    rows = [(f"job-{i}", text, "Python") for i, text in enumerate(DESCRIPTIONS)]
+    db_paths = [make_jobs_db(rows, name="single/jobs.db"), make_jobs_db(rows, name="parallel/jobs.db")]
+
+    single = reextract_all_jobs(str(db_paths[0]), SKILLS_REF, batch_size=4)
+    parallel = reextract_all_jobs(str(db_paths[1]), SKILLS_REF, batch_size=4, workers=2, chunk_size=3)
+    assert single == parallel
+
+    rows = []
+    for db_path in db_paths:
+        with sqlite3.connect(db_path) as conn:
+            rows.append(conn.execute("SELECT job_id, skills FROM jobs ORDER BY job_id").fetchall())
+    assert rows[0] == rows[1]
@@ -0,0 +1,81 @@
+"""Tests for the combined layer 3 pattern engine
+Run with: python -m pytest tests/test_pattern_engine.py
+"""
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.analysis.skill_extraction.layer3_direct import layer3_extract_direct
+from src.analysis.skill_extraction.pattern_engine import SkillPatternEngine
+from src.analysis.skill_extraction.pattern_literals import anchor_literal, required_literal
+
+SKILLS_REF = Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json"
+
+with open(SKILLS_REF, "r", encoding="utf-8") as f:
+    REFERENCE = json.load(f)["skills"]
+
+ENGINE = SkillPatternEngine(REFERENCE)
+
+
+def _random_description(seed: int, length: int = 5000) -> str:
+    """Skill names and their case/spacing variants mixed with filler prose"""
+    rng = random.Random(seed)
+    names = [s["name"] for s in REFERENCE]
+    filler = "we build reliable data products with partners across the business".split()
+    words: list[str] = []
+    while sum(len(w) + 1 for w in words) < length:
+        if rng.random() < 0.2:
+            name = rng.choice(names)
+            words.append(rng.choice([name, name.upper(), name.lower(), name.replace(" ", "-")]))
+        else:
+            words.append(rng.choice(filler))
+    return " ".join(words)[:length]
+
+
+@pytest.mark.parametrize("pattern, literal", [
+    (r"\bPython\b", "python"),
+    (r"\bAzure\ Blob\ Storage\b", "azure blob storage"),
+    (r"\bAzure\s+Blob\s+Storage\b", "storage"),
+    (r"\bGlue\s+crawlers?\b", "crawler"),
+    (r"\bGo\s*\(Golang\)\b", "(golang)"),
+    (r"\bC\#\b", "c#"),
+    (r"\b(Python|SQL|SAS),\s*R,", "r,"),
+    (r"\bAI|ML\b", None),
+    (r"\b\x41WS\b", "ws"),
+])
+def test_required_literal(pattern: str, literal: str | None) -> None:
+    assert required_literal(pattern) == literal
+
+
+@pytest.mark.parametrize("pattern, anchor", [
+    (r"\bPython\b", "python"),
+    (r"\bAzure\s+Blob\s+Storage\b", "azure"),
+    (r"\bGlue\s+jobs?\b", "glue"),
+    (r"\bjobs?\b", "job"),
+    (r"\b(Python|SQL|SAS),\s*R,", None),
+    (r",\s*R,\s*(Python|SQL|SAS)", ","),
+    (r"\bAI|ML\b", None),
+])
+def test_anchor_literal(pattern: str, anchor: str | None) -> None:
+    assert anchor_literal(pattern) == anchor
+
+
+@pytest.mark.parametrize("text", [
+    _random_description(seed) for seed in range(10)
+] + [
+    "Kubernetes, PoſtgreSQL, İnformatica and ınformatica",
+    "React Native and React, Google Cloud Platform (GCP), C#, .NET and CI/CD",
+])
+def test_prefilter_never_drops_a_match(text: str) -> None:
+    expected = list(ENGINE.iter_matches(text, use_prefilter=False))
+    assert list(ENGINE.iter_matches(text)) == expected
+
+
+def test_layer3_respects_consumed_spans() -> None:
+    text = "Experience with Python and SQL"
+    consumed = [(16, 22)]
+    skills = {m["skill"] for m in layer3_extract_direct(text, consumed, REFERENCE, ENGINE)}
+    assert "SQL" in skills
+    assert "Python" not in skills
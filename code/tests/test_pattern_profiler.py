@@ -0,0 +1,139 @@
+"""Tests for the pattern cost profiler and the per-pattern time budget
+Run with: python -m pytest tests/test_pattern_profiler.py
+"""
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.analysis.skill_extraction.extraction_cache import description_hash, reference_version
+from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
+from src.analysis.skill_extraction.pattern_engine import PatternBudget
+from src.analysis.skill_extraction.pattern_profiler import profile_registry, stress_unit
+from src.analysis.skill_extraction.pattern_registry import DEFAULT_SKILLS_REF_PATH, get_skill_registry
+
+SKILLS = [
+    {"name": "Python", "patterns": [r"\bPython\b"]},
+    {"name": "Machine Learning", "patterns": [r"\bmachine\s+learning\b"]},
+    {"name": "Adobe Creative Suite", "patterns": [r"\bADOBE\S+CREATIVE\S+SUITE\b"]},
+]
+CORPUS = [
+    "Python developer with machine learning and Adobe-Creative-Suite skills",
+    "Data engineer, python and SQL",
+]
+SKILLS_REF = Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json"
+
+
+def _registry(tmp_path: Path):
+    path = tmp_path / "skills_reference.json"
+    path.write_text(json.dumps({"skills": SKILLS}), encoding="utf-8")
+    return get_skill_registry(path)
+
+
+def test_stress_unit() -> None:
+    assert stress_unit(r"\bADOBE\S+CREATIVE\S+SUITE\b") == "adobe-creative-"
+    assert stress_unit(r"\bA/B\S+TESTING\b") == "a/b-"
+    assert stress_unit(r"\bPython\b") == "python-"
+    assert stress_unit(r"\b\d+\b") == "x"
+
+
+def test_profile_flags_backtracking_patterns(tmp_path: Path) -> None:
+    costs = profile_registry(_registry(tmp_path), CORPUS, max_stress_chars=4000)
+    by_pattern = {cost.pattern: cost for cost in costs}
+
+    assert [cost.total for cost in costs] == sorted((cost.total for cost in costs), reverse=True)
+    assert set(by_pattern) == {p for skill in SKILLS for p in skill["patterns"]}
+    assert by_pattern[r"\bPython\b"].skills == ("Python",)
+    assert all(0 <= cost.worst_text < len(CORPUS) and cost.worst <= cost.total for cost in costs)
+
+    assert by_pattern[r"\bADOBE\S+CREATIVE\S+SUITE\b"].pathological
+    assert not by_pattern[r"\bPython\b"].pathological
+    assert not by_pattern[r"\bmachine\s+learning\b"].pathological
+
+
+def test_budget_drops_slow_patterns(tmp_path: Path) -> None:
+    engine = _registry(tmp_path).engine
+    text = CORPUS[0]
+    expected = [(entry.pattern, start, end) for entry, start, end in engine.iter_matches(text)]
+
+    generous = PatternBudget(60.0)
+    assert [(e.pattern, s, t) for e, s, t in engine.iter_matches(text, budget=generous)] == expected
+    assert generous.exceeded == {}
+
+    # Nothing fits in a zero budget: every pattern overruns, but is only
+    # quarantined once it has done so on `strikes` texts
+    exhausted = PatternBudget(0.0, strikes=2)
+    list(engine.iter_matches(text, budget=exhausted))
+    assert exhausted.exceeded == {}
+    list(engine.iter_matches(text, budget=exhausted))
+    assert set(exhausted.exceeded) == {pattern for pattern, _, _ in expected}
+    skipped: list[str] = []
+    assert list(engine.iter_matches(text, budget=exhausted, skipped=skipped)) == []
+    assert set(skipped) == set(exhausted.exceeded)
+
+
+def _descriptions(count: int) -> list[str]:
+    names = [s["name"] for s in json.loads(SKILLS_REF.read_text(encoding="utf-8"))["skills"]]
+    filler = "we need someone who enjoys building reliable products with the business".split()
+    rng = random.Random(23)
+    return [
+        " ".join(rng.choice(names) if rng.random() < 0.2 else rng.choice(filler) for _ in range(rng.randint(40, 300)))
+        for _ in range(count)
+    ]
+
+
+def test_budget_ignores_contention_and_the_callers_work() -> None:
+    engine = get_skill_registry(SKILLS_REF).engine
+    texts = _descriptions(120)
+    expected = [[(e.pattern, s, t) for e, s, t in engine.iter_matches(text)] for text in texts]
+    budget = PatternBudget(0.002, strikes=1)
+
+    def consume(text: str) -> tuple[list[tuple[str, int, int]], list[str]]:
+        matches: list[tuple[str, int, int]] = []
+        skipped: list[str] = []
+        for entry, start, end in engine.iter_matches(text, budget=budget, skipped=skipped):
+            matches.append((entry.pattern, start, end))
+            # The caller's own work, done while the pattern's search is suspended
+            if len(matches) % 25 == 0:
+                time.sleep(0.001)
+            else:
+                sum(range(2000))
+        return matches, skipped
+
+    stop = threading.Event()
+
+    def spin() -> None:
+        while not stop.is_set():
+            sum(range(10000))
+
+    spinners = [threading.Thread(target=spin) for _ in range(3)]
+    for spinner in spinners:
+        spinner.start()
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(consume, texts))
+    finally:
+        stop.set()
+        for spinner in spinners:
+            spinner.join()
+
+    assert budget.overruns == {} and budget.exceeded == {}
+    assert [matches for matches, _ in results] == expected
+    assert all(skipped == [] for _, skipped in results)
+
+
+def test_partial_extractions_are_not_cached_or_reused() -> None:
+    text = "Senior engineer: Python, SQL, Docker and Kubernetes on AWS (partial-result test 23)"
+    extractor = AdvancedSkillExtractor(str(SKILLS_REF), pattern_time_budget=0.0)
+    extractor.pattern_budget = PatternBudget(0.0, strikes=1)
+    partial = extractor.extract_result(text)
+    assert extractor.pattern_budget.exceeded
+    version = reference_version(str(SKILLS_REF), DEFAULT_SKILLS_REF_PATH)
+    assert extractor.cache.get(description_hash(partial.text), version) is None
+
+    complete = AdvancedSkillExtractor(str(SKILLS_REF)).extract_result(text)
+    # Validated by the full validator, not from the incomplete layer 3 pass
+    assert partial.skill_names == complete.skill_names
+    assert partial.detected_in(text, complete.reference) is None
@@ -0,0 +1,95 @@
+"""Tests for the process-wide compiled skills registry
+Run with: python -m pytest tests/test_pattern_registry.py
+"""
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.validation.realtime_validator import compile_js_pattern, validate_skills_in_process
+from src.validation.single_job_validator import SingleJobValidator
+
+SKILLS_REF = Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json"
+
+
+def _write_reference(path: Path, skills: list[dict[str, Any]]) -> None:
+    path.write_text(json.dumps({"skills": skills}), encoding="utf-8")
+
+
+def test_same_registry_for_same_file() -> None:
+    first = get_skill_registry(SKILLS_REF)
+    second = get_skill_registry(str(SKILLS_REF))
+    assert first is second
+    assert first.engine is second.engine
+
+
+def test_consumers_share_compiled_patterns() -> None:
+    registry = get_skill_registry(SKILLS_REF)
+    validator = SingleJobValidator(str(SKILLS_REF))
+    skill = next(s for s in registry.skills if s.name == "Python")
+    assert validator.skill_patterns["python"][0] is skill.regexes[0]
+    assert SkillValidator(str(SKILLS_REF)).validate_and_extract("We use Python") >= {"Python"}
+
+
+def test_reloads_when_content_changes(tmp_path: Path) -> None:
+    ref = tmp_path / "skills.json"
+    _write_reference(ref, [{"name": "Python", "patterns": [r"\bPython\b"]}])
+    first = get_skill_registry(ref)
+
+    # Touching the file without changing it keeps the compiled registry
+    stat = ref.stat()
+    os.utime(ref, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert get_skill_registry(ref) is first
+
+    _write_reference(ref, [{"name": "Rust", "patterns": [r"\bRust\b"]}])
+    os.utime(ref, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+    second = get_skill_registry(ref)
+    assert second is not first
+    assert [s.name for s in second.skills] == ["Rust"]
+    assert second.content_hash != first.content_hash
+
+
+def test_invalid_patterns_are_dropped(tmp_path: Path) -> None:
+    ref = tmp_path / "skills.json"
+    _write_reference(ref, [{"name": "Broken", "patterns": ["(unclosed", r"\bok\b"]}])
+    registry = get_skill_registry(ref)
+    assert registry.invalid_patterns == ("(unclosed",)
+    assert len(registry.skills[0].regexes) == 1
+
+
+def test_missing_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        get_skill_registry(tmp_path / "missing.json")
+
+
+def test_lazy_regexes_match_eager_compilation(tmp_path: Path) -> None:
+    ref = tmp_path / "skills.json"
+    _write_reference(ref, [
+        {"name": "Python", "patterns": [r"\bPython\b", r"\bpython3\b"]},
+        {"name": "Go", "patterns": [r"\bGo\b"]},
+    ])
+    registry = get_skill_registry(ref)
+    assert len(registry.skills[0].regexes) == 1  # Length known without compiling
+    assert [r.pattern for r in registry.skills[0].regexes] == [r"(?:\bPython\b|\bpython3\b)"]
+    assert registry.skills[1].regexes[0] is registry.pattern_cache[r"\bGo\b"]
+    assert registry.engine.entries[0].regex.flags & re.IGNORECASE
+
+
+def test_realtime_prefilter_matches_full_scan() -> None:
+    registry = get_skill_registry(SKILLS_REF)
+    texts = [
+        "Senior engineer: Python, SQL, Apache Spark, AWS Glue, React Native and C++",
+        "\u212aubernetes and Po\u017ftgreSQL; .NET, C#, CI/CD and A/B testing",
+        "No technical content here at all",
+    ]
+    for text in texts:
+        full_scan = {
+            skill.name for skill in registry.skills
+            if any(compile_js_pattern(p).search(text) for p in skill.patterns)
+        }
+        assert validate_skills_in_process(text, str(SKILLS_REF)) == sorted(full_scan), text
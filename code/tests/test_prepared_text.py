@@ -0,0 +1,68 @@
+"""Tests for the shared per-description text views
+Run with: python -m pytest tests/test_prepared_text.py
+"""
+import re
+from pathlib import Path
+
+from src.analysis.skill_extraction.extractor import AdvancedSkillExtractor
+from src.analysis.skill_extraction.prepared_text import PreparedText, prepare_text
+from src.analysis.skill_extraction.regex.skill_matcher import match_skills_in_text
+from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.models.models import JobDetailModel
+from src.scraper.unified.linkedin.job_validator import (
+    JobValidator,
+    detect_non_english_language,
+    is_english_content,
+)
+from src.scraper.unified.scalable.extraction_executor import extract_and_validate
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+DESCRIPTIONS = [
+    "Senior Data Engineer: strong experience with Python, SQL and Apache Spark. Join our team, "
+    "work on data analysis projects and support the business with excellent knowledge.",
+    "  İnformatica and PoſtgreSQL\r\n on Azure; Erfahrung, Anforderungen und Kenntnisse in Python  ",
+    "",
+]
+
+
+def test_views_are_built_once_and_shared() -> None:
+    for text in DESCRIPTIONS:
+        prepared = PreparedText(text)
+        assert prepared.lower == text.lower() and prepared.lower is prepared.lower
+        assert prepared.collapsed.text == " ".join(text.split())
+        assert prepared.normalized.normalized is prepared.normalized
+        assert prepare_text(prepared) is prepared
+        head = prepared.head(20)
+        assert head.text == text[:20] and head.lower == text[:20].lower()
+
+    clean = PreparedText("already clean")
+    assert clean.collapsed is clean and clean.normalized is clean
+    # Lowercasing İ adds a character, so the head cannot slice the shared lowercase
+    assert PreparedText("İİİİ Python").head(3).lower == "İİİ".lower()
+
+
+def test_stages_accept_prepared_text() -> None:
+    extractor = AdvancedSkillExtractor(SKILLS_REF)
+    validator = SkillValidator(SKILLS_REF)
+    patterns = {"Python": [re.compile(r"\bpython\b")]}
+    for text in DESCRIPTIONS:
+        prepared = PreparedText(text)
+        assert detect_non_english_language(prepared) == detect_non_english_language(text)
+        assert is_english_content(prepared) == is_english_content(text)
+        assert validator.validate_and_extract(prepared) == validator.validate_and_extract(text)
+        assert match_skills_in_text(prepared, patterns) == match_skills_in_text(text, patterns)
+        assert extractor.extract_result(prepared) == extractor.extract_result(text)
+        assert extract_and_validate(extractor, validator, prepared) == extract_and_validate(
+            extractor, validator, text
+        )
+
+    job = JobDetailModel(
+        job_id="job-12345", platform="linkedin", actual_role="Data Engineer", url="https://example.com/1",
+        job_description=DESCRIPTIONS[0], skills="Python", company_name="Acme", posted_date=None,
+    )
+    job_validator = JobValidator()
+    assert job_validator.validate_job(job, PreparedText(DESCRIPTIONS[0])) == (True, "Valid job")
+    assert job_validator.validate_job(job) == (True, "Valid job")
+    # A view of another text is ignored
+    assert job_validator.validate_job(job, PreparedText(DESCRIPTIONS[1])) == (True, "Valid job")
@@ -0,0 +1,83 @@
+"""Parity tests: in-process real-time validator vs the Node.js validator
+Run with: python -m pytest tests/test_realtime_validator_parity.py
+"""
+import json
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.validation.realtime_validator import (
+    validate_skills_in_process,
+    validate_skills_via_node,
+)
+
+SKILLS_REF = str(Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json")
+
+# Hand-written descriptions covering the JS/Python regex differences:
+# unicode whitespace, non-ASCII word characters next to \b, case folding
+# of special characters, line terminators under `.`, and text that needs
+# escaping for the Node script
+FIXED_DESCRIPTIONS = [
+    "Senior Data Engineer with Python, SQL, Apache Spark and AWS Glue experience.",
+    "Experience with React Native, React, Node.js and TypeScript is required.",
+    "Azure\u00a0Blob\u00a0Storage and Google\u2003Cloud\u3000Platform experience",
+    "Azure\x1cBlob\x1cStorage, Power\x85BI and Machine\ufeffLearning",
+    "Pythonä developer, Kubernetesé, naïve Docker, Ünity, SQLß",
+    "\u212aubernetes and Po\u017ftgreSQL and \u0130nformatica",
+    "Use `backticks`, ${template} literals, $HOME and C:\\path\\to\\Java",
+    "It's the team's job to build CI/CD pipelines; can't skip A/B testing",
+    "Skills: .NET, C#, C++, F#, Node.JS, Vue.js, scikit-learn, 5G technology",
+    "MACHINE LEARNING, deep learning, Deep-Learning, NLP\nLLMs\r\nRAG\tagents",
+    "No technical content here at all, just a friendly hello.",
+    "strong skills in SQL\rand R is a plus",
+    "strong skills in SQL\u2028and R, code in Python\u2029then R",
+    "statistical software\r\nsuch as R; skills in Excel\nand R",
+]
+
+
+def _random_descriptions(count: int, seed: int = 42) -> list[str]:
+    """Build descriptions that mix skill names with filler prose"""
+    with open(SKILLS_REF, "r", encoding="utf-8") as f:
+        names = [s["name"] for s in json.load(f)["skills"]]
+    filler = (
+        "we need someone who enjoys building reliable products and "
+        "collaborating with stakeholders across the business"
+    ).split()
+    rng = random.Random(seed)
+    descriptions = []
+    for _ in range(count):
+        words = [
+            rng.choice(names) if rng.random() < 0.2 else rng.choice(filler)
+            for _ in range(rng.randint(40, 400))
+        ]
+        descriptions.append(" ".join(words))
+    return descriptions
+
+
+requires_node = pytest.mark.skipif(
+    shutil.which("node") is None, reason="Node.js not installed"
+)
+
+
+@requires_node
+@pytest.mark.parametrize("description", FIXED_DESCRIPTIONS + _random_descriptions(8))
+def test_in_process_matches_node(description: str) -> None:
+    expected = validate_skills_via_node(description, SKILLS_REF)
+    assert validate_skills_in_process(description, SKILLS_REF) == expected
+
+
+def test_dot_does_not_cross_line_terminators() -> None:
+    assert validate_skills_in_process("strong skills in SQL\rand R is a plus", SKILLS_REF) == ["SQL"]
+    assert validate_skills_in_process("strong skills in SQL\u2028and R is a plus", SKILLS_REF) == ["SQL"]
+    assert validate_skills_in_process("strong skills in SQL and R is a plus", SKILLS_REF) == ["R", "SQL"]
+
+
+def test_empty_description_returns_nothing() -> None:
+    assert validate_skills_in_process("", SKILLS_REF) == []
+    assert validate_skills_in_process("   \n ", SKILLS_REF) == []
+
+
+def test_missing_reference_returns_nothing() -> None:
+    assert validate_skills_in_process("Python and SQL", "/nonexistent/skills.json") == []
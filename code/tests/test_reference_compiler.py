@@ -0,0 +1,92 @@
+"""Tests for the skills reference compiler
+Run with: python -m pytest tests/test_reference_compiler.py
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.reference_compiler import (
+    artifact_literals,
+    artifact_path,
+    cached_artifact_path,
+    case_insensitive_key,
+    compile_reference,
+    dedupe_patterns,
+    load_artifact,
+    load_cached_artifact,
+    merge_patterns,
+    write_artifact,
+)
+from src.analysis.skill_extraction.pattern_literals import analyze_pattern
+
+SKILLS_REF = Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json"
+
+
+def test_case_variants_collapse() -> None:
+    assert dedupe_patterns([r"\b\.NET\b", r"\b\.NET\b", r"\b\.net\b"]) == [r"\b\.NET\b"]
+    assert dedupe_patterns(["TESTING", "Testing", "testing"]) == ["TESTING"]
+
+
+@pytest.mark.parametrize("first, second", [
+    (r"\bADOBE\S+XD\b", r"\badobe\s+xd\b"),
+    (r"\bR\b", r"\bR\B"),
+    (r"[A-Z]\+\+", r"[a-z]\+\+"),
+])
+def test_escapes_and_classes_keep_their_case(first: str, second: str) -> None:
+    assert case_insensitive_key(first) != case_insensitive_key(second)
+
+
+def test_merged_alternation_finds_the_same_skills() -> None:
+    data = json.loads(SKILLS_REF.read_text(encoding="utf-8"))
+    artifact = compile_reference(data, "test")
+    text = "Strong .net, Power BI, CI/CD pipelines and PoſtgreSQL; C# or c++ a plus"
+    for raw, compiled in zip(data["skills"], artifact["skills"]):
+        expected = any(re.search(p, text, re.IGNORECASE) for p in raw["patterns"])
+        merged = compiled["merged"]
+        assert merged is not None, raw["name"]
+        assert bool(re.search(merged, text, re.IGNORECASE)) == expected, raw["name"]
+
+
+def test_merge_refuses_backreferences() -> None:
+    assert merge_patterns([r"(a)\1", "b"]) is None
+    assert merge_patterns(["a"]) == "a"
+
+
+def test_committed_artifact_is_current() -> None:
+    source_hash = hashlib.sha256(SKILLS_REF.read_bytes()).hexdigest()
+    assert load_artifact(SKILLS_REF, source_hash) is not None, "run scripts/extraction/compile_skills_reference.py"
+
+
+def test_stale_artifact_is_ignored(tmp_path: Path) -> None:
+    ref = tmp_path / "skills.json"
+    ref.write_text(json.dumps({"skills": [{"name": "Go", "patterns": [r"\bGo\b", r"\bGO\b"]}]}), encoding="utf-8")
+    write_artifact(ref)
+    assert artifact_path(ref).exists()
+    assert get_skill_registry(ref).skills[0].patterns == (r"\bGo\b",)
+
+    ref.write_text(json.dumps({"skills": [{"name": "Rust", "patterns": [r"\bRust\b"]}]}), encoding="utf-8")
+    assert load_artifact(ref, hashlib.sha256(ref.read_bytes()).hexdigest()) is None
+    assert [s.name for s in get_skill_registry(ref).skills] == ["Rust"]
+
+
+def test_stale_artifact_is_cached_outside_the_source_tree(tmp_path: Path) -> None:
+    ref = tmp_path / "skills.json"
+    ref.write_text(json.dumps({"skills": [{"name": "Go", "patterns": [r"\bGo\b"]}]}), encoding="utf-8")
+    source_hash = hashlib.sha256(ref.read_bytes()).hexdigest()
+    assert [s.name for s in get_skill_registry(ref).skills] == ["Go"]
+    assert not artifact_path(ref).exists()
+    assert tmp_path not in cached_artifact_path(source_hash).parents
+    cached = load_cached_artifact(source_hash)
+    assert cached is not None and [s["name"] for s in cached["skills"]] == ["Go"]
+
+
+def test_artifact_literals_match_analysis() -> None:
+    artifact = compile_reference(json.loads(SKILLS_REF.read_text(encoding="utf-8")), "test")
+    literals = artifact_literals(artifact)
+    assert literals.keys() == {p for skill in artifact["skills"] for p in skill["patterns"]}
+    for pattern, analysis in literals.items():
+        assert analysis == analyze_pattern(pattern), pattern
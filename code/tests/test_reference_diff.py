@@ -0,0 +1,76 @@
+"""Tests for diff-driven incremental re-extraction
+Run with: python -m pytest tests/test_reference_diff.py
+"""
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from src.analysis.skill_extraction.batch_reextract import reextract_all_jobs, reextract_changed_skills
+from src.analysis.skill_extraction.reference_diff import diff_references
+from tests.conftest import JobsDbFactory
+
+OLD_REFERENCE: dict[str, Any] = {"skills": [
+    {"name": "Python", "patterns": [r"\bpython\b", r"\bPython\b"]},
+    {"name": "Java", "patterns": [r"\bjava\b"]},
+    {"name": "JavaScript", "patterns": [r"\bjavascript\b"]},
+    {"name": "SQL", "patterns": [r"\bsql\b"]},
+    {"name": "Spark", "patterns": [r"\bspark\b"]},
+    {"name": "Computer Science", "patterns": [r"\bcomputer science\b"]},
+]}
+
+DESCRIPTIONS = [
+    "Python and SQL on Spark",
+    "Java Script experience, Java 17",
+    "JavaScript and TypeScript",
+    "Bachelor's degree in Computer Science; Python",
+    "Go and Rust",
+    "Apache Spark with PySpark",
+]
+
+
+def _new_reference() -> dict[str, Any]:
+    reference = json.loads(json.dumps(OLD_REFERENCE))
+    skills = reference["skills"]
+    skills[2]["patterns"].append(r"\bjava\s+script\b")       # changed
+    skills.append({"name": "Go", "patterns": [r"\bgo\b"]})   # added
+    skills.append({"name": "PySpark", "patterns": [r"\bpyspark\b"]})
+    del skills[3]                                            # SQL removed
+    skills[0], skills[1] = skills[1], skills[0]              # moved, unchanged
+    return reference
+
+
+def _jobs_db(make_jobs_db: JobsDbFactory, name: str) -> str:
+    return str(make_jobs_db([(f"job-{i}", text, "") for i, text in enumerate(DESCRIPTIONS)], name=name))
+
+
+def _skills(db_path: str) -> list[tuple[str, str]]:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT job_id, skills FROM jobs ORDER BY job_id").fetchall()
+
+
+def test_diff_reports_added_removed_changed() -> None:
+    diff = diff_references(OLD_REFERENCE, _new_reference())
+    assert set(diff.added) == {"Go", "PySpark"}
+    assert set(diff.removed) == {"SQL"}
+    assert set(diff.changed) == {"JavaScript"}
+    assert diff_references(OLD_REFERENCE, OLD_REFERENCE).is_empty
+
+
+def test_incremental_matches_full_reextraction(tmp_path: Path, make_jobs_db: JobsDbFactory) -> None:
+    old_ref = tmp_path / "old.json"
+    new_ref = tmp_path / "new.json"
+    old_ref.write_text(json.dumps(OLD_REFERENCE))
+    new_ref.write_text(json.dumps(_new_reference()))
+
+    full_db = _jobs_db(make_jobs_db, "full.db")
+    incremental_db = _jobs_db(make_jobs_db, "incremental.db")
+    reextract_all_jobs(incremental_db, str(old_ref), use_cache=False)
+
+    stats = reextract_changed_skills(str(old_ref), incremental_db, str(new_ref), batch_size=2)
+    reextract_all_jobs(full_db, str(new_ref), use_cache=False)
+
+    assert _skills(incremental_db) == _skills(full_db)
+    assert stats["total_jobs"] == len(DESCRIPTIONS)
+    assert stats["jobs_affected"] == 5  # Only the degree/Python job is left alone
+    assert stats["skills_changed"] == 4
@@ -0,0 +1,80 @@
+"""Tests for pluggable regex backends
+Run with: python -m pytest tests/test_regex_backends.py
+"""
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.regex_backends import (
+    RegexBackend,
+    SkillMatcher,
+    available_backends,
+    get_regex_backend,
+    skill_matcher,
+)
+from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.validation.validation_pipeline import SkillValidator as PipelineValidator
+
+SKILLS_REF = Path(__file__).parent.parent / "src" / "config" / "skills_reference_2025.json"
+
+DESCRIPTIONS = [
+    "Senior Data Engineer with Python, SQL, Apache Spark and AWS Glue experience.",
+    "Skills: .NET, C#, C++, R and Python, Vue.js, scikit-learn, 5G technology",
+    "Kubernetes and PoſtgreSQL and İnformatica on Azure Blob Storage",
+    "",
+]
+
+
+def _no_lookarounds(pattern: str) -> re.Pattern[str]:
+    if "(?=" in pattern or "(?!" in pattern or "(?<" in pattern:
+        raise ValueError(f"unsupported: {pattern}")
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def test_default_backend_matches_registry_search() -> None:
+    registry = get_skill_registry(SKILLS_REF)
+    matcher = SkillMatcher(registry)
+    assert matcher.backend.name == "re" and matcher.fallbacks == ()
+    for text in DESCRIPTIONS:
+        expected = [skill.name for skill in registry.skills if any(regex.search(text) for regex in skill.regexes)]
+        assert matcher.match(text) == expected
+    assert "re" == available_backends()[0]
+
+
+def test_rejected_patterns_fall_back_to_re(tmp_path: Path) -> None:
+    ref = tmp_path / "skills.json"
+    ref.write_text(json.dumps({"skills": [
+        {"name": "Go", "patterns": [r"\bgo(?!\w)"]},
+        {"name": "SQL", "patterns": [r"\bsql\b"]},
+    ]}), encoding="utf-8")
+    registry = get_skill_registry(ref)
+
+    matcher = SkillMatcher(registry, RegexBackend("strict", _no_lookarounds, (ValueError,)))
+    assert matcher.fallbacks == (r"\bgo(?!\w)",)
+    assert matcher.match("GO and sql") == ["Go", "SQL"]
+    assert matcher.match("golang") == []
+
+
+def test_validators_match_through_the_chosen_backend(tmp_path: Path) -> None:
+    registry = get_skill_registry(SKILLS_REF)
+    assert skill_matcher(registry) is skill_matcher(registry, "re")
+
+    default = SkillValidator(str(SKILLS_REF))
+    pipeline = PipelineValidator(str(tmp_path / "jobs.db"), str(SKILLS_REF))
+    for name in available_backends():
+        validator = SkillValidator(str(SKILLS_REF), regex_backend=name)
+        assert validator.skill_regexes is skill_matcher(registry, name).regexes_by_skill
+        on_backend = PipelineValidator(str(tmp_path / "jobs.db"), str(SKILLS_REF), regex_backend=name)
+        for text in DESCRIPTIONS:
+            assert validator.validate_and_extract(text) == default.validate_and_extract(text)
+            assert on_backend.validate_job(text, "Python, SQL") == pipeline.validate_job(text, "Python, SQL")
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        get_regex_backend("hyperscan")
+    with pytest.raises(ValueError):
+        SkillValidator(str(SKILLS_REF), regex_backend="hyperscan")
@@ -0,0 +1,68 @@
+"""Tests for stratified sampled validation
+Run with: python -m pytest tests/test_sampled_validation.py
+"""
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.validation.stratified_sampling import StratumSample, allocate, load_strata, ratio_estimate
+from src.validation.validation_pipeline import SkillValidator as PipelineValidator
+from tests.conftest import JOB_DESCRIPTIONS, SKILLS_REF, JobsDbFactory
+
+DESCRIPTIONS = [*JOB_DESCRIPTIONS, "Data analyst: Excel, Tableau and SQL reporting for the business"]
+SCRAPED = ["Python", "Excel", "Not A Skill", "Kubernetes", "SQL", "Tableau", "React", "Docker", "AWS Glue"]
+STRATA_COLUMNS = ("platform TEXT", "input_role TEXT", "scraped_at DATETIME")
+
+
+def _make_db(make_jobs_db: JobsDbFactory, count: int) -> Path:
+    rng = random.Random(24)
+    rows: list[tuple[str, ...]] = []
+    for i in range(count):
+        platform, role = rng.choice(["linkedin", "naukri"]), rng.choice(["data_engineer", "data_analyst"])
+        description, skills = rng.choice(DESCRIPTIONS), ", ".join(rng.sample(SCRAPED, rng.randint(1, 5)))
+        rows.append((f"job-{i:04d}", description, skills, platform, role, f"2025-12-0{rng.randint(1, 3)} 10:00:00"))
+    return make_jobs_db(rows, STRATA_COLUMNS)
+
+
+def test_allocation_and_strata(make_jobs_db: JobsDbFactory) -> None:
+    assert allocate([50, 30, 20], 10) == [5, 3, 2]
+    assert allocate([5, 3, 2], 50) == [5, 3, 2]
+    assert sum(allocate([7, 7, 1], 4)) == 4 and allocate([0, 0], 5) == [0, 0]
+
+    db_path = _make_db(make_jobs_db, 200)
+    with sqlite3.connect(db_path) as conn:
+        strata = load_strata(conn, seed=1)
+        assert len(strata) == 12 and sum(len(s.job_ids) for s in strata) == 200
+        assert [s.job_ids for s in load_strata(conn, seed=1)] == [s.job_ids for s in strata]
+
+
+def test_ratio_estimate_of_a_census_is_exact() -> None:
+    samples = [StratumSample(3, [1, 0, 2], [2, 1, 2]), StratumSample(2, [1, 1], [1, 3])]
+    estimate = ratio_estimate(samples, z=1.96)
+    assert estimate.estimate == pytest.approx(5 / 9) and estimate.half_width == 0.0
+    assert ratio_estimate([StratumSample(4, [0], [0])], z=1.96).estimate == 1.0
+
+
+def test_sample_estimates_match_full_validation(make_jobs_db: JobsDbFactory) -> None:
+    db_path = _make_db(make_jobs_db, 600)
+    pipeline = PipelineValidator(str(db_path), SKILLS_REF)
+    full = pipeline.validate_batch(limit=600)
+
+    # A zero margin ends in a census, which reproduces the full pass
+    census = pipeline.validate_sample(margin_of_error=0.0, initial_size=100, seed=3)
+    assert (census["jobs_validated"], census["jobs_skipped"], census["population"]) == (600, 0, 600)
+    for key in ("precision", "recall", "f1_score"):
+        assert census[key] == pytest.approx(full[key])
+    for key in ("total_true_positives", "total_false_positives", "total_false_negatives"):
+        assert census[key] == full[key]
+    assert dict(census["top_false_positives"]) == dict(full["top_false_positives"])
+    assert census["margin_of_error"] == pytest.approx(0.0, abs=1e-9)
+
+    sample = pipeline.validate_sample(margin_of_error=0.05, initial_size=50, seed=3)
+    assert 50 <= sample["jobs_validated"] < 600 and sample["margin_of_error"] <= 0.05
+    assert sample["strata"] == 12 and sample["confidence"] == 0.95
+    for key, ci in (("precision", "precision_ci"), ("recall", "recall_ci"), ("f1_score", "f1_ci")):
+        low, high = sample[ci]
+        assert low <= sample[key] <= high and low <= full[key] <= high
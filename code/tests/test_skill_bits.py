@@ -0,0 +1,79 @@
+"""Tests for bitmask skill sets and the FP/FN arithmetic built on them
+Run with: python -m pytest tests/test_skill_bits.py
+"""
+import random
+from typing import cast
+
+from src.analysis.skill_extraction.pattern_registry import get_skill_registry
+from src.analysis.skill_extraction.skill_bits import SkillBits
+from src.analysis.skill_extraction.skill_validator import SkillValidator
+from src.validation.single_job_validator import SingleJobValidator
+from src.validation.validation_pipeline import SkillValidator as PipelineValidator
+from tests.conftest import JOB_DESCRIPTIONS, SKILLS_REF, JobsDbFactory
+
+DESCRIPTIONS = [*JOB_DESCRIPTIONS, ""]
+EXTRA = ["python", "Excel", "Not A Skill", "Kubernetes", "SQL", "Tableau", "React"]
+
+
+def _scraped(rng: random.Random) -> str:
+    return ", ".join(rng.sample(EXTRA, rng.randint(0, len(EXTRA))))
+
+
+def test_encode_decode_and_columns() -> None:
+    bits = SkillBits(["Python", "SQL", "Python", "R"])
+    assert bits.names == ("Python", "SQL", "R")
+    mask = bits.parse(" Python, r ,SQL, Cobol ,")
+    assert bits.decode(mask.bits) == {"Python", "SQL"} and mask.unknown == {"r", "Cobol"}
+    assert bits.from_columns([2, 3]) == bits.bit("Python") | bits.bit("R")
+    assert bits.lower_bit("PYTHON") == bits.bit("Python") and bits.bit("Cobol") == 0
+
+    counts = [0] * len(bits)
+    bits.count(mask.bits, counts)
+    bits.count(bits.bit("SQL"), counts)
+    assert bits.counts_by_name(counts) == {"Python": 1, "SQL": 2}
+    assert SkillBits.for_registry(get_skill_registry(SKILLS_REF)) is SkillBits.for_registry(
+        get_skill_registry(SKILLS_REF)
+    )
+
+
+def test_validators_match_set_arithmetic(make_jobs_db: JobsDbFactory) -> None:
+    rng = random.Random(20)
+    validator = SkillValidator(SKILLS_REF)
+    single = SingleJobValidator(SKILLS_REF)
+    rows = []
+    for description in DESCRIPTIONS:
+        for _ in range(5):
+            scraped = _scraped(rng)
+            rows.append((description, scraped))
+
+            canonical = validator.validate_and_extract(description)
+            names = {s.strip() for s in scraped.split(",") if s.strip()}
+            accuracy = validator.calculate_accuracy(description, scraped)
+            assert set(cast(list[str], accuracy["true_positives"])) == canonical & names
+            assert set(cast(list[str], accuracy["false_positives"])) == names - canonical
+            assert set(cast(list[str], accuracy["false_negatives"])) == canonical - names
+
+            detected = single.detect_skills_in_text(description)
+            lower = {n.lower() for n in names}
+            result = single.validate_and_fix("job", description, scraped)
+            assert result.false_positives_removed == {
+                n for n in names if n.lower() in single.skill_names and single.skill_names[n.lower()] not in detected
+            }
+            assert result.false_negatives_added == {d for d in detected if d.lower() not in lower}
+
+    db_path = make_jobs_db([(f"job-{i}", d, s) for i, (d, s) in enumerate(rows)])
+    pipeline = PipelineValidator(str(db_path), SKILLS_REF)
+    batch = pipeline.validate_batch(limit=len(rows))
+
+    fp_counts: dict[str, int] = {}
+    totals = [0, 0, 0]
+    for description, scraped in rows:
+        result = pipeline.validate_job(description, scraped)
+        names = {s.strip() for s in scraped.split(",") if s.strip()}
+        detected = names - result["false_positives"] | result["false_negatives"]
+        assert result["true_positives"] == names & detected
+        for skill in result["false_positives"]:
+            fp_counts[skill] = fp_counts.get(skill, 0) + 1
+        totals = [t + len(result[k]) for t, k in zip(totals, ("true_positives", "false_positives", "false_negatives"))]
+    assert [batch["total_true_positives"], batch["total_false_positives"], batch["total_false_negatives"]] == totals
+    assert dict(batch["top_false_positives"]) == dict(sorted(fp_counts.items(), key=lambda kv: -kv[1])[:10])
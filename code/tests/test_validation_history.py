@@ -0,0 +1,52 @@
+"""Tests for the persisted validation run history
+Run with: python -m pytest tests/test_validation_history.py
+"""
+import sqlite3
+
+import pytest
+
+from src.validation.batch_validation import validate_jobs_table
+from src.validation.validation_history import recent_runs, skill_history
+from src.validation.validation_pipeline import SkillValidator as PipelineValidator
+from tests.conftest import JOB_DESCRIPTIONS, SKILLS_REF, JobsDbFactory
+
+
+def test_runs_and_skill_counts_are_recorded(make_jobs_db: JobsDbFactory) -> None:
+    db_path = make_jobs_db(
+        (f"job-{i:03d}", JOB_DESCRIPTIONS[i % len(JOB_DESCRIPTIONS)], "Python, Excel, Not A Skill") for i in range(30)
+    )
+    pipeline = PipelineValidator(str(db_path), SKILLS_REF)
+
+    batch = pipeline.validate_batch(limit=30)
+    pipeline.validate_batch(limit=30, record=False)
+    fix = validate_jobs_table(str(db_path), SKILLS_REF, workers=1)
+    validate_jobs_table(str(db_path), SKILLS_REF, workers=1, dry_run=True)
+    assert fix["error"] is None
+
+    with sqlite3.connect(db_path) as conn:
+        runs = recent_runs(conn)
+        assert [run["kind"] for run in runs] == ["batch_fix", "batch"]
+        assert recent_runs(conn, kind="batch")[0]["run_id"] == runs[1]["run_id"]
+
+        latest, first = runs
+        assert (first["jobs_validated"], first["false_positives"], first["false_negatives"]) == (
+            30, batch["total_false_positives"], batch["total_false_negatives"]
+        )
+        assert first["f1_score"] == pytest.approx(batch["f1_score"])
+        assert first["details"] == {"limit": 30, "incremental": False}
+        assert (latest["jobs_validated"], latest["false_positives"], latest["false_negatives"]) == (
+            fix["processed"], fix["fpRemoved"], fix["fnAdded"]
+        )
+
+        # Per-skill rows add up to the run totals
+        for run in runs:
+            totals = conn.execute(
+                "SELECT SUM(true_positives), SUM(false_positives), SUM(false_negatives) "
+                "FROM validation_run_skills WHERE run_id = ?", (run["run_id"],)
+            ).fetchone()
+            assert totals == (run["true_positives"], run["false_positives"], run["false_negatives"])
+
+        unknown = skill_history(conn, "Not A Skill")
+        assert [(row.kind, row.false_positives) for row in unknown] == [("batch", 30), ("batch_fix", 30)]
+        assert skill_history(conn, "Not A Skill", kind="batch_fix") == unknown[1:]
+        assert skill_history(conn, "Python")[0].true_positives == 10
@@ -0,0 +1,101 @@
+"""Tests for incremental validation bookkeeping
+Run with: python -m pytest tests/test_validation_state.py
+"""
+import shutil
+import sqlite3
+from pathlib import Path
+
+from src.validation.batch_validation import validate_jobs_table
+from src.validation.validation_pipeline import SkillValidator as PipelineValidator
+from src.validation.validation_state import ValidationState, skills_hash
+from tests.conftest import JOB_DESCRIPTIONS, SKILLS_REF, JobsDbFactory
+
+
+def _rows(count: int) -> list[tuple[str, str | None, str | None]]:
+    return [
+        (
+            f"job-{i:03d}",
+            JOB_DESCRIPTIONS[i % len(JOB_DESCRIPTIONS)] if i % 4 else None,
+            "Python, Excel" if i % 3 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def test_stale_jobs(make_jobs_db: JobsDbFactory) -> None:
+    db_path = make_jobs_db(_rows(12))
+    conn = sqlite3.connect(db_path)
+    state = ValidationState(conn, "test", "ref-1")
+    assert state.count_stale() == 9 and state.count_stale(require_skills=True) == 6
+    assert [row.job_id for row in state.iter_stale(page_size=2, limit=3)] == ["job-001", "job-002", "job-003"]
+
+    for row in state.iter_stale(page_size=2):
+        state.mark(row.job_id, row.skills)
+    state.flush()
+    conn.commit()
+    assert state.count_stale() == 0 and list(state.iter_stale()) == []
+    assert ValidationState(conn, "other", "ref-1").count_stale() == 9
+    assert ValidationState(conn, "test", "ref-2").count_stale() == 9
+
+    conn.execute("UPDATE jobs SET skills = 'SQL' WHERE job_id = 'job-001'")
+    conn.execute("UPDATE jobs SET skills = NULL WHERE job_id = 'job-002'")
+    conn.execute("INSERT INTO jobs VALUES ('job-100', ?, NULL)", (JOB_DESCRIPTIONS[0],))
+    assert [row.job_id for row in state.iter_stale()] == ["job-001", "job-002", "job-100"]
+    assert skills_hash(None) == skills_hash("") != skills_hash("SQL")
+    conn.close()
+
+
+def test_batch_fix_only_revisits_changed_jobs(tmp_path: Path, make_jobs_db: JobsDbFactory) -> None:
+    db_path = make_jobs_db(_rows(30))
+
+    first = validate_jobs_table(str(db_path), SKILLS_REF, workers=1)
+    assert first["error"] is None and first["skipped"] == 0 and first["processed"] == first["total"] > 0
+
+    progress: list[tuple[int, ...]] = []
+
+    def on_progress(*args: int) -> None:
+        progress.append(args)
+
+    second = validate_jobs_table(str(db_path), SKILLS_REF, on_progress, workers=1)
+    assert (second["processed"], second["total"], second["skipped"]) == (0, 0, first["total"])
+    assert progress == [(0, 0, 0, 0, 0)]
+
+    # A re-scraped job and a new one
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE jobs SET skills = 'Not A Skill' WHERE job_id = 'job-001'")
+        conn.execute("INSERT INTO jobs VALUES ('job-100', ?, 'Python')", (JOB_DESCRIPTIONS[1],))
+    third = validate_jobs_table(str(db_path), SKILLS_REF, workers=1)
+    assert (third["processed"], third["skipped"]) == (2, first["total"] - 1)
+    assert third["updated"] == 2 and dict(third["topFps"]) == {"Not A Skill": 1, "Python": 1}
+
+    # A dry run records nothing; a full run revisits everything and still records
+    assert validate_jobs_table(str(db_path), SKILLS_REF, workers=1, dry_run=True)["processed"] == 0
+    full = validate_jobs_table(str(db_path), SKILLS_REF, workers=1, incremental=False)
+    assert full["processed"] == first["total"] + 1
+    assert validate_jobs_table(str(db_path), SKILLS_REF, workers=1)["processed"] == 0
+
+    # Another reference revisits everything
+    other_ref = tmp_path / "skills_reference.json"
+    shutil.copy(SKILLS_REF, other_ref)
+    with open(other_ref, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert validate_jobs_table(str(db_path), str(other_ref), workers=1)["processed"] == first["total"] + 1
+
+
+def test_pipeline_incremental_batches(make_jobs_db: JobsDbFactory) -> None:
+    db_path = make_jobs_db(_rows(30))
+    pipeline = PipelineValidator(str(db_path), SKILLS_REF)
+
+    full = pipeline.validate_batch(limit=100)
+    first = pipeline.validate_batch(limit=100, incremental=True)
+    assert {k: v for k, v in first.items() if k != "jobs_skipped"} == {k: v for k, v in full.items() if k != "jobs_skipped"}
+    assert first["jobs_skipped"] == 0 and first["jobs_validated"] == 15
+
+    second = pipeline.validate_batch(limit=100, incremental=True)
+    assert (second["jobs_validated"], second["jobs_skipped"], second["total_true_positives"]) == (0, 15, 0)
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE jobs SET skills = 'SQL' WHERE job_id = 'job-001'")
+    third = pipeline.validate_batch(limit=100, incremental=True)
+    assert (third["jobs_validated"], third["jobs_skipped"]) == (1, 14)
+    assert pipeline.validate_batch(limit=100)["jobs_validated"] == 15